@@ -0,0 +1,209 @@
+"""Benchmark the portal pages at growing data volumes.
+
+Every page is rendered headlessly with Streamlit's AppTest at each data scale
+(a multiple of the default 300 orders, 150 customers and 500 leads). Each scale
+runs in its own process so data caches and memory peaks don't carry over.
+For every page the report records the wall time, the section timings the app
+collects (``startup``, ``sidebar``, the page itself and its open tab or the
+dashboard sections) and the peak memory of a second run under tracemalloc.
+Only the open tab of a page runs: the first, unless ``--tab page=label``
+picks another.
+
+The first run of each scale is reported separately as ``startup``: it is the
+cold start of a fresh process. Its ``process_time`` runs from the process
+starting to that first page being drawn, including the imports of Streamlit
+and the app, and its sections add the app's ``cold_start``, ``first_paint``
+(until the sidebar starts drawing) and ``import/<page>`` timings. A page's
+``import/<page>`` section also shows in the first run that opens it.
+
+``navigation`` times a click on each page's sidebar button from the first
+page, which is the latency of switching pages.
+
+    python benchmark.py --scales 1 10 100 --output report.json
+    python benchmark.py --baseline report.json --tolerance 0.25
+
+The run exits non-zero when the cold start, a page or a page switch raised.
+With ``--baseline`` it is also compared against an earlier report and fails
+when a page's wall time or peak memory regressed by more than the tolerance.
+"""
+
+import time
+
+# Start of this process, for the cold start of the first run
+PROCESS_START = time.perf_counter()
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'manufacturing_portal.py')
+PAGES = ['dashboard', 'production', 'inventory', 'sales', 'customers', 'finance', 'marketing', 'ai', 'settings']
+SCALES = [1, 10, 100, 1000]
+
+# Differences below these are noise, whatever the relative change
+MIN_TIME_DELTA = 0.05
+MIN_MEMORY_DELTA = 4 * 2 ** 20
+
+def run_app(page, timeout, tab=None):
+    """Render one page in a fresh session"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP, default_timeout=timeout)
+    app.session_state['current_page'] = page
+    if tab:
+        app.session_state[f'{page}_tab'] = tab
+    app.run()
+    return app
+
+def run_page(page, timeout, trace_memory=True, tab=None):
+    """Measure one page: timings from a plain run, peak memory from a traced one"""
+    start = time.perf_counter()
+    app = run_app(page, timeout, tab)
+    wall_time = time.perf_counter() - start
+    timings = app.session_state['section_timings'] if 'section_timings' in app.session_state else {}
+    result = {
+        'wall_time': round(wall_time, 4),
+        'peak_memory': None,
+        'sections': {name: round(seconds, 4) for name, seconds in sorted(timings.items())},
+        'exceptions': [str(exception.value) for exception in app.exception],
+    }
+    if trace_memory:
+        # tracemalloc slows everything down several times, so it gets a run of its own
+        tracemalloc.start()
+        try:
+            traced = run_app(page, timeout, tab)
+            result['peak_memory'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        result['exceptions'] += [str(exception.value) for exception in traced.exception
+                                 if str(exception.value) not in result['exceptions']]
+    return result
+
+def run_navigation(page, timeout, start_page):
+    """Time switching to a page with its sidebar button, from a session showing another page"""
+    app = run_app(start_page, timeout)
+    start = time.perf_counter()
+    app.button(key=f'nav_{page}').click().run()
+    wall_time = time.perf_counter() - start
+    return {
+        'wall_time': round(wall_time, 4),
+        'page': app.session_state['current_page'],
+        'exceptions': [str(exception.value) for exception in app.exception],
+    }
+
+def bench_scale(scale, pages, seed, timeout, trace_memory=True, tabs=None):
+    """Benchmark the pages at one data scale, in the current process"""
+    os.environ['PORTAL_DATA_SCALE'] = str(scale)
+    os.environ['PORTAL_DATA_SEED'] = str(seed)
+    os.environ['PORTAL_JOURNAL'] = ''
+    os.environ.pop('PORTAL_DATABASE', None)
+    os.environ.pop('PORTAL_SNAPSHOT', None)
+
+    # The first run builds the shared datasets; pages are then measured warm
+    startup = run_page(pages[0], timeout, trace_memory=False)
+    startup['process_time'] = round(time.perf_counter() - PROCESS_START, 4)
+    results = {'scale': scale, 'startup': startup, 'pages': {}}
+    for page in pages:
+        results['pages'][page] = run_page(page, timeout, trace_memory, (tabs or {}).get(page))
+    results['navigation'] = {page: run_navigation(page, timeout, pages[0]) for page in pages[1:]}
+    results['max_rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return results
+
+def bench_scale_in_subprocess(scale, args):
+    """Run bench_scale for one scale in a child process and read its JSON result"""
+    command = [sys.executable, __file__, '--worker', '--scales', str(scale), '--seed', str(args.seed),
+               '--timeout', str(args.timeout), '--pages'] + args.pages
+    for tab in args.tab:
+        command += ['--tab', tab]
+    if args.no_memory:
+        command.append('--no-memory')
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def compare(report, baseline, tolerance):
+    """List the pages whose wall time or peak memory regressed against a baseline
+
+    The cold start is compared as the ``startup`` page.
+    """
+    regressions = []
+    previous = {(str(run['scale']), page): result
+                for run in baseline['runs'] for page, result in dict(run['pages'], startup=run['startup']).items()}
+    for run in report['runs']:
+        for page, result in dict(run['pages'], startup=run['startup']).items():
+            before = previous.get((str(run['scale']), page))
+            if before is None:
+                continue
+            for metric, min_delta in (('wall_time', MIN_TIME_DELTA), ('process_time', MIN_TIME_DELTA),
+                                      ('peak_memory', MIN_MEMORY_DELTA)):
+                old, new = before.get(metric), result.get(metric)
+                if old is None or new is None:
+                    continue
+                if new - old > max(old * tolerance, min_delta):
+                    regressions.append(f"{page} at {run['scale']}x: {metric} {old} -> {new}")
+    return regressions
+
+def failures(report):
+    """List the runs that raised: the cold start, any page and any page switch"""
+    failed = []
+    for run in report['runs']:
+        results = [('startup', run['startup'])] + list(run['pages'].items())
+        results += [(f'navigation to {page}', result) for page, result in run['navigation'].items()]
+        failed += [f"{name} at {run['scale']}x raised: {result['exceptions'][0]}"
+                   for name, result in results if result['exceptions']]
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=float, nargs='+', default=SCALES)
+    parser.add_argument('--pages', nargs='+', default=PAGES, choices=PAGES)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float, default=600)
+    parser.add_argument('--tab', action='append', default=[], metavar='PAGE=LABEL',
+                        help="open this tab of a page instead of its first one")
+    parser.add_argument('--no-memory', action='store_true', help="skip the traced runs that measure peak memory")
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    parser.add_argument('--baseline', help="earlier report to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    scales = [int(scale) if scale == int(scale) else scale for scale in args.scales]
+    tabs = dict(tab.split('=', 1) for tab in args.tab)
+
+    if args.worker:
+        print(json.dumps(bench_scale(scales[0], args.pages, args.seed, args.timeout, not args.no_memory, tabs)))
+        return 0
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'tabs': tabs,
+        'runs': [],
+    }
+    for scale in scales:
+        print(f"Benchmarking {len(args.pages)} pages at {scale}x...", file=sys.stderr)
+        report['runs'].append(bench_scale_in_subprocess(scale, args))
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            handle.write(output + '\n')
+    else:
+        print(output)
+
+    failed = failures(report)
+    if args.baseline:
+        with open(args.baseline) as handle:
+            failed += compare(report, json.load(handle), args.tolerance)
+    for message in failed:
+        print(message, file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,1723 @@
+"""Data layer of the manufacturing portal.
+
+Storage backends (in memory, SQLite or memory-mapped Arrow snapshots), the
+write journal, materialized aggregates and live models, the generated
+datasets of ManufacturingPortal and the per-session PortalSession handle.
+Nothing here depends on Streamlit.
+"""
+
+import pandas as pd
+import numpy as np
+import datetime
+import json
+import time
+from datetime import date, timedelta
+import string
+import os
+import queue
+import itertools
+import sqlite3
+import threading
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # only needed for on-disk snapshots
+    pa = None
+
+from forecasting import ForecastService
+from planning import DemandProfile, StockLedger
+
+# ============================================
+# STORAGE BACKENDS
+# ============================================
+
+# Query filters are dicts of column -> condition: a scalar matches equal
+# values, a list matches any of its values and a slice is a half-open range
+# (slice(start, stop) means start <= value < stop; either end may be None).
+
+AGGREGATIONS = ('sum', 'mean', 'min', 'max', 'count')
+
+def _filter_mask(frame, where):
+    """Boolean mask of the rows of a DataFrame that satisfy a query filter"""
+    mask = np.ones(len(frame), dtype=bool)
+    for column, condition in (where or {}).items():
+        values = frame[column]
+        if isinstance(condition, slice):
+            if condition.start is not None:
+                mask &= (values >= condition.start).to_numpy()
+            if condition.stop is not None:
+                mask &= (values < condition.stop).to_numpy()
+        elif isinstance(condition, (list, tuple, set)):
+            mask &= values.isin(list(condition)).to_numpy()
+        else:
+            mask &= (values == condition).to_numpy()
+    return mask
+
+def aggregate_frame(frame, how='count', column=None, by=None, where=None):
+    """Aggregate a DataFrame column, optionally per group, the way a backend query would"""
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation '{how}'")
+    frame = frame[_filter_mask(frame, where)] if where else frame
+    if by is None:
+        if how == 'count':
+            return len(frame) if column is None else int(frame[column].count())
+        return getattr(frame[column], how)()
+    groups = frame.groupby(by, observed=True)
+    if how == 'count' and column is None:
+        return groups.size()
+    return getattr(groups[column], how)()
+
+class HashIndex:
+    """Row positions for each value of a column, for equality and IN lookups"""
+    
+    def __init__(self, values):
+        self._positions = pd.Series(values).groupby(values, observed=True, sort=False).indices
+    
+    def lookup(self, condition):
+        """Positions of the rows matching a query condition, or None if it is a range"""
+        if isinstance(condition, slice):
+            return None
+        if isinstance(condition, (list, tuple, set)):
+            found = [self._positions[value] for value in condition if value in self._positions]
+            return np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.intp)
+        return self._positions.get(condition, np.empty(0, dtype=np.intp))
+    
+    def extend(self, values, start):
+        """Index rows appended at positions start, start + 1, ..."""
+        positions = np.arange(start, start + len(values))
+        for value, offsets in pd.Series(values).groupby(values, observed=True, sort=False).indices.items():
+            existing = self._positions.get(value)
+            added = positions[offsets]
+            self._positions[value] = added if existing is None else np.concatenate([existing, added])
+    
+    def move(self, positions, old_values, new_value):
+        """Re-index rows whose column value changed to new_value"""
+        for position, old_value in zip(positions, old_values):
+            if old_value in self._positions:
+                existing = self._positions[old_value]
+                self._positions[old_value] = existing[existing != position]
+        existing = self._positions.get(new_value, np.empty(0, dtype=np.intp))
+        self._positions[new_value] = np.union1d(existing, positions)
+
+class SortedIndex:
+    """Row positions ordered by a column's values, for range lookups by binary search.
+    
+    Appended rows collect in a small delta buffer that is merged into the
+    sorted arrays on the next lookup.
+    """
+    
+    def __init__(self, values):
+        values = np.asarray(values)
+        self._order = np.argsort(values, kind='stable')
+        self._keys = values[self._order]
+        self._delta = []
+    
+    def _key(self, value):
+        if self._keys.dtype.kind == 'M':
+            return np.datetime64(pd.Timestamp(value), 'ns').astype(self._keys.dtype)
+        return value
+    
+    def _merge(self):
+        if not self._delta:
+            return
+        positions = np.concatenate([positions for positions, _ in self._delta])
+        keys = np.concatenate([keys for _, keys in self._delta])
+        self._delta = []
+        order = np.argsort(keys, kind='stable')
+        keys, positions = keys[order], positions[order]
+        slots = np.searchsorted(self._keys, keys, side='right')
+        self._keys = np.insert(self._keys, slots, keys)
+        self._order = np.insert(self._order, slots, positions)
+    
+    def lookup(self, condition):
+        """Positions of the rows matching a query condition, or None if it is a value list"""
+        if isinstance(condition, (list, tuple, set)):
+            return None
+        self._merge()
+        if isinstance(condition, slice):
+            low = 0 if condition.start is None else np.searchsorted(self._keys, self._key(condition.start), side='left')
+            high = len(self._keys) if condition.stop is None else np.searchsorted(self._keys, self._key(condition.stop), side='left')
+        else:
+            key = self._key(condition)
+            low = np.searchsorted(self._keys, key, side='left')
+            high = np.searchsorted(self._keys, key, side='right')
+        return np.sort(self._order[low:high])
+    
+    def ordered(self):
+        """All row positions in ascending order of the column"""
+        self._merge()
+        return self._order
+    
+    def extend(self, values, start):
+        """Index rows appended at positions start, start + 1, ..."""
+        values = np.asarray(values)
+        self._delta.append((np.arange(start, start + len(values)), values))
+
+class MemoryBackend:
+    """Keeps every table as an in-memory DataFrame (the default backend).
+    
+    Filters on indexed columns are answered from indexes built on first use
+    and maintained as rows are appended or updated: a hash index for key and
+    status columns, a sorted index for date columns.
+    """
+    
+    persistent = False
+    HASH_INDEXED_COLUMNS = ('order_id', 'customer_id', 'status', 'item_id', 'lead_id', 'invoice_id',
+                            'work_order_id', 'ticket_id', 'po_id')
+    SORTED_INDEXED_COLUMNS = ('order_date', 'delivery_date', 'created_date', 'next_followup', 'date', 'due_date')
+    
+    def __init__(self):
+        self._tables = {}
+        # Appended rows are concatenated into the table on its next read,
+        # so a burst of inserts costs one concat rather than one each.
+        self._pending = {}
+        self._indexes = {}
+        self._lock = threading.RLock()
+    
+    def _frame(self, name):
+        with self._lock:
+            pending = self._pending.pop(name, None)
+            if pending:
+                frame = self._tables[name]
+                rows = pd.concat(pending, ignore_index=True)
+                for column, index in self._indexes.get(name, {}).items():
+                    index.extend(rows[column].to_numpy(), len(frame))
+                self._tables[name] = pd.concat([frame, rows], ignore_index=True)
+            return self._tables[name]
+    
+    def _index(self, name, frame, column):
+        indexes = self._indexes.setdefault(name, {})
+        if column not in indexes:
+            if column in self.HASH_INDEXED_COLUMNS:
+                indexes[column] = HashIndex(frame[column].to_numpy())
+            elif column in self.SORTED_INDEXED_COLUMNS:
+                indexes[column] = SortedIndex(frame[column].to_numpy())
+            else:
+                return None
+        return indexes[column]
+    
+    def _positions(self, name, frame, where):
+        """Sorted positions of the rows matching a filter, using indexes where possible"""
+        positions, rest = None, {}
+        for column, condition in where.items():
+            index = self._index(name, frame, column)
+            found = index.lookup(condition) if index is not None else None
+            if found is None:
+                rest[column] = condition
+            elif positions is None:
+                positions = found
+            else:
+                positions = np.intersect1d(positions, found, assume_unique=True)
+        if positions is None:
+            return np.flatnonzero(_filter_mask(frame, rest))
+        if rest:
+            positions = positions[_filter_mask(frame.iloc[positions], rest)]
+        return positions
+    
+    def _matching(self, name, where):
+        frame = self._frame(name)
+        if not where:
+            return frame
+        return frame.iloc[self._positions(name, frame, where)]
+    
+    def has_table(self, name):
+        return name in self._tables
+    
+    def save(self, name, frame):
+        with self._lock:
+            self._pending.pop(name, None)
+            self._indexes.pop(name, None)
+            self._tables[name] = frame
+    
+    def append(self, name, rows):
+        with self._lock:
+            self._pending.setdefault(name, []).append(rows)
+    
+    def update(self, name, where, values):
+        with self._lock:
+            frame = self._frame(name)
+            positions = self._positions(name, frame, where)
+            frame = frame.copy()
+            for column, value in values.items():
+                index = self._indexes.get(name, {}).get(column)
+                if isinstance(index, HashIndex):
+                    index.move(positions, frame[column].to_numpy()[positions], value)
+                elif index is not None:
+                    del self._indexes[name][column]
+                frame.iloc[positions, frame.columns.get_loc(column)] = value
+            self._tables[name] = frame
+            return len(positions)
+    
+    def load(self, name):
+        return self._frame(name)
+    
+    def select(self, name, where=None, columns=None, order_by=None, descending=False, limit=None):
+        # Filtering, sorting and limiting work on row positions, so only the
+        # rows that are returned get materialized, in a single take.
+        frame = self._frame(name)
+        positions = self._positions(name, frame, where) if where else None
+        if order_by is not None:
+            index = self._index(name, frame, order_by) if positions is None else None
+            if isinstance(index, SortedIndex):
+                positions = index.ordered()
+            else:
+                keys = frame[order_by].to_numpy()
+                order = np.argsort(keys if positions is None else keys[positions], kind='stable')
+                positions = order if positions is None else positions[order]
+            if descending:
+                positions = positions[::-1]
+        if limit is not None:
+            positions = (positions if positions is not None else np.arange(len(frame)))[:limit]
+        if positions is None:
+            return frame if columns is None else frame[list(columns)]
+        if columns is None:
+            return frame.iloc[positions]
+        return frame.iloc[positions, frame.columns.get_indexer(list(columns))]
+    
+    def aggregate(self, name, how='count', column=None, by=None, where=None):
+        return aggregate_frame(self._matching(name, where), how, column, by)
+    
+    def checkpoint(self):
+        """Persist pending changes (nothing to do for memory-only tables)"""
+
+class SnapshotBackend(MemoryBackend):
+    """In-memory tables backed by a directory of Arrow IPC files.
+    
+    Every table is one uncompressed Arrow file that is memory-mapped when the
+    table is first used. Numeric, date and categorical columns are used in
+    place and strings stay Arrow-backed, so a new process opens the tables
+    without decoding or copying them, and processes on one host share the
+    pages through the OS cache. Writes go to the in-memory table until
+    checkpoint() writes the changed tables back to the snapshot.
+    """
+    
+    persistent = True
+    
+    def __init__(self, directory):
+        if pa is None:
+            raise RuntimeError("Arrow snapshots need the pyarrow package")
+        super().__init__()
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._dirty = set()
+    
+    def _path(self, name):
+        return os.path.join(self.directory, f'{name}.arrow')
+    
+    def _frame(self, name):
+        if name not in self._tables:
+            with self._lock:
+                if name not in self._tables:
+                    self._tables[name] = self._open(name)
+        return super()._frame(name)
+    
+    def _open(self, name):
+        table = pa.ipc.open_file(pa.memory_map(self._path(name))).read_all()
+        frame = table.to_pandas(split_blocks=True)
+        for field in table.schema:
+            if pa.types.is_list(field.type) or pa.types.is_large_list(field.type):
+                frame[field.name] = frame[field.name].map(list)
+        return frame
+    
+    def _write(self, name, frame):
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        # Write aside and rename, so readers never map a half-written file
+        temporary = self._path(name) + '.tmp'
+        with pa.OSFile(temporary, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(temporary, self._path(name))
+    
+    def has_table(self, name):
+        return name in self._tables or os.path.exists(self._path(name))
+    
+    def save(self, name, frame):
+        self._write(name, frame)
+        super().save(name, frame)
+        self._dirty.discard(name)
+    
+    def append(self, name, rows):
+        super().append(name, rows)
+        self._dirty.add(name)
+    
+    def update(self, name, where, values):
+        self._dirty.add(name)
+        return super().update(name, where, values)
+    
+    def checkpoint(self):
+        with self._lock:
+            for name in sorted(self._dirty):
+                self._write(name, self._frame(name))
+            self._dirty.clear()
+
+class SQLiteBackend:
+    """Keeps the portal tables in an SQLite database file.
+    
+    Filters, sorting, limits and aggregations run inside SQLite on indexed
+    columns, so pages that query through the portal only pull the rows they
+    show. Dates are stored as ISO-8601 text (which sorts chronologically) and
+    list-valued columns as JSON.
+    """
+    
+    persistent = True
+    
+    # Columns that get a B-tree index whenever a table has them
+    INDEXED_COLUMNS = ('order_id', 'customer_id', 'status', 'order_date', 'delivery_date',
+                       'created_date', 'next_followup', 'date', 'due_date', 'item_id', 'lead_id',
+                       'work_order_id', 'ticket_id', 'po_id')
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+    
+    def __init__(self, path):
+        self.path = path
+        # One connection shared by all sessions; Streamlit runs each session
+        # in its own thread, so every use of it is serialized by the lock.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS portal_columns (table_name TEXT, column_name TEXT, kind TEXT)')
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _quote(identifier):
+        return '"' + identifier.replace('"', '""') + '"'
+    
+    def _column_kinds(self, name):
+        rows = self._conn.execute('SELECT column_name, kind FROM portal_columns WHERE table_name = ?', (name,))
+        return dict(rows.fetchall())
+    
+    def _param(self, value):
+        """Convert a filter value to the representation stored in the database"""
+        if isinstance(value, (pd.Timestamp, datetime.datetime, date, np.datetime64)):
+            return pd.Timestamp(value).strftime(self.DATE_FORMAT)
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+    
+    def _where_sql(self, where):
+        clauses, params = [], []
+        for column, condition in (where or {}).items():
+            quoted = self._quote(column)
+            if isinstance(condition, slice):
+                if condition.start is not None:
+                    clauses.append(f'{quoted} >= ?')
+                    params.append(self._param(condition.start))
+                if condition.stop is not None:
+                    clauses.append(f'{quoted} < ?')
+                    params.append(self._param(condition.stop))
+            elif isinstance(condition, (list, tuple, set)):
+                condition = list(condition)
+                if not condition:
+                    clauses.append('0')
+                    continue
+                clauses.append(f"{quoted} IN ({', '.join('?' * len(condition))})")
+                params.extend(self._param(value) for value in condition)
+            else:
+                clauses.append(f'{quoted} = ?')
+                params.append(self._param(condition))
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+    
+    def _encode(self, frame):
+        """Convert a DataFrame to SQLite-friendly columns and note how to decode them"""
+        encoded, kinds = {}, {}
+        for column in frame.columns:
+            values = frame[column]
+            if pd.api.types.is_datetime64_any_dtype(values):
+                encoded[column] = values.dt.strftime(self.DATE_FORMAT)
+                kinds[column] = 'datetime'
+            elif isinstance(values.dtype, pd.CategoricalDtype):
+                encoded[column] = values.astype(object)
+            elif values.dtype == object and len(values) and isinstance(values.iloc[0], (list, dict)):
+                encoded[column] = values.map(json.dumps)
+                kinds[column] = 'json'
+            else:
+                encoded[column] = values
+        return pd.DataFrame(encoded), kinds
+    
+    def _decode(self, frame, kinds):
+        for column, kind in kinds.items():
+            if column not in frame.columns:
+                continue
+            if kind == 'datetime':
+                frame[column] = pd.to_datetime(frame[column], format=self.DATE_FORMAT)
+            elif kind == 'json':
+                frame[column] = frame[column].map(json.loads)
+        return frame
+    
+    def has_table(self, name):
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()
+        return row is not None
+    
+    def save(self, name, frame):
+        encoded, kinds = self._encode(frame)
+        with self._lock, self._conn:
+            encoded.to_sql(name, self._conn, if_exists='replace', index=False, chunksize=50000)
+            self._conn.execute('DELETE FROM portal_columns WHERE table_name = ?', (name,))
+            self._conn.executemany('INSERT INTO portal_columns VALUES (?, ?, ?)',
+                                   [(name, column, kind) for column, kind in kinds.items()])
+            for column in self.INDEXED_COLUMNS:
+                if column in frame.columns:
+                    self._conn.execute(f'CREATE INDEX IF NOT EXISTS {self._quote(f"idx_{name}_{column}")} '
+                                       f'ON {self._quote(name)} ({self._quote(column)})')
+    
+    def append(self, name, rows):
+        encoded, _ = self._encode(rows)
+        with self._lock, self._conn:
+            encoded.to_sql(name, self._conn, if_exists='append', index=False)
+    
+    def update(self, name, where, values):
+        assignments = ', '.join(f'{self._quote(column)} = ?' for column in values)
+        clause, params = self._where_sql(where)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(f'UPDATE {self._quote(name)} SET {assignments}{clause}',
+                                        [self._param(value) for value in values.values()] + params)
+        return cursor.rowcount
+    
+    def load(self, name):
+        return self.select(name)
+    
+    def select(self, name, where=None, columns=None, order_by=None, descending=False, limit=None):
+        projection = ', '.join(self._quote(column) for column in columns) if columns is not None else '*'
+        sql = f'SELECT {projection} FROM {self._quote(name)}'
+        clause, params = self._where_sql(where)
+        sql += clause
+        if order_by is not None:
+            sql += f" ORDER BY {self._quote(order_by)} {'DESC' if descending else 'ASC'}"
+        if limit is not None:
+            sql += f' LIMIT {int(limit)}'
+        with self._lock:
+            frame = pd.read_sql_query(sql, self._conn, params=params)
+            kinds = self._column_kinds(name)
+        return self._decode(frame, kinds)
+    
+    def aggregate(self, name, how='count', column=None, by=None, where=None):
+        if how not in AGGREGATIONS:
+            raise ValueError(f"Unknown aggregation '{how}'")
+        function = 'AVG' if how == 'mean' else how.upper()
+        target = f'{function}({self._quote(column)})' if column is not None else 'COUNT(*)'
+        clause, params = self._where_sql(where)
+        if by is None:
+            with self._lock:
+                value = self._conn.execute(f'SELECT {target} FROM {self._quote(name)}{clause}', params).fetchone()[0]
+            return value if value is not None or how == 'count' else np.nan
+        quoted = self._quote(by)
+        sql = f'SELECT {quoted}, {target} FROM {self._quote(name)}{clause} GROUP BY {quoted} ORDER BY {quoted}'
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return pd.Series([value for _, value in rows], index=pd.Index([key for key, _ in rows], name=by),
+                         name=column)
+    
+    def checkpoint(self):
+        """Persist pending changes (every write is already committed to the database)"""
+
+def create_backend(database=None, snapshot=None):
+    """Storage backend for an SQLite database or a snapshot directory, else the in-memory backend"""
+    if database:
+        return SQLiteBackend(database)
+    if snapshot:
+        return SnapshotBackend(snapshot)
+    return MemoryBackend()
+
+# ============================================
+# WRITE JOURNAL
+# ============================================
+
+def _json_default(value):
+    """JSON encoding for the NumPy and pandas values found in table rows"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, datetime.datetime, date)):
+        return value.isoformat()
+    if value is pd.NaT:
+        return None
+    return str(value)
+
+class Journal:
+    """Append-only JSON-lines journal of portal writes, with group commit.
+    
+    append() queues a record and returns immediately. A background writer
+    thread takes everything queued since its last commit, writes it in one go
+    and makes it durable with a single fsync. Under load, the writes of many
+    sessions share one fsync, and a session only waits for durability when it
+    asks to (see commit()). rewrite() compacts the journal in the same queue,
+    so it lands between exactly the records queued before and after it.
+    """
+    
+    def __init__(self, path, commit_interval=0.002):
+        self.path = path
+        self.commit_interval = commit_interval
+        self._queue = queue.Queue()
+        self._file = open(path, 'a', encoding='utf-8')
+        self._size = self._file.tell()
+        self._writer = threading.Thread(target=self._write_batches, name='portal-journal', daemon=True)
+        self._writer.start()
+    
+    def records(self):
+        """Every complete record in the journal file, oldest first"""
+        with open(self.path, encoding='utf-8') as journal:
+            for line in journal:
+                if line.endswith('\n'):  # a torn last line was never acknowledged
+                    yield json.loads(line)
+    
+    def append(self, record):
+        """Queue a record; the returned Event is set once its batch was written (see wait())"""
+        durable = threading.Event()
+        durable.error = None
+        self._queue.put((record, durable))
+        return durable
+    
+    def wait(self, durable, timeout=5):
+        """Wait for an appended record to be on disk, raising the error that kept it off"""
+        if not durable.wait(timeout):
+            raise TimeoutError(f"Journal commit to {self.path} timed out")
+        if durable.error is not None:
+            raise durable.error
+    
+    def commit(self, record, timeout=5):
+        """Append a record and wait until it is durable"""
+        self.wait(self.append(record), timeout)
+    
+    def rewrite(self, records):
+        """Queue replacing the whole journal with `records`; returns an Event like append()"""
+        durable = threading.Event()
+        durable.error = None
+        # A list in place of a record marks a rewrite for the writer thread
+        self._queue.put((list(records), durable))
+        return durable
+    
+    def _write_batches(self):
+        while True:
+            batch = [self._queue.get()]
+            # Give writers that are about to commit a moment to join the batch
+            time.sleep(self.commit_interval)
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = []
+            for record, durable in batch:
+                if isinstance(record, list):
+                    self._write_records(records)
+                    self._replace_file(record, durable)
+                    records = []
+                else:
+                    records.append((record, durable))
+            self._write_records(records)
+    
+    def _write_records(self, batch):
+        if not batch:
+            return
+        error = None
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(''.join(json.dumps(record, default=_json_default) + '\n' for record, _ in batch))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._size = self._file.tell()
+        except OSError as failure:
+            # Only this batch fails: the file is cut back to the last
+            # durable batch and the next one starts on a fresh handle
+            error = failure
+            self._discard_file()
+        for _, durable in batch:
+            durable.error = error
+            durable.set()
+    
+    def _replace_file(self, records, durable):
+        # The new journal is written aside and swapped in whole, so a failed
+        # rewrite leaves the old one as it was
+        temporary = self.path + '.tmp'
+        try:
+            with open(temporary, 'w', encoding='utf-8') as journal:
+                journal.write(''.join(json.dumps(record, default=_json_default) + '\n' for record in records))
+                journal.flush()
+                os.fsync(journal.fileno())
+                size = journal.tell()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            os.replace(temporary, self.path)
+            self._size = size
+            self._file = open(self.path, 'a', encoding='utf-8')
+        except OSError as failure:
+            durable.error = failure
+            self._discard_file()
+        durable.set()
+    
+    def _discard_file(self):
+        try:
+            if self._file is not None:
+                self._file.close()
+        except OSError:
+            pass
+        self._file = None
+        try:
+            os.truncate(self.path, self._size)
+        except OSError:
+            pass
+
+# ============================================
+# MATERIALIZED AGGREGATES
+# ============================================
+
+class GroupTotals:
+    """Row count and value sum per group of a table, maintained incrementally.
+    
+    Groups are the values of `group_column`, or calendar months ('YYYY-MM')
+    of a date column when `monthly` is set. A full rebuild scans the table
+    once; afterwards each inserted row or status change costs O(1).
+    """
+    
+    def __init__(self, group_column, value_column, monthly=False):
+        self.group_column = group_column
+        self.value_column = value_column
+        self.monthly = monthly
+        self.counts = {}
+        self.sums = {}
+    
+    def group_of(self, value):
+        return pd.Timestamp(value).strftime('%Y-%m') if self.monthly else value
+    
+    def rebuild(self, frame):
+        """Recompute every group from a frame holding the group and value columns"""
+        groups = frame[self.group_column]
+        if self.monthly:
+            groups = groups.dt.strftime('%Y-%m')
+        totals = frame[self.value_column].groupby(groups, observed=True).agg(['size', 'sum'])
+        self.counts = {group: int(count) for group, count in totals['size'].items()}
+        self.sums = {group: total.item() if isinstance(total, np.generic) else total
+                     for group, total in totals['sum'].items()}
+    
+    def add(self, group_value, value, rows=1):
+        """Account for `rows` rows entering a group (negative rows leave it)"""
+        group = self.group_of(group_value)
+        self.counts[group] = self.counts.get(group, 0) + rows
+        self.sums[group] = self.sums.get(group, 0) + rows * value
+        if self.counts[group] == 0:
+            del self.counts[group], self.sums[group]
+    
+    def move(self, old_group_value, new_group_value, value):
+        """Account for one row changing group"""
+        self.add(old_group_value, value, rows=-1)
+        self.add(new_group_value, value)
+    
+    def frame(self):
+        """The totals as a DataFrame indexed by group, with 'count' and 'total' columns"""
+        groups = sorted(self.counts)
+        return pd.DataFrame({
+            'count': [self.counts[group] for group in groups],
+            'total': [self.sums[group] for group in groups]
+        }, index=pd.Index(groups, name=self.group_column))
+
+# ============================================
+# MANUFACTURING DATA MODELS & INITIALIZATION
+# ============================================
+
+def _table_property(name):
+    """Class attribute exposing a backend table as a plain DataFrame attribute"""
+    return property(lambda self: self.table(name), lambda self, frame: self.store(name, frame),
+                    doc=f"The '{name}' table")
+
+class ManufacturingPortal:
+    TABLES = ('customers', 'orders', 'suppliers', 'inventory', 'leads', 'marketing_campaigns')
+    FINANCE_TABLES = ('revenue', 'expenses', 'invoices', 'cashflow')
+    # Tables that start empty and only hold records created in the portal
+    RECORD_TABLES = ('work_orders', 'tickets', 'purchase_orders')
+    # The append-only movement history and the warehouses of the inventory,
+    # generated from it when missing
+    STOCK_TABLES = ('stock_movements', 'warehouses')
+    KEYS = {'customers': 'customer_id', 'orders': 'order_id', 'suppliers': 'supplier_id',
+            'inventory': 'item_id', 'leads': 'lead_id', 'marketing_campaigns': 'campaign_id',
+            'invoices': 'invoice_id', 'work_orders': 'work_order_id', 'tickets': 'ticket_id',
+            'purchase_orders': 'po_id', 'stock_movements': 'movement_id', 'warehouses': 'location'}
+    # IDs of new records come from per-table sequences (prefix, first number);
+    # a sequence continues after the highest ID already in its table.
+    ID_SEQUENCES = {'orders': ('ORD', 20000), 'leads': ('LEAD', 50000), 'work_orders': ('WO', 3000),
+                    'tickets': ('TKT', 2000), 'purchase_orders': ('PO', 10000),
+                    'stock_movements': ('MOV', 100000)}
+    
+    # Materialized aggregates: name -> (table, group column, value column, monthly)
+    AGGREGATES = {
+        'order_status': ('orders', 'status', 'amount', False),
+        'monthly_sales': ('orders', 'order_date', 'amount', True),
+        'lead_status': ('leads', 'status', 'value', False),
+    }
+    
+    # Models kept up to date with the rows appended to a table rather than
+    # rebuilt: name -> (table, model class). A model is filled from the whole
+    # table by rebuild(frame) and takes each batch of new rows with add(frame).
+    LIVE_MODELS = {
+        'demand_profile': ('stock_movements', DemandProfile),
+        'stock_ledger': ('stock_movements', StockLedger),
+    }
+    
+    # Value sets of the low-cardinality label columns
+    INDUSTRIES = ['Manufacturing', 'Construction', 'Hospitality', 'Education', 'Healthcare', 
+                  'Retail', 'Government', 'Corporate', 'Infrastructure', 'Real Estate']
+    REGIONS = ['North India', 'South India', 'West India', 'East India', 'Middle East', 'Europe', 'Asia Pacific']
+    SALES_REPS = ['Rajesh Kumar', 'Priya Sharma', 'Amit Patel', 'Neha Gupta', 'Vikram Singh']
+    PRIORITIES = ['High', 'Medium', 'Low']
+    ORDER_STATUSES = ['Quote', 'Confirmed', 'Production', 'QC', 'Ready for Shipment', 'Shipped', 'Delivered', 'Cancelled']
+    LEAD_STATUSES = ['New', 'Contacted', 'Qualified', 'Proposal Sent', 'Negotiation', 'Closed Won', 'Closed Lost']
+    LEAD_SOURCES = ['Website', 'Referral', 'Trade Show', 'LinkedIn', 'Email Campaign', 
+                    'Google Ads', 'Phone Inquiry', 'WhatsApp', 'Social Media', 'Direct Visit']
+    INVENTORY_CATEGORIES = ['Raw Materials', 'Work in Progress', 'Finished Goods', 'Spare Parts', 'Consumables']
+    LOCATIONS = ['Warehouse A', 'Warehouse B', 'Production Area', 'Finished Goods Store']
+    WORK_ORDER_STATUSES = ['Not Started', 'In Progress', 'Waiting Materials', 'QC Pending', 'Completed']
+    TICKET_STATUSES = ['Open', 'In Progress', 'Resolved', 'Closed']
+    PO_STATUSES = ['Open', 'Received', 'Cancelled']
+    MOVEMENT_TYPES = ['Receipt', 'Issue', 'Transfer', 'Adjustment']
+    STOREKEEPERS = ['Rajesh', 'Priya', 'Amit', 'Neha', 'Vikram']
+    
+    RECORD_COLUMNS = {
+        'work_orders': ['work_order_id', 'product', 'quantity', 'priority', 'start_date', 'due_date',
+                        'assigned_to', 'notes', 'status', 'created_at'],
+        'tickets': ['ticket_id', 'customer', 'category', 'priority', 'assigned_to', 'sla', 'subject',
+                    'description', 'status', 'created_at'],
+        'purchase_orders': ['po_id', 'item_id', 'item_name', 'quantity', 'unit', 'status', 'created_at'],
+    }
+    
+    # Declared column types. Dates are datetime64 and label columns are
+    # Categoricals; anything not listed keeps the type it was built with.
+    SCHEMA = {
+        'customers': {
+            'industry': pd.CategoricalDtype(INDUSTRIES),
+            'region': pd.CategoricalDtype(REGIONS),
+            'status': pd.CategoricalDtype(['Active', 'Inactive']),
+            'sales_rep': pd.CategoricalDtype(SALES_REPS),
+            'customer_since': 'datetime64[ns]',
+            'last_order': 'datetime64[ns]',
+        },
+        'orders': {
+            'order_date': 'datetime64[ns]',
+            'delivery_date': 'datetime64[ns]',
+            'status': pd.CategoricalDtype(ORDER_STATUSES),
+            'payment_status': pd.CategoricalDtype(['Paid', 'Partial', 'Pending']),
+            'payment_terms': pd.CategoricalDtype(['Net 30', '50% Advance', '100% Advance']),
+            'priority': pd.CategoricalDtype(PRIORITIES),
+            'products': 'category',
+            'sales_rep': pd.CategoricalDtype(SALES_REPS),
+            'notes': 'category',
+        },
+        'suppliers': {
+            'status': pd.CategoricalDtype(['Active', 'On Hold']),
+            'payment_terms': 'category',
+            'location': 'category',
+            'last_order': 'datetime64[ns]',
+        },
+        'inventory': {
+            'name': 'category',
+            'category': pd.CategoricalDtype(INVENTORY_CATEGORIES),
+            'unit': 'category',
+            'location': pd.CategoricalDtype(LOCATIONS),
+            'status': pd.CategoricalDtype(['In Stock', 'Low Stock', 'Out of Stock']),
+            'last_updated': 'datetime64[ns]',
+        },
+        'leads': {
+            'source': pd.CategoricalDtype(LEAD_SOURCES),
+            'status': pd.CategoricalDtype(LEAD_STATUSES),
+            'product_interest': 'category',
+            'assigned_to': pd.CategoricalDtype(SALES_REPS),
+            'priority': pd.CategoricalDtype(PRIORITIES),
+            'notes': 'category',
+            'created_date': 'datetime64[ns]',
+            'last_contact': 'datetime64[ns]',
+            'next_followup': 'datetime64[ns]',
+        },
+        'marketing_campaigns': {
+            'platform': 'category',
+            'target_audience': 'category',
+            'status': pd.CategoricalDtype(['Active', 'Completed', 'Planning', 'Paused']),
+            'campaign_manager': 'category',
+            'start_date': 'datetime64[ns]',
+            'end_date': 'datetime64[ns]',
+        },
+        'invoices': {
+            'status': pd.CategoricalDtype(['Paid', 'Pending', 'Overdue', 'Partially Paid']),
+            'payment_method': 'category',
+            'date': 'datetime64[ns]',
+            'due_date': 'datetime64[ns]',
+        },
+        'cashflow': {
+            'date': 'datetime64[ns]',
+        },
+        'work_orders': {
+            'quantity': 'int64',
+            'priority': pd.CategoricalDtype(PRIORITIES),
+            'start_date': 'datetime64[ns]',
+            'due_date': 'datetime64[ns]',
+            'status': pd.CategoricalDtype(WORK_ORDER_STATUSES),
+            'created_at': 'datetime64[ns]',
+        },
+        'tickets': {
+            'priority': pd.CategoricalDtype(PRIORITIES),
+            'status': pd.CategoricalDtype(TICKET_STATUSES),
+            'created_at': 'datetime64[ns]',
+        },
+        'purchase_orders': {
+            'quantity': 'int64',
+            'status': pd.CategoricalDtype(PO_STATUSES),
+            'created_at': 'datetime64[ns]',
+        },
+        'stock_movements': {
+            'date': 'datetime64[ns]',
+            'location': pd.CategoricalDtype(LOCATIONS),
+            'type': pd.CategoricalDtype(MOVEMENT_TYPES),
+            'quantity': 'int64',
+            'user': pd.CategoricalDtype(STOREKEEPERS),
+        },
+        'warehouses': {
+            'location': pd.CategoricalDtype(LOCATIONS),
+            'capacity': 'int64',
+        },
+    }
+    
+    def __init__(self, scale=1, seed=None, backend=None, journal=None):
+        # Row counts of the generated tables grow linearly with `scale`
+        # (1 = 150 customers, 300 orders, 200 SKUs, 500 leads); `seed` makes
+        # the whole dataset reproducible. Tables live in `backend`; a
+        # persistent backend that already holds them is reused as is.
+        # Records created through create() are logged to `journal` and
+        # replayed from it on start.
+        self.scale = scale
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.backend = backend if backend is not None else MemoryBackend()
+        self._frames = {}
+        # Every table carries a version that grows on each change; memoize()
+        # keys derived results on the versions of the tables they read.
+        self.versions = dict.fromkeys(
+            self.TABLES + self.FINANCE_TABLES + self.RECORD_TABLES + self.STOCK_TABLES, 0)
+        self._memo = {}
+        self.forecasts = ForecastService()
+        self._aggregates = {}
+        self._models = {}
+        self.journal = journal
+        self._sequences = {}
+        self._unflushed = {}
+        # Journal entries of the writes waiting for their commit, by id
+        self._in_flight = {}
+        self._write_lock = threading.RLock()
+        
+        self.products = self.initialize_products()
+        if not all(self.backend.has_table(name) for name in self.TABLES + self.FINANCE_TABLES):
+            self.customers = self.initialize_customers()
+            self.orders = self.initialize_orders()
+            self.suppliers = self.initialize_suppliers()
+            self.inventory = self.initialize_inventory()
+            self.leads = self.initialize_leads()
+            self.marketing_campaigns = self.initialize_marketing()
+            self.financial_data = self.initialize_finance()
+        for name in self.RECORD_TABLES:
+            if not self.backend.has_table(name):
+                self.store(name, pd.DataFrame(columns=self.RECORD_COLUMNS[name]))
+        if not self.backend.has_table('stock_movements'):
+            self.stock_movements = self.initialize_stock_movements()
+        if not self.backend.has_table('warehouses'):
+            self.warehouses = self.initialize_warehouses()
+        self.validate_schema()
+        
+        if self.journal is not None:
+            replayed = self.replay(self.journal)
+        
+        if self.backend.persistent:
+            # Also empties the journal: the backend holds the replayed writes now
+            self.checkpoint()
+            # Tables are read back from the backend on first use
+            self._frames.clear()
+        elif self.journal is not None:
+            self.compact_journal(*replayed)
+    
+    customers = _table_property('customers')
+    orders = _table_property('orders')
+    suppliers = _table_property('suppliers')
+    inventory = _table_property('inventory')
+    leads = _table_property('leads')
+    marketing_campaigns = _table_property('marketing_campaigns')
+    work_orders = _table_property('work_orders')
+    tickets = _table_property('tickets')
+    purchase_orders = _table_property('purchase_orders')
+    stock_movements = _table_property('stock_movements')
+    warehouses = _table_property('warehouses')
+    
+    @property
+    def financial_data(self):
+        """The finance tables (revenue, expenses, invoices, cashflow) by name"""
+        return {name: self.table(name) for name in self.FINANCE_TABLES}
+    
+    @financial_data.setter
+    def financial_data(self, tables):
+        for name, frame in tables.items():
+            self.store(name, frame)
+    
+    # ---- table access ----
+    
+    def table(self, name):
+        """A whole table as a DataFrame, loaded from the backend on first use"""
+        frame = self._frames.get(name)
+        if frame is not None and name not in self._unflushed:
+            return frame
+        with self._write_lock:
+            self._flush(name)
+            if name not in self._frames:
+                self._frames[name] = self.apply_schema(name, self.backend.load(name))
+            return self._frames[name]
+    
+    def store(self, name, frame):
+        """Replace a table in the backend"""
+        frame = self.apply_schema(name, frame)
+        with self._write_lock:
+            self._unflushed.pop(name, None)
+            self.backend.save(name, frame)
+            self._frames[name] = frame
+            self._drop_aggregates(name)
+            self._drop_models(name)
+            self.touch(name)
+    
+    def insert(self, name, rows):
+        """Append rows (a DataFrame, or a list of dicts) to a table"""
+        if isinstance(rows, pd.DataFrame):
+            rows = rows.to_dict('records')
+        # Rows are only typed and handed to the backend on the table's next
+        # read, as one batch; inserting just updates the aggregates.
+        with self._write_lock:
+            self._unflushed.setdefault(name, []).extend(rows)
+            self._frames.pop(name, None)
+            for aggregate in self._live_aggregates(name):
+                for row in rows:
+                    aggregate.add(row[aggregate.group_column], row[aggregate.value_column])
+            models = self._live_models(name)
+            if models:
+                frame = self.apply_schema(name, pd.DataFrame(rows))
+                for model in models:
+                    model.add(frame)
+            self.touch(name)
+    
+    def _flush(self, name):
+        if name in self._unflushed:
+            with self._write_lock:
+                rows = self._unflushed.pop(name, None)
+                if rows:
+                    self.backend.append(name, self.apply_schema(name, pd.DataFrame(rows)))
+                self._frames.pop(name, None)
+    
+    def update(self, name, key, values, wait=True):
+        """Set columns of the rows of a table whose key is `key`, and journal the change"""
+        if self.count(name, {self.KEYS[name]: key}) == 0:
+            raise KeyError(f"No row with {self.KEYS[name]} {key!r} in table '{name}'")
+        self._write([{'op': 'update', 'table': name, 'key': key, 'values': values}],
+                    lambda: self._apply_update(name, key, values), wait)
+    
+    def update_status(self, name, key, status, wait=True):
+        """Move the row of a table whose key is `key` to a new status"""
+        self.update(name, key, {'status': status}, wait)
+    
+    def _apply_update(self, name, key, values):
+        self._flush(name)
+        values = self.apply_schema(name, pd.DataFrame([values])).iloc[0].to_dict()
+        with self._write_lock:
+            aggregates = [aggregate for aggregate in self._live_aggregates(name)
+                          if aggregate.group_column in values or aggregate.value_column in values]
+            if aggregates:
+                columns = list(dict.fromkeys(column for aggregate in aggregates
+                                             for column in (aggregate.group_column, aggregate.value_column)))
+                before = self.backend.select(name, {self.KEYS[name]: key}, columns=columns)
+            if self.backend.update(name, {self.KEYS[name]: key}, values) == 0:
+                raise KeyError(f"No row with {self.KEYS[name]} {key!r} in table '{name}'")
+            self._frames.pop(name, None)
+            for aggregate in aggregates:
+                for _, row in before.iterrows():
+                    aggregate.add(row[aggregate.group_column], row[aggregate.value_column], rows=-1)
+                    aggregate.add(values.get(aggregate.group_column, row[aggregate.group_column]),
+                                  values.get(aggregate.value_column, row[aggregate.value_column]))
+            self._drop_models(name)
+            self.touch(name)
+    
+    # ---- system-of-record writes ----
+    
+    def next_id(self, name):
+        """Next ID from a table's sequence; IDs are never handed out twice"""
+        prefix, start = self.ID_SEQUENCES[name]
+        with self._write_lock:
+            if name not in self._sequences:
+                keys = self.query(name, columns=[self.KEYS[name]])[self.KEYS[name]]
+                numbers = pd.to_numeric(keys.astype(str).str.removeprefix(prefix), errors='coerce').dropna()
+                self._sequences[name] = itertools.count(max(start, int(numbers.max()) + 1) if len(numbers) else start)
+            return f'{prefix}{next(self._sequences[name])}'
+    
+    def create(self, name, rows, wait=True):
+        """Store a new record (one or more rows sharing a new ID) and journal it; returns the ID"""
+        key = self.KEYS[name]
+        record_id = self.next_id(name)
+        rows = [dict(row, **{key: record_id}) for row in rows]
+        self._write([{'op': 'insert', 'table': name, 'rows': rows}], lambda: self.insert(name, rows), wait)
+        return record_id
+    
+    def record_movement(self, rows, wait=True):
+        """Book stock movement rows as one record and update the on-hand stock of their items; returns the ID
+        
+        The balance check, the movement and the inventory rows of the items
+        at their own locations are written under one hold of the write lock,
+        so two sessions cannot both issue the last units. Raises ValueError
+        when a row would take its item below zero at its location.
+        """
+        with self._write_lock:
+            ledger = self.live_model('stock_ledger')
+            booked = pd.DataFrame(rows)
+            change = booked.groupby(['item_id', 'location'], sort=False)['quantity'].sum()
+            items, locations = change.index.get_level_values(0), change.index.get_level_values(1)
+            balance = ledger.current(list(items), list(locations)) + change.to_numpy()
+            if (balance < 0).any():
+                short = int(np.argmax(balance < 0))
+                raise ValueError(f"Only {balance[short] - change.iloc[short]:,} of {items[short]} "
+                                 f"in stock at {locations[short]}")
+            
+            movement_id = self.next_id('stock_movements')
+            rows = [dict(row, movement_id=movement_id) for row in rows]
+            entries = [{'op': 'insert', 'table': 'stock_movements', 'rows': rows}]
+            
+            # The inventory table holds each item's stock at its own location
+            inventory = self.query('inventory', {'item_id': list(items.unique())},
+                                   columns=['item_id', 'location', 'min_stock'])
+            stock = pd.Series(balance, index=change.index)
+            for item in inventory.itertuples(index=False):
+                if (item.item_id, item.location) not in stock.index:
+                    continue
+                on_hand = int(stock[(item.item_id, item.location)])
+                status = 'Out of Stock' if on_hand == 0 else 'Low Stock' if on_hand < item.min_stock else 'In Stock'
+                entries.append({'op': 'update', 'table': 'inventory', 'key': item.item_id, 'values': {
+                    'current_stock': on_hand, 'status': status, 'last_updated': booked['date'].max()}})
+            
+            def apply():
+                self.insert('stock_movements', rows)
+                for entry in entries[1:]:
+                    self._apply_update('inventory', entry['key'], entry['values'])
+            
+            # The lock is held until the movement is applied, commit included
+            self._write(entries, apply, wait)
+        return movement_id
+    
+    def _write(self, entries, apply, wait=True):
+        """Journal the entries of a write, then apply it with `apply()`
+        
+        The write is applied only once its entries are durable, so a journal
+        that fails (OSError, TimeoutError) leaves the tables untouched and the
+        error goes to the caller. With wait=False it is applied right away.
+        """
+        if self.journal is None or not wait:
+            with self._write_lock:
+                for entry in entries if self.journal is not None else ():
+                    self.journal.append(entry)
+                apply()
+            return
+        with self._write_lock:
+            # Queued under the write lock, so the journal holds the writes in order
+            pending = [self.journal.append(entry) for entry in entries]
+            self._in_flight.update((id(entry), entry) for entry in entries)
+        try:
+            for durable in pending:
+                self.journal.wait(durable)
+        except OSError:
+            with self._write_lock:
+                for entry in entries:
+                    self._in_flight.pop(id(entry), None)
+            raise
+        with self._write_lock:
+            for entry in entries:
+                self._in_flight.pop(id(entry), None)
+            apply()
+    
+    def checkpoint(self):
+        """Hand every pending insert to the backend and let it persist its changes
+        
+        The journal of a persistent backend is then cut down to the writes
+        still waiting for their commit, the only ones the backend lacks.
+        """
+        with self._write_lock:
+            for name in list(self._unflushed):
+                self._flush(name)
+            self.backend.checkpoint()
+            if self.backend.persistent and self.journal is not None:
+                self.journal.rewrite(self._in_flight.values())
+    
+    def replay(self, journal):
+        """Apply the journaled writes that are not in the tables yet
+        
+        Inserts are applied in one batch per table. A journaled record is
+        skipped when its rows are already in the table; if its ID was since
+        given to other rows (the data was regenerated at another scale, say)
+        it is stored under a new ID, which the updates journaled for it
+        follow. Returns the IDs of the journaled records per table and the
+        columns updated per (table, key), for compact_journal().
+        """
+        inserts, updates, updated = {}, [], {}
+        for entry in journal.records():
+            if entry['op'] == 'insert':
+                inserts.setdefault(entry['table'], []).extend(entry['rows'])
+            elif entry['op'] == 'update':
+                updates.append(entry)
+                updated.setdefault((entry['table'], entry['key']), set()).update(entry['values'])
+        
+        renamed, journaled = {}, {}
+        for name, rows in inserts.items():
+            key = self.KEYS[name]
+            records = {}
+            for row in rows:
+                records.setdefault(row[key], []).append(row)
+            existing = self.query(name, {key: list(records)})
+            existing = dict(list(existing.groupby(key, sort=False))) if len(existing) else {}
+            fresh, taken = [], []
+            for record_id, record in records.items():
+                if record_id not in existing:
+                    fresh.extend(record)
+                elif not self._same_rows(name, existing[record_id], record, updated.get((name, record_id), ())):
+                    taken.append(record_id)
+            journaled[name] = set(records)
+            if fresh:
+                self.insert(name, fresh)
+            # New IDs come after every replayed one
+            self._sequences.pop(name, None)
+            for record_id in taken:
+                renamed[(name, record_id)] = self.next_id(name)
+                journaled[name].discard(record_id)
+                journaled[name].add(renamed[(name, record_id)])
+                self.insert(name, [dict(row, **{key: renamed[(name, record_id)]}) for row in records[record_id]])
+        
+        for entry in updates:
+            name = entry['table']
+            key = renamed.get((name, entry['key']), entry['key'])
+            if self.count(name, {self.KEYS[name]: key}):
+                self._apply_update(name, key, entry['values'])
+        return journaled, {(name, renamed.get((name, key), key)): columns for (name, key), columns in updated.items()}
+    
+    def compact_journal(self, journaled, updated):
+        """Rewrite the journal as the fewest writes that rebuild the replayed tables
+        
+        That is one insert per table of the journaled records as they are now,
+        and one update of every other row that was updated. The memory backend
+        is never checkpointed, so the journal would otherwise grow and be
+        replayed in full on every start.
+        """
+        entries = []
+        for name, record_ids in journaled.items():
+            rows = self.query(name, {self.KEYS[name]: list(record_ids)})
+            if len(rows):
+                entries.append({'op': 'insert', 'table': name, 'rows': rows.to_dict('records')})
+        for (name, key), columns in updated.items():
+            if key in journaled.get(name, ()):
+                continue
+            values = self.query(name, {self.KEYS[name]: key}, columns=sorted(columns))
+            if len(values):
+                entries.append({'op': 'update', 'table': name, 'key': key, 'values': values.iloc[0].to_dict()})
+        try:
+            self.journal.wait(self.journal.rewrite(entries))
+        except OSError:
+            pass  # the journal stays as it was and is compacted on the next start
+    
+    def _same_rows(self, name, existing, rows, updated_columns):
+        """Whether journaled rows are those of a table, leaving out columns updated since"""
+        journaled = self.apply_schema(name, pd.DataFrame(rows))
+        columns = [column for column in journaled.columns if column not in updated_columns]
+        if len(existing) != len(journaled):
+            return False
+        existing = existing[columns].astype(str).sort_values(columns).reset_index(drop=True)
+        journaled = journaled[columns].astype(str).sort_values(columns).reset_index(drop=True)
+        return existing.equals(journaled)
+    
+    # ---- materialized aggregates ----
+    
+    def totals(self, aggregate):
+        """Counts and value totals per group of a materialized aggregate (see AGGREGATES)"""
+        if aggregate not in self._aggregates:
+            table, group_column, value_column, monthly = self.AGGREGATES[aggregate]
+            totals = GroupTotals(group_column, value_column, monthly)
+            with self._write_lock:
+                totals.rebuild(self.query(table, columns=[group_column, value_column]))
+                self._aggregates[aggregate] = totals
+        return self._aggregates[aggregate].frame()
+    
+    def _live_aggregates(self, table):
+        return [totals for name, totals in self._aggregates.items() if self.AGGREGATES[name][0] == table]
+    
+    def _drop_aggregates(self, table):
+        for name in [name for name, spec in self.AGGREGATES.items() if spec[0] == table]:
+            self._aggregates.pop(name, None)
+    
+    # ---- live models ----
+    
+    def live_model(self, name):
+        """A model of LIVE_MODELS, built from its table on first use and updated on every insert"""
+        if name not in self._models:
+            table, model_class = self.LIVE_MODELS[name]
+            model = model_class()
+            with self._write_lock:
+                model.rebuild(self.query(table))
+                self._models[name] = model
+        return self._models[name]
+    
+    def _live_models(self, table):
+        return [model for name, model in self._models.items() if self.LIVE_MODELS[name][0] == table]
+    
+    def _drop_models(self, table):
+        for name in [name for name, spec in self.LIVE_MODELS.items() if spec[0] == table]:
+            self._models.pop(name, None)
+    
+    # ---- versions & memoization ----
+    
+    def version(self, name):
+        """Current version of a table"""
+        return self.versions[name]
+    
+    def touch(self, name):
+        """Record a change to a table, invalidating results derived from it"""
+        self.versions[name] += 1
+    
+    def memoize(self, key, tables, compute):
+        """Return compute(), reusing the last result for `key` while none of `tables` changed"""
+        stamp = tuple(self.version(name) for name in tables)
+        entry = self._memo.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        value = compute()
+        # Only the latest version of each result is kept
+        self._memo[key] = (stamp, value)
+        return value
+    
+    def query(self, name, where=None, columns=None, order_by=None, descending=False, limit=None):
+        """Rows of a table matching a filter, evaluated by the backend"""
+        self._flush(name)
+        return self.apply_schema(name, self.backend.select(name, where, columns, order_by, descending, limit))
+    
+    def aggregate(self, name, how='count', column=None, by=None, where=None):
+        """A count/sum/mean/min/max of a table column (per `by` group if given), evaluated by the backend"""
+        self._flush(name)
+        return self.backend.aggregate(name, how, column, by, where)
+    
+    def count(self, name, where=None):
+        """Number of rows of a table matching a filter"""
+        return self.aggregate(name, 'count', where=where)
+    
+    # ---- table schema ----
+    
+    def tables(self):
+        """All portal DataFrames by table name, finance sub-tables included"""
+        return {name: self.table(name) for name in
+                self.TABLES + self.FINANCE_TABLES + self.RECORD_TABLES + self.STOCK_TABLES}
+    
+    @classmethod
+    def apply_schema(cls, name, frame):
+        """Convert a table's columns to their declared types (parsing happens here, once)"""
+        conversions = {
+            column: dtype for column, dtype in cls.SCHEMA.get(name, {}).items()
+            if column in frame.columns and frame[column].dtype != dtype
+        }
+        return frame.astype(conversions) if conversions else frame
+    
+    def validate_schema(self):
+        """Check that every table column has its declared type"""
+        for name, frame in self.tables().items():
+            for column, expected in self.SCHEMA.get(name, {}).items():
+                if column not in frame.columns:
+                    raise ValueError(f"Table '{name}' is missing column '{column}'")
+                actual = frame[column].dtype
+                if actual != expected:
+                    raise TypeError(f"Column '{name}.{column}' has type {actual}, expected {expected}")
+    
+    # ---- vectorized generator helpers ----
+    
+    def _rows(self, base):
+        """Number of rows to generate for a table that has `base` rows at scale 1"""
+        return max(1, int(round(base * self.scale)))
+    
+    def _choice(self, options, size):
+        """Draw `size` values uniformly from options (repeats act as weights)"""
+        return np.asarray(options)[self.rng.integers(0, len(options), size)]
+    
+    def _category(self, options, size):
+        """Like _choice, but built directly as a pandas Categorical from integer codes"""
+        categories = list(dict.fromkeys(options))
+        codes = np.array([categories.index(option) for option in options])
+        return pd.Categorical.from_codes(codes[self.rng.integers(0, len(options), size)], categories=categories)
+    
+    def _ids(self, prefix, start, size):
+        """Sequential identifiers such as ORD20000, ORD20001, ..."""
+        return np.char.add(prefix, np.arange(start, start + size).astype(str))
+    
+    def _numbered(self, prefix, size, suffix=''):
+        """Numbered labels such as 'Customer 1' or 'lead1@example.com'"""
+        return np.char.add(np.char.add(prefix, np.arange(1, size + 1).astype(str)), suffix)
+    
+    def _companies(self, size):
+        """Company names in the 'Company A1', 'Company B1', ... pattern"""
+        i = np.arange(size)
+        letters = np.array(list(string.ascii_uppercase))
+        return np.char.add(np.char.add('Company ', letters[i % 26]), (i // 26 + 1).astype(str))
+    
+    def _phones(self, size):
+        """Random Indian mobile numbers"""
+        first = self.rng.integers(70000, 100000, size).astype(str)
+        last = self.rng.integers(10000, 100000, size).astype(str)
+        return np.char.add(np.char.add('+91', first), last)
+    
+    def _days_ago(self, low, high, size):
+        """Random calendar days between `high` and `low` days before today"""
+        today = np.datetime64(date.today(), 'D')
+        return today - self.rng.integers(low, high + 1, size)
+    
+    def _sample_keys(self, keys, size):
+        """Draw foreign keys that reference existing rows of another table"""
+        keys = np.asarray(keys)
+        return keys[self.rng.integers(0, len(keys), size)]
+        
+    def initialize_products(self):
+        """Initialize product catalog for manufacturing business"""
+        products = {
+            "Storage and Mobile Lockers": [
+                {"id": "PROD001", "name": "Mild Steel Worker Locker", "category": "Lockers", "price": 8500, "cost": 5200, "stock": 45, "min_stock": 20, "lead_time": 7, "image": "locker1.jpg"},
+                {"id": "PROD002", "name": "Swimming Pool Locker", "category": "Lockers", "price": 12500, "cost": 7800, "stock": 22, "min_stock": 10, "lead_time": 10, "image": "locker2.jpg"},
+                {"id": "PROD003", "name": "Laptop Storage Lockers", "category": "Lockers", "price": 9500, "cost": 5800, "stock": 38, "min_stock": 15, "lead_time": 7, "image": "locker3.jpg"},
+            ],
+            "HVAC Ducting System": [
+                {"id": "PROD004", "name": "SS Industrial Duct", "category": "HVAC", "price": 3200, "cost": 1850, "stock": 120, "min_stock": 50, "lead_time": 5, "image": "duct1.jpg"},
+                {"id": "PROD005", "name": "Round Spiral Ducting", "category": "HVAC", "price": 2800, "cost": 1650, "stock": 95, "min_stock": 40, "lead_time": 5, "image": "duct2.jpg"},
+                {"id": "PROD006", "name": "GI Ducting Services", "category": "HVAC", "price": 4500, "cost": 2800, "stock": 65, "min_stock": 25, "lead_time": 7, "image": "duct3.jpg"},
+            ],
+            "Electrical Control Panel": [
+                {"id": "PROD007", "name": "Generator Control Panel", "category": "Electrical", "price": 18500, "cost": 11200, "stock": 18, "min_stock": 8, "lead_time": 14, "image": "panel1.jpg"},
+                {"id": "PROD008", "name": "Electric Control Panel", "category": "Electrical", "price": 15200, "cost": 9200, "stock": 25, "min_stock": 10, "lead_time": 12, "image": "panel2.jpg"},
+                {"id": "PROD009", "name": "Mild Steel Electrical Panel", "category": "Electrical", "price": 12800, "cost": 7800, "stock": 32, "min_stock": 12, "lead_time": 10, "image": "panel3.jpg"},
+            ],
+            "Sheet Metal Fabrication": [
+                {"id": "PROD010", "name": "Sheet Metal Fabrication Services", "category": "Fabrication", "price": 5000, "cost": 3000, "stock": 0, "min_stock": 0, "lead_time": 10, "image": "fabrication1.jpg"},
+                {"id": "PROD011", "name": "Metal Cutting Service", "category": "Fabrication", "price": 3000, "cost": 1800, "stock": 0, "min_stock": 0, "lead_time": 5, "image": "fabrication2.jpg"},
+            ],
+            "Laser Cutting": [
+                {"id": "PROD012", "name": "SS Laser Cutting", "category": "Laser", "price": 4000, "cost": 2400, "stock": 0, "min_stock": 0, "lead_time": 3, "image": "laser1.jpg"},
+                {"id": "PROD013", "name": "CNC Laser Cutting Services", "category": "Laser", "price": 4500, "cost": 2700, "stock": 0, "min_stock": 0, "lead_time": 4, "image": "laser2.jpg"},
+            ],
+            "Storage Rack": [
+                {"id": "PROD014", "name": "Industrial Storage Rack", "category": "Racks", "price": 7500, "cost": 4500, "stock": 52, "min_stock": 20, "lead_time": 7, "image": "rack1.jpg"},
+                {"id": "PROD015", "name": "MS Slotted Angle Racks", "category": "Racks", "price": 6800, "cost": 4200, "stock": 48, "min_stock": 18, "lead_time": 6, "image": "rack2.jpg"},
+            ]
+        }
+        return products
+    
+    def initialize_customers(self):
+        """Initialize customer database"""
+        n = self._rows(150)
+        return self.apply_schema('customers', pd.DataFrame({
+            'customer_id': self._ids('CUST', 10000, n),
+            'name': self._numbered('Customer ', n),
+            'company': self._companies(n),
+            'email': self._numbered('customer', n, '@example.com'),
+            'phone': self._phones(n),
+            'industry': self._category(self.INDUSTRIES, n),
+            'region': self._category(self.REGIONS, n),
+            'status': self._category(['Active', 'Active', 'Active', 'Inactive'], n),
+            'credit_limit': self._choice([100000, 200000, 300000, 500000, 1000000], n),
+            'total_orders': self.rng.integers(1, 51, n),
+            'total_spent': self.rng.integers(50000, 5000001, n),
+            'customer_since': self._days_ago(30, 1825, n),
+            'last_order': self._days_ago(0, 180, n),
+            'sales_rep': self._category(self.SALES_REPS, n)
+        }))
+    
+    def initialize_orders(self):
+        """Initialize order database"""
+        n = self._rows(300)
+        order_date = self._days_ago(0, 365, n)
+        delivery_date = order_date + self.rng.integers(7, 61, n)
+        
+        return self.apply_schema('orders', pd.DataFrame({
+            'order_id': self._ids('ORD', 20000, n),
+            'customer_id': self._sample_keys(self.customers['customer_id'], n),
+            'order_date': order_date,
+            'delivery_date': delivery_date,
+            'status': self._category(self.ORDER_STATUSES, n),
+            'amount': self.rng.integers(25000, 500001, n),
+            'payment_status': self._category(['Paid', 'Partial', 'Pending'], n),
+            'payment_terms': self._category(['Net 30', '50% Advance', '100% Advance'], n),
+            'priority': self._category(self.PRIORITIES, n),
+            'products': np.char.add('Product ', self.rng.integers(1, 16, n).astype(str)),
+            'quantity': self.rng.integers(1, 26, n),
+            'sales_rep': self._category(self.SALES_REPS, n),
+            'notes': self._category(['Urgent delivery', 'Standard order', 'Bulk discount applied', 'Export order'], n)
+        }))
+    
+    def initialize_suppliers(self):
+        """Initialize supplier database"""
+        n = self._rows(50)
+        materials = np.array(['Steel Sheets', 'GI Coils', 'SS Plates', 'Fasteners', 'Electrical Components', 
+                              'Powder Coating', 'Paints', 'Packaging Material', 'CNC Tools', 'Laser Consumables'])
+        
+        # 1-4 distinct materials per supplier: the first k columns of a random permutation
+        shuffled = np.argsort(self.rng.random((n, len(materials))), axis=1)
+        counts = self.rng.integers(1, 5, n)
+        
+        return self.apply_schema('suppliers', pd.DataFrame({
+            'supplier_id': self._ids('SUPP', 30000, n),
+            'name': self._numbered('Supplier ', n, ' Pvt Ltd'),
+            'contact_person': np.char.add('Mr. ', self._choice(['Raj', 'Amit', 'Suresh', 'Kumar', 'Patel'], n)),
+            'email': self._numbered('supplier', n, '@example.com'),
+            'phone': self._phones(n),
+            'materials': [materials[row[:k]].tolist() for row, k in zip(shuffled, counts)],
+            'lead_time': self.rng.integers(3, 22, n),
+            'rating': np.round(self.rng.uniform(3.0, 5.0, n), 1),
+            'status': self._category(['Active', 'Active', 'Active', 'On Hold'], n),
+            'last_order': self._days_ago(0, 90, n),
+            'payment_terms': self._category(['Net 45', 'Net 60', '30% Advance'], n),
+            'location': self._category(['Mumbai', 'Delhi', 'Chennai', 'Bangalore', 'Hyderabad', 'Pune', 'Ahmedabad'], n)
+        }))
+    
+    def initialize_inventory(self):
+        """Initialize inventory tracking"""
+        n = self._rows(200)
+        items = np.array([
+            ['Steel Sheets', 'GI Coils', 'SS Plates', 'MS Rods', 'Aluminum Sheets'],
+            ['Lockers', 'Ducts', 'Panels', 'Racks', 'Fabricated Parts'],
+            ['Fasteners', 'Paints', 'Electrical Parts', 'Tools', 'Packaging']
+        ])
+        
+        category = self._choice(self.INVENTORY_CATEGORIES, n)
+        item_group = np.select([category == 'Raw Materials', category == 'Finished Goods'], [0, 1], default=2)
+        
+        return self.apply_schema('inventory', pd.DataFrame({
+            'item_id': self._ids('INV', 40000, n),
+            'name': items[item_group, self.rng.integers(0, items.shape[1], n)],
+            'category': category,
+            'current_stock': self.rng.integers(0, 501, n),
+            'min_stock': self.rng.integers(10, 101, n),
+            'max_stock': self.rng.integers(200, 1001, n),
+            'unit': self._category(['kg', 'pcs', 'meters', 'liters'], n),
+            'location': self._category(self.LOCATIONS, n),
+            'last_updated': self._days_ago(0, 30, n),
+            'status': np.where(self.rng.random(n) > 0.2, 'In Stock', 'Low Stock'),
+            'value': self.rng.integers(500, 50001, n)
+        }))
+    
+    def initialize_stock_movements(self, months=6):
+        """Generate the stock movements of the last `months` months that end in the current stock
+        
+        Every item is issued once a month, around a monthly demand drawn with
+        its own variability, and replenished a few times. Working back
+        from its current stock, each receipt tops the stock up from a random
+        level under its min stock (a negative top-up is booked as an
+        adjustment) and an opening adjustment starts the history, so running
+        balances never go negative and end at the current stock.
+        """
+        inventory = self.inventory
+        n = len(inventory)
+        now = pd.Timestamp.now().floor('min')
+        start = (now - pd.DateOffset(months=months)).replace(day=1).normalize()
+        minutes = int((now - start) / pd.Timedelta(minutes=1))
+        current = inventory['current_stock'].to_numpy()
+        min_stock = inventory['min_stock'].to_numpy()
+        
+        # Issues: one a month per item, of a demand drawn with the item's own variability
+        month_starts = pd.date_range(start, now, freq='MS')
+        month_minutes = ((month_starts - start) / pd.Timedelta(minutes=1)).to_numpy().astype(np.int64)
+        month_length = np.diff(np.append(month_minutes, minutes + 1))
+        rate = np.maximum(inventory['max_stock'].to_numpy() - min_stock, 1)
+        variation = self._choice([0.2, 0.3, 0.4, 0.7, 1.3], n)
+        shape = 1 / variation ** 2
+        issue_qty = np.rint(self.rng.gamma(shape[:, None], (rate / shape)[:, None], (n, len(month_starts))))
+        issue_time = month_minutes + (self.rng.random(issue_qty.shape) * month_length).astype(np.int64) + 1
+        keep = (issue_qty > 0) & (issue_time <= minutes)
+        issue_item = np.broadcast_to(np.arange(n)[:, None], issue_qty.shape)[keep]
+        issue_time, issue_qty = issue_time[keep], issue_qty[keep].astype(np.int64)
+        
+        # Receipts: 2-5 per item, ordered by item and time
+        receipts = self.rng.integers(2, 6, n)
+        receipt_item = np.repeat(np.arange(n), receipts)
+        receipt_time = self.rng.integers(1, minutes + 1, len(receipt_item))
+        order = np.lexsort((receipt_time, receipt_item))
+        receipt_time = receipt_time[order]
+        first_receipt = np.cumsum(receipts) - receipts
+        
+        # Issues fall in the segment after the last receipt of their item before them
+        span = minutes + 1
+        segment = (np.searchsorted(receipt_item * span + receipt_time, issue_item * span + issue_time, side='right')
+                   - first_receipt[issue_item])
+        slot_start = np.cumsum(receipts + 1) - (receipts + 1)
+        issued = np.bincount(slot_start[issue_item] + segment, weights=issue_qty,
+                             minlength=(receipts + 1).sum()).astype(np.int64)
+        
+        # Stock just before each receipt, and after the last one the current stock
+        before = np.floor(self.rng.random(len(receipt_item)) * min_stock[receipt_item]).astype(np.int64)
+        position = np.arange(len(receipt_item)) - first_receipt[receipt_item]
+        last = position == receipts[receipt_item] - 1
+        after_next = np.where(last, current[receipt_item], np.append(before[1:], 0))
+        receipt_qty = after_next + issued[slot_start[receipt_item] + position + 1] - before
+        opening_qty = before[first_receipt] + issued[slot_start]
+        
+        item = np.concatenate([np.arange(n), receipt_item, issue_item])
+        at = np.concatenate([np.zeros(n, dtype=np.int64), receipt_time, issue_time])
+        quantity = np.concatenate([opening_qty, receipt_qty, -issue_qty])
+        kind = np.concatenate([np.full(n, 3), np.where(receipt_qty > 0, 0, 3), np.ones(len(issue_qty), dtype=np.int64)])
+        # Chronological, with a receipt booked before an issue of the same minute
+        order = np.lexsort((kind == 1, at))
+        order = order[quantity[order] != 0]
+        
+        return self.apply_schema('stock_movements', pd.DataFrame({
+            'movement_id': self._ids('MOV', 100000, len(order)),
+            'date': start.to_datetime64() + at[order].astype('timedelta64[m]'),
+            'item_id': inventory['item_id'].array.take(item[order]),
+            'location': pd.Categorical.from_codes(inventory['location'].cat.codes.to_numpy()[item[order]],
+                                                  dtype=self.SCHEMA['stock_movements']['location']),
+            'type': pd.Categorical.from_codes(kind[order], dtype=self.SCHEMA['stock_movements']['type']),
+            'quantity': quantity[order],
+            'user': self._category(self.STOREKEEPERS, len(order)),
+        }))
+    
+    def initialize_warehouses(self):
+        """Initialize the storage capacity of every location, in stock units
+        
+        Each location is sized for its current stock at a random utilization
+        between 50% and 90%, rounded up to hundreds of units.
+        """
+        stock = self.inventory.groupby('location', observed=False)['current_stock'].sum()
+        stock = stock.reindex(self.LOCATIONS, fill_value=0).to_numpy()
+        utilization = self.rng.uniform(0.5, 0.9, len(self.LOCATIONS))
+        return self.apply_schema('warehouses', pd.DataFrame({
+            'location': self.LOCATIONS,
+            'capacity': np.maximum(np.ceil(stock / utilization / 100), 1).astype(np.int64) * 100,
+        }))
+    
+    def initialize_leads(self):
+        """Initialize lead generation database"""
+        n = self._rows(500)
+        
+        lead_date = self._days_ago(0, 180, n)
+        
+        return self.apply_schema('leads', pd.DataFrame({
+            'lead_id': self._ids('LEAD', 50000, n),
+            'name': self._numbered('Lead Prospect ', n),
+            'company': self._sample_keys(self.customers['company'], n),
+            'email': self._numbered('lead', n, '@example.com'),
+            'phone': self._phones(n),
+            'source': self._category(self.LEAD_SOURCES, n),
+            'status': self._category(self.LEAD_STATUSES, n),
+            'product_interest': self._category(['Lockers', 'HVAC Ducts', 'Electrical Panels', 'Fabrication', 'Laser Cutting'], n),
+            'value': self.rng.integers(25000, 500001, n),
+            'created_date': lead_date,
+            'last_contact': lead_date + self.rng.integers(0, 8, n),
+            'next_followup': lead_date + self.rng.integers(1, 15, n),
+            'assigned_to': self._category(self.SALES_REPS, n),
+            'priority': self._category(self.PRIORITIES, n),
+            'notes': self._category(['Very interested', 'Requested quote', 'Budget approved', 'Comparing vendors'], n),
+            'conversion_probability': self.rng.integers(10, 91, n)
+        }))
+    
+    def initialize_marketing(self):
+        """Initialize marketing campaigns"""
+        # The campaign calendar does not grow with transaction volume
+        n = 30
+        platforms = ['Email', 'LinkedIn', 'Google Ads', 'Trade Show', 'Direct Mail', 
+                    'Social Media', 'WhatsApp Broadcast', 'SMS', 'Telemarketing']
+        
+        start_date = self._days_ago(0, 90, n)
+        end_date = start_date + self.rng.integers(14, 61, n)
+        names = np.char.add(np.char.add(self._choice(['Q4', 'Summer', 'Monsoon', 'Festive', 'Year-End'], n), ' '),
+                            self._choice(['Promotion', 'Campaign', 'Drive', 'Launch'], n))
+        
+        return self.apply_schema('marketing_campaigns', pd.DataFrame({
+            'campaign_id': self._ids('CAMP', 60000, n),
+            'name': names,
+            'platform': self._category(platforms, n),
+            'target_audience': self._category(['Manufacturing Companies', 'Construction Firms', 'Hospitality Sector', 'Government Projects'], n),
+            'budget': self.rng.integers(10000, 200001, n),
+            'spent': self.rng.integers(5000, 180001, n),
+            'leads_generated': self.rng.integers(10, 201, n),
+            'conversions': self.rng.integers(1, 51, n),
+            'start_date': start_date,
+            'end_date': end_date,
+            'status': self._category(['Active', 'Completed', 'Planning', 'Paused'], n),
+            'roi': self.rng.integers(50, 501, n),
+            'ctr': self.rng.uniform(0.5, 8.0, n),
+            'cost_per_lead': self.rng.integers(500, 5001, n),
+            'campaign_manager': self._category(['Marketing Team', 'Sales Team', 'External Agency'], n)
+        }))
+    
+    def initialize_finance(self):
+        """Initialize financial data"""
+        finance = {}
+        
+        # Monthly revenue for last 12 months
+        months = [(date.today() - timedelta(days=30*i)).strftime("%Y-%m") for i in range(12, 0, -1)]
+        base_revenue = 8000000
+        trend = 1.05  # 5% growth trend
+        
+        month_revenue = (base_revenue * trend ** np.arange(len(months)) * self.rng.uniform(0.9, 1.1, len(months))).astype(np.int64)
+        cost_of_goods = (month_revenue * 0.65).astype(np.int64)
+        gross_profit = month_revenue - cost_of_goods
+        operating_expenses = (month_revenue * 0.25).astype(np.int64)
+        
+        finance['revenue'] = pd.DataFrame({
+            'month': months,
+            'revenue': month_revenue,
+            'cost_of_goods': cost_of_goods,
+            'gross_profit': gross_profit,
+            'operating_expenses': operating_expenses,
+            'net_profit': gross_profit - operating_expenses
+        })
+        
+        # Expenses by category
+        categories = ['Raw Materials', 'Labor', 'Utilities', 'Marketing', 'Logistics', 'Maintenance', 'Administration']
+        amount = self.rng.integers(100000, 1000001, len(categories))
+        budget = (amount * self.rng.uniform(0.9, 1.2, len(categories))).astype(np.int64)
+        
+        finance['expenses'] = pd.DataFrame({
+            'category': categories,
+            'amount': amount,
+            'budget': budget,
+            'variance': ((amount - budget) / budget * 100).astype(np.int64)
+        })
+        
+        # Invoices
+        n = self._rows(100)
+        invoice_date = self._days_ago(0, 90, n)
+        
+        finance['invoices'] = pd.DataFrame({
+            'invoice_id': self._ids('INV', 70000, n),
+            'customer_id': self._sample_keys(self.customers['customer_id'], n),
+            'amount': self.rng.integers(10000, 500001, n),
+            'date': invoice_date,
+            'due_date': invoice_date + 30,
+            'status': self._category(['Paid', 'Pending', 'Overdue', 'Partially Paid'], n),
+            'payment_method': self._category(['Bank Transfer', 'Cheque', 'Cash', 'Online Payment'], n)
+        })
+        
+        # Cashflow
+        days = np.datetime64(date.today(), 'D') - np.arange(29, -1, -1)
+        inflow = self.rng.integers(100000, 1000001, len(days))
+        outflow = self.rng.integers(80000, 900001, len(days))
+        
+        finance['cashflow'] = pd.DataFrame({
+            'date': days,
+            'inflow': inflow,
+            'outflow': outflow,
+            'balance': 5000000 + np.cumsum(inflow - outflow)
+        })
+        
+        return {name: self.apply_schema(name, frame) for name, frame in finance.items()}
+
+class PortalSession:
+    """Per-session handle on the shared portal datasets.
+    
+    Every read and write goes to the process-wide ManufacturingPortal, so a
+    new session costs no copy of the data.
+    """
+    
+    def __init__(self, shared):
+        self._shared = shared
+    
+    def __getattr__(self, name):
+        if '_shared' not in self.__dict__:
+            raise AttributeError(name)
+        return getattr(self.__dict__['_shared'], name)
+    
+    @property
+    def shared(self):
+        """The process-wide portal this session reads from"""
+        return self._shared
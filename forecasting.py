@@ -0,0 +1,281 @@
+"""Sales forecasting for the manufacturing portal.
+
+Models are fitted with plain numpy and are deterministic: the same history
+always gives the same forecast. HoltModel fits a whole panel of series (one
+row per product, region or segment) in a single vectorized pass.
+backtest() scores a model by rolling-origin evaluation, in a process pool for
+large panels. ForecastService keeps each fitted model and backtest together
+with the version of the data it was computed from, so neither is redone until
+that data changes.
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Two-sided 95% normal quantile used for the prediction intervals
+Z_95 = 1.959963984540054
+
+class LinearTrendModel:
+    """Least-squares linear trend over the most recent periods of a series
+    
+    A 1-D history is one series; a 2-D history is fitted row by row in one go
+    and predicts (series x horizon) arrays.
+    """
+    
+    def __init__(self, slope, intercept, residual_std, n, single=False):
+        self.slope = slope
+        self.intercept = intercept
+        self.residual_std = residual_std
+        self.n = n
+        self.single = single
+    
+    @classmethod
+    def fit(cls, history, window=6):
+        """Fit the trend to the last `window` values of each series"""
+        y = np.asarray(history, dtype=float)
+        single = y.ndim == 1
+        y = np.atleast_2d(y)[:, -window:]
+        n = y.shape[1]
+        if n < 2:
+            last = y[:, -1] if n else np.zeros(len(y))
+            zeros = np.zeros(len(y))
+            return cls(zeros, last, zeros, n, single)
+        x = np.arange(n)
+        x_mean = (n - 1) / 2
+        y_mean = y.mean(axis=1)
+        slope = (y - y_mean[:, None]) @ (x - x_mean) / ((x - x_mean) ** 2).sum()
+        intercept = y_mean - slope * x_mean
+        residuals = y - (intercept[:, None] + slope[:, None] * x)
+        residual_std = np.sqrt((residuals ** 2).sum(axis=1) / (n - 2)) if n > 2 else np.zeros(len(y))
+        return cls(slope, intercept, residual_std, n, single)
+    
+    def predict(self, horizon, z=Z_95):
+        """Point forecasts and prediction interval half-widths for the next `horizon` periods"""
+        x = np.arange(self.n, self.n + horizon)
+        forecast = self.intercept[:, None] + self.slope[:, None] * x
+        if self.n > 2:
+            x_mean = (self.n - 1) / 2
+            spread = ((np.arange(self.n) - x_mean) ** 2).sum()
+            interval = z * self.residual_std[:, None] * np.sqrt(1 + 1 / self.n + (x - x_mean) ** 2 / spread)
+        else:
+            interval = np.zeros_like(forecast)
+        if self.single:
+            return forecast[0], interval[0]
+        return forecast, interval
+
+class HoltModel:
+    """Holt's linear exponential smoothing, fitted to many series at once
+    
+    Each row of the history is a series. The smoothing parameters are picked
+    per series from a grid by the one-step-ahead squared error, with the grid
+    searched as an extra array axis so the only Python loop is over periods.
+    """
+    
+    ALPHAS = np.array([0.1, 0.2, 0.3, 0.5, 0.7, 0.9])
+    BETAS = np.array([0.01, 0.05, 0.1, 0.2, 0.3])
+    
+    def __init__(self, level, trend, alpha, beta, residual_std):
+        self.level = level
+        self.trend = trend
+        self.alpha = alpha
+        self.beta = beta
+        self.residual_std = residual_std
+    
+    @classmethod
+    def fit(cls, history, alphas=None, betas=None):
+        """Fit every row of a (series x periods) array"""
+        y = np.atleast_2d(np.asarray(history, dtype=float))
+        n_series, n_periods = y.shape
+        if n_periods < 3:
+            last = y[:, -1] if n_periods else np.zeros(n_series)
+            zeros = np.zeros(n_series)
+            return cls(last, zeros, np.ones(n_series), zeros, zeros)
+        alphas = cls.ALPHAS if alphas is None else np.asarray(alphas, dtype=float)
+        betas = cls.BETAS if betas is None else np.asarray(betas, dtype=float)
+        alpha = np.repeat(alphas, len(betas))[:, None]
+        beta = np.tile(betas, len(alphas))[:, None]
+        
+        # State per (grid point, series), initialised from the first two periods
+        level = np.broadcast_to(y[:, 1], (len(alpha), n_series)).copy()
+        trend = np.broadcast_to(y[:, 1] - y[:, 0], (len(alpha), n_series)).copy()
+        sse = np.zeros((len(alpha), n_series))
+        for t in range(2, n_periods):
+            prediction = level + trend
+            error = y[:, t] - prediction
+            sse += error ** 2
+            new_level = prediction + alpha * error
+            trend = trend + beta * (new_level - level - trend)
+            level = new_level
+        
+        best = sse.argmin(axis=0)
+        series = np.arange(n_series)
+        return cls(level[best, series], trend[best, series], alpha[best, 0], beta[best, 0],
+                   np.sqrt(sse[best, series] / (n_periods - 2)))
+    
+    def predict(self, horizon, z=Z_95):
+        """Point forecasts and prediction interval half-widths, as (series x horizon) arrays"""
+        steps = np.arange(1, horizon + 1)
+        forecast = self.level[:, None] + self.trend[:, None] * steps
+        # Forecast variance grows with the smoothed errors carried forward
+        carried = (self.alpha[:, None] * (1 + self.beta[:, None] * steps[:-1])) ** 2
+        variance = 1 + np.concatenate([np.zeros((len(self.level), 1)), np.cumsum(carried, axis=1)], axis=1)
+        interval = z * self.residual_std[:, None] * np.sqrt(variance)
+        return forecast, interval
+
+def monthly_panel(keys, months, values, first_month, n_months):
+    """Sum values into a (key x month) array
+    
+    `months` are integer month numbers (year * 12 + month - 1); values outside
+    the `n_months` months from `first_month` are left out. Returns the keys in
+    row order and the array.
+    """
+    codes, labels = pd.factorize(keys, sort=True)
+    period = np.asarray(months) - first_month
+    inside = (period >= 0) & (period < n_months) & (codes >= 0)
+    cells = codes[inside] * n_months + period[inside]
+    totals = np.bincount(cells, weights=np.asarray(values, dtype=float)[inside],
+                         minlength=len(labels) * n_months)
+    return labels.tolist(), totals.reshape(len(labels), n_months)
+
+# Panels with fewer series are backtested in-process: starting worker
+# processes costs more than it saves
+PARALLEL_MIN_SERIES = 2000
+
+class BacktestResult:
+    """Accuracy of a model over rolling-origin forecasts, per series
+    
+    Holds the error sums of every series plus the ratio of each forecast
+    error to its interval half-width, from which the intervals are calibrated.
+    """
+    
+    def __init__(self, abs_error, actual, ape, ape_count, covered, count, scores):
+        self.abs_error = abs_error
+        self.actual = actual
+        self.ape = ape
+        self.ape_count = ape_count
+        self.covered = covered
+        self.count = count
+        self.scores = scores
+    
+    @classmethod
+    def combine(cls, results):
+        """Merge the results of disjoint chunks of series, in order"""
+        return cls(*(np.concatenate([getattr(result, name) for result in results]) for name in
+                     ('abs_error', 'actual', 'ape', 'ape_count', 'covered', 'count', 'scores')))
+    
+    @property
+    def mape(self):
+        """Mean absolute percentage error per series, over periods with non-zero actuals"""
+        return np.divide(self.ape * 100, self.ape_count, out=np.full(len(self.ape), np.nan), where=self.ape_count > 0)
+    
+    @property
+    def wape(self):
+        """Weighted absolute percentage error per series: total error over total actuals"""
+        return np.divide(self.abs_error * 100, self.actual, out=np.full(len(self.actual), np.nan), where=self.actual > 0)
+    
+    @property
+    def coverage(self):
+        """Share of actuals that fell inside the model's prediction interval, per series"""
+        return np.divide(self.covered, self.count, out=np.full(len(self.count), np.nan), where=self.count > 0)
+    
+    def summary(self, rows=None):
+        """Overall accuracy, optionally of a subset of the series"""
+        rows = slice(None) if rows is None else rows
+        ape_count, actual, count = self.ape_count[rows].sum(), self.actual[rows].sum(), self.count[rows].sum()
+        return {
+            'mape': self.ape[rows].sum() * 100 / ape_count if ape_count else np.nan,
+            'wape': self.abs_error[rows].sum() * 100 / actual if actual else np.nan,
+            'coverage': self.covered[rows].sum() / count if count else np.nan,
+            'forecasts': int(count),
+        }
+    
+    def calibration(self, level=0.95):
+        """Factor to scale the model intervals by so that `level` of the backtest actuals fall inside"""
+        scores = self.scores[np.isfinite(self.scores)]
+        return float(np.quantile(scores, level)) if len(scores) else 1.0
+
+def _backtest_rows(history, model, horizon, min_train, options):
+    """Rolling-origin backtest of every row of a (series x periods) array"""
+    n_series, n_periods = history.shape
+    totals = {name: np.zeros(n_series) for name in ('abs_error', 'actual', 'ape', 'ape_count', 'covered', 'count')}
+    scores = []
+    for origin in range(min_train, n_periods):
+        steps = min(horizon, n_periods - origin)
+        forecast, interval = model.fit(history[:, :origin], **options).predict(steps)
+        actual = history[:, origin:origin + steps]
+        error = np.abs(actual - forecast)
+        nonzero = actual != 0
+        totals['abs_error'] += error.sum(axis=1)
+        totals['actual'] += np.abs(actual).sum(axis=1)
+        totals['ape'] += np.divide(error, np.abs(actual), out=np.zeros_like(error), where=nonzero).sum(axis=1)
+        totals['ape_count'] += nonzero.sum(axis=1)
+        totals['covered'] += (error <= interval).sum(axis=1)
+        totals['count'] += steps
+        scores.append(np.divide(error, interval, out=np.full_like(error, np.nan), where=interval > 0).ravel())
+    return BacktestResult(**totals, scores=np.concatenate(scores) if scores else np.zeros(0))
+
+def backtest(history, model=HoltModel, horizon=6, min_train=6, workers=None, **options):
+    """Rolling-origin evaluation of a model over a (series x periods) history
+    
+    The model is fitted on the first `min_train` periods, forecasts up to
+    `horizon` periods ahead and is scored against what followed; the origin
+    then moves forward one period at a time. Large panels are split into
+    chunks of series that are backtested in a process pool.
+    """
+    history = np.atleast_2d(np.asarray(history, dtype=float))
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or len(history) < PARALLEL_MIN_SERIES:
+        return _backtest_rows(history, model, horizon, min_train, options)
+    chunks = np.array_split(history, workers)
+    context = multiprocessing.get_context('spawn')
+    with concurrent.futures.ProcessPoolExecutor(workers, mp_context=context) as pool:
+        results = pool.map(_backtest_rows, chunks, *zip(*[(model, horizon, min_train, options)] * len(chunks)))
+        return BacktestResult.combine(list(results))
+
+class ForecastService:
+    """Fitted forecast models, kept per series with the data version they were fitted to"""
+    
+    def __init__(self, model=LinearTrendModel):
+        self.model_class = model
+        self.fits = 0
+        self._models = {}
+        self._backtests = {}
+        self._lock = threading.Lock()
+    
+    def _cached(self, store, key, version, compute):
+        """Reuse the entry for `key` while its data version is unchanged"""
+        with self._lock:
+            entry = store.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        value = compute()
+        with self._lock:
+            store[key] = (version, value)
+        return value
+    
+    def model(self, key, version, history, model=None, **options):
+        """The model for a series, refitted only when its data version changed
+        
+        `history` is a callable returning the series (or a panel of series for
+        HoltModel), so the data is only read when a refit is needed. `model`
+        overrides the service's model class for this key.
+        """
+        def fit():
+            with self._lock:
+                self.fits += 1
+            return (model or self.model_class).fit(history(), **options)
+        return self._cached(self._models, key, version, fit)
+    
+    def forecast(self, key, version, history, horizon, model=None, **options):
+        """Point forecasts and interval half-widths for a series"""
+        return self.model(key, version, history, model, **options).predict(horizon)
+    
+    def backtest(self, key, version, history, model=None, horizon=6, min_train=6, **options):
+        """Rolling-origin backtest of a series or panel, rerun only when its data version changed"""
+        return self._cached(self._backtests, key, version,
+                            lambda: backtest(history(), model or self.model_class, horizon, min_train, **options))
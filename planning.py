@@ -0,0 +1,469 @@
+"""Inventory planning for the manufacturing portal.
+
+Plans cover the whole catalogue in one vectorized pass: an item is a SKU at
+one location, and every function takes and returns one array (or column)
+per attribute with an entry per item. reorder_plan() is a lightweight MRP
+run: it nets open purchase orders against each item's reorder point, the
+demand over its supplier's lead time plus safety stock. rank_reorders()
+then orders the items due for reorder by how soon they run out.
+
+DemandProfile keeps the monthly demand of every item from the stock
+movements, updated as new movements land, and classify_items() sorts the
+items into the ABC (consumption value) by XYZ (demand variability) matrix
+whose cells carry a replenishment policy. stock_policy() sizes the
+order quantity, safety stock and min/max levels of every item for the
+service level of its cell. StockLedger answers the stock of an item at a
+location as of any date from the same movements.
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+# ============================================
+# REORDER PLANNING
+# ============================================
+
+# Inventory items stocked under another name than the supplier material
+MATERIAL_ALIASES = {'Electrical Parts': 'Electrical Components', 'Packaging': 'Packaging Material',
+                    'Tools': 'CNC Tools'}
+
+# Lead time in days of the items no supplier provides, which are made in-house
+IN_HOUSE_LEAD_TIME = 7
+
+def material_suppliers(suppliers):
+    """The supplier each material is bought from: the fastest active one, then the best rated
+    
+    Returns a DataFrame indexed by material with the supplier's id, name and
+    lead time.
+    """
+    offers = suppliers.loc[suppliers['status'] == 'Active', ['supplier_id', 'name', 'lead_time', 'rating', 'materials']]
+    offers = offers.explode('materials').dropna(subset=['materials'])
+    offers = offers.sort_values(['lead_time', 'rating'], ascending=[True, False], kind='stable')
+    return offers.drop_duplicates('materials').set_index('materials')[['supplier_id', 'name', 'lead_time']]
+
+def item_suppliers(names, suppliers):
+    """Supplier name and lead time of every item, by its material
+    
+    Items no active supplier provides are made in-house, with the in-house
+    lead time. Each distinct name is looked up once.
+    """
+    sources = material_suppliers(suppliers)
+    codes, distinct = pd.factorize(names)
+    positions = sources.index.get_indexer(pd.Series(distinct, dtype=object).replace(MATERIAL_ALIASES))
+    found = positions >= 0
+    supplier = np.where(found, sources['name'].to_numpy(object)[positions], 'In-house')
+    lead_time = np.where(found, sources['lead_time'].to_numpy()[positions], IN_HOUSE_LEAD_TIME)
+    return supplier[codes], lead_time[codes]
+
+def open_quantities(item_ids, order_item_ids, order_quantities):
+    """Quantity on open orders of every item, summed over its orders"""
+    totals = pd.Series(np.asarray(order_quantities, dtype=float)).groupby(np.asarray(order_item_ids, dtype=object)).sum()
+    if totals.empty:
+        return np.zeros(len(item_ids))
+    positions = totals.index.get_indexer(item_ids)
+    return np.where(positions >= 0, totals.to_numpy()[positions], 0)
+
+def unit_costs(value, min_stock, max_stock):
+    """Cost of one unit of every item
+    
+    The static stock value of an item is spread over its typical stock,
+    midway between its min and max, rather than over its current stock,
+    which moves with every receipt and issue.
+    """
+    typical = (np.asarray(min_stock, dtype=float) + np.asarray(max_stock, dtype=float)) / 2
+    return np.asarray(value, dtype=float) / np.maximum(typical, 1)
+
+def reorder_plan(on_hand, on_order, daily_demand, lead_time, safety_stock, max_stock):
+    """Reorder point, order quantity and urgency of every item
+    
+    An item is due once its inventory position, the stock on hand plus the
+    open orders, is at or below its reorder point: its demand over the lead
+    time plus its safety stock. It is then ordered up to its max stock, or
+    one lead time's demand above the reorder point when the max is lower.
+    Days of cover count how long the position lasts at the demand rate;
+    items with less cover than lead time run out before an order placed now
+    arrives and are critical. Returns a DataFrame with a row per item.
+    """
+    on_hand, on_order, daily_demand, lead_time, safety_stock, max_stock = (
+        np.asarray(values, dtype=float) for values in
+        (on_hand, on_order, daily_demand, lead_time, safety_stock, max_stock))
+    position = on_hand + on_order
+    lead_time_demand = daily_demand * lead_time
+    reorder_point = np.ceil(lead_time_demand + safety_stock)
+    order_up_to = np.maximum(max_stock, reorder_point + lead_time_demand)
+    due = position <= reorder_point
+    cover = np.divide(position, daily_demand, out=np.full(len(position), np.inf), where=daily_demand > 0)
+    return pd.DataFrame({
+        'position': position,
+        'reorder_point': reorder_point,
+        'order_qty': np.where(due, np.ceil(order_up_to - position), 0).astype(np.int64),
+        'days_of_cover': cover,
+        'due': due & (order_up_to > position),
+        'critical': cover < lead_time,
+    })
+
+def rank_reorders(plan, lead_time):
+    """Positions of the items due for reorder, the ones with the least cover beyond their lead time first"""
+    due = np.flatnonzero(plan['due'].to_numpy())
+    slack = plan['days_of_cover'].to_numpy()[due] - np.asarray(lead_time, dtype=float)[due]
+    return due[np.argsort(slack, kind='stable')]
+
+# ============================================
+# ABC/XYZ CLASSIFICATION
+# ============================================
+
+# Cumulative shares of the consumption value that close the A and B classes
+ABC_LIMITS = (0.8, 0.95)
+# Coefficients of variation of the monthly demand that close the X and Y classes
+XYZ_LIMITS = (0.5, 1.0)
+
+# Replenishment policy and target service level of each ABC/XYZ cell
+CLASS_POLICIES = {
+    'AX': ('Automatic continuous replenishment, lean safety stock', 0.98),
+    'AY': ('Continuous review, safety stock sized to the variability', 0.97),
+    'AZ': ('Order against confirmed demand, reviewed weekly', 0.95),
+    'BX': ('Periodic review with automatic orders', 0.97),
+    'BY': ('Periodic review', 0.95),
+    'BZ': ('Periodic review, order against demand', 0.93),
+    'CX': ('Bulk orders, infrequent review', 0.95),
+    'CY': ('Bulk orders with a generous safety stock', 0.92),
+    'CZ': ('Order on request, or stock generously if cheap', 0.90),
+}
+
+def month_number(dates):
+    """Calendar month numbers (year * 12 + month - 1) of a datetime column"""
+    dates = pd.to_datetime(pd.Series(dates))
+    return (dates.dt.year * 12 + dates.dt.month - 1).to_numpy()
+
+class DemandProfile:
+    """Quantity issued of every item per calendar month, kept up to date as movements land
+    
+    rebuild() reads the whole movement history once; add() then folds in
+    only the new movements, so the profile never rescans the history. Items
+    and months first seen in new movements are added as they appear.
+    """
+    
+    def __init__(self):
+        self.rebuild(None)
+    
+    def rebuild(self, movements):
+        """Recompute the profile from the whole movement history"""
+        self.rows = {}
+        self.first_month = None
+        self.demand = np.zeros((0, 0))
+        self._items = None
+        if movements is not None:
+            self.add(movements)
+    
+    def add(self, movements):
+        """Fold in movements: a frame with item_id, date, type and quantity columns"""
+        issues = movements[movements['type'] == 'Issue']
+        if issues.empty:
+            return
+        codes, items = pd.factorize(issues['item_id'])
+        rows = np.array([self.rows.setdefault(item, len(self.rows)) for item in items])
+        months = month_number(issues['date'])
+        
+        # The array only grows when new items or months turn up
+        first, last = months.min(), months.max()
+        if self.first_month is not None:
+            first, last = min(first, self.first_month), max(last, self.first_month + self.demand.shape[1] - 1)
+        shape = (len(self.rows), last - first + 1)
+        if shape != self.demand.shape:
+            grown = np.zeros(shape)
+            offset = 0 if self.first_month is None else self.first_month - first
+            grown[:self.demand.shape[0], offset:offset + self.demand.shape[1]] = self.demand
+            self.demand, self.first_month, self._items = grown, first, None
+        
+        # Issues are booked as negative quantities
+        cells = rows[codes] * shape[1] + (months - first)
+        self.demand += np.bincount(cells, weights=-issues['quantity'].to_numpy(float),
+                                   minlength=self.demand.size).reshape(shape)
+    
+    def history(self, item_ids, end_month, months):
+        """Demand of items over the `months` months before `end_month`, as an (item x month) array
+        
+        Items and months without issues are zeros.
+        """
+        history = np.zeros((len(item_ids), months))
+        if self.first_month is None:
+            return history
+        if self._items is None:
+            self._items = pd.Index(list(self.rows))
+        rows = self._items.get_indexer(item_ids)
+        known = np.flatnonzero(rows >= 0)
+        start = end_month - months
+        low, high = max(start, self.first_month), min(end_month, self.first_month + self.demand.shape[1])
+        if low < high:
+            history[known, low - start:high - start] = \
+                self.demand[rows[known], low - self.first_month:high - self.first_month]
+        return history
+
+def abc_classes(values, limits=ABC_LIMITS):
+    """ABC class codes (0 = A, 1 = B, 2 = C) of items by their share of the total value
+    
+    Items are ranked by value; those within the first `limits[0]` of the
+    cumulative value are A, up to `limits[1]` B and the rest C.
+    """
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(-values, kind='stable')
+    total = values.sum()
+    share = np.cumsum(values[order]) / total if total > 0 else np.ones(len(values))
+    classes = np.empty(len(values), dtype=np.int8)
+    classes[order] = np.searchsorted(limits, share, side='left')
+    return classes
+
+def xyz_classes(variation, limits=XYZ_LIMITS):
+    """XYZ class codes (0 = X, 1 = Y, 2 = Z) of items by the coefficient of variation of their demand"""
+    return np.searchsorted(limits, np.asarray(variation, dtype=float), side='left').astype(np.int8)
+
+def classify_items(history, unit_cost):
+    """ABC/XYZ class of every item from its (item x month) demand history
+    
+    ABC ranks the consumption value over the history, XYZ the coefficient
+    of variation of the monthly demand. Items without demand are CZ.
+    Returns a DataFrame with a row per item.
+    """
+    history = np.asarray(history, dtype=float)
+    mean = history.mean(axis=1) if history.shape[1] else np.zeros(len(history))
+    std = history.std(axis=1) if history.shape[1] else np.zeros(len(history))
+    variation = np.divide(std, mean, out=np.full(len(mean), np.inf), where=mean > 0)
+    consumption_value = history.sum(axis=1) * np.asarray(unit_cost, dtype=float)
+    abc = abc_classes(consumption_value)
+    xyz = xyz_classes(variation)
+    cells = [f'{a}{x}' for a in 'ABC' for x in 'XYZ']
+    return pd.DataFrame({
+        'monthly_demand': mean,
+        'demand_std': std,
+        'variation': variation,
+        'consumption_value': consumption_value,
+        'abc': pd.Categorical.from_codes(abc, ['A', 'B', 'C']),
+        'xyz': pd.Categorical.from_codes(xyz, ['X', 'Y', 'Z']),
+        'class': pd.Categorical.from_codes(abc * 3 + xyz, cells),
+    })
+
+def class_matrix(classes):
+    """The 9-cell ABC/XYZ matrix: items, consumption value and policy of every cell"""
+    cells = classes.groupby('class', observed=False)['consumption_value'].agg(['size', 'sum'])
+    total = cells['sum'].sum()
+    return pd.DataFrame({
+        'ABC': [cell[0] for cell in cells.index],
+        'XYZ': [cell[1] for cell in cells.index],
+        'Items': cells['size'].to_numpy(),
+        'Consumption Value': cells['sum'].to_numpy(),
+        'Value Share %': cells['sum'].to_numpy() * 100 / total if total > 0 else 0.0,
+        'Policy': [CLASS_POLICIES[cell][0] for cell in cells.index],
+        'Service Level %': [CLASS_POLICIES[cell][1] * 100 for cell in cells.index],
+    }, index=pd.Index(cells.index.astype(str), name='Class'))
+
+# ============================================
+# ORDER QUANTITIES AND SAFETY STOCK
+# ============================================
+
+# Cost of placing one purchase order, or setting up one in-house batch
+ORDER_COST = 500
+# Yearly cost of holding stock, as a share of its value
+HOLDING_RATE = 0.25
+# Days of demand in a month of the demand profile
+DAYS_PER_MONTH = 30
+
+def service_levels(classes, levels=None):
+    """Target service level of every item from its ABC/XYZ class, with `levels` overriding cells"""
+    targets = {cell: level for cell, (_, level) in CLASS_POLICIES.items()}
+    targets.update(levels or {})
+    classes = pd.Categorical(classes)
+    return np.array([targets[cell] for cell in classes.categories], dtype=float)[classes.codes]
+
+def safety_factors(levels):
+    """Standard normal quantile of every service level, the z of its safety stock
+    
+    Levels under 50% need no safety stock. Each distinct level is looked up once.
+    """
+    distinct, codes = np.unique(np.clip(np.asarray(levels, dtype=float), 0.5, 0.9999), return_inverse=True)
+    return np.array([NormalDist().inv_cdf(level) for level in distinct])[codes]
+
+def stock_policy(daily_demand, daily_std, lead_time, unit_cost, service_level,
+                 order_cost=ORDER_COST, holding_rate=HOLDING_RATE):
+    """Economic order quantity, safety stock and recommended min and max stock of every item
+    
+    The EOQ balances the yearly cost of ordering against the cost of
+    holding the cycle stock. The safety stock covers the variability of
+    the demand over the lead time at the item's service level, z times the
+    daily standard deviation times the square root of the lead time. The
+    recommended min is the reorder point, the lead time demand plus the
+    safety stock, and the max is one EOQ above it. Returns a DataFrame with
+    a row per item and its yearly holding and ordering costs.
+    """
+    daily_demand, daily_std, lead_time, unit_cost = (
+        np.asarray(values, dtype=float) for values in (daily_demand, daily_std, lead_time, unit_cost))
+    yearly_demand = daily_demand * 365
+    holding = holding_rate * unit_cost
+    eoq = np.ceil(np.sqrt(np.divide(2 * yearly_demand * order_cost, holding, out=np.zeros(len(holding)),
+                                    where=holding > 0)))
+    safety_stock = np.ceil(safety_factors(service_level) * daily_std * np.sqrt(lead_time))
+    reorder_point = np.ceil(daily_demand * lead_time + safety_stock)
+    orders = np.divide(yearly_demand, eoq, out=np.zeros(len(eoq)), where=eoq > 0)
+    return pd.DataFrame({
+        'eoq': eoq.astype(np.int64),
+        'safety_stock': safety_stock.astype(np.int64),
+        'min_stock': reorder_point.astype(np.int64),
+        'max_stock': (reorder_point + eoq).astype(np.int64),
+        'orders_per_year': orders,
+        'holding_cost': holding * (eoq / 2 + safety_stock),
+        'ordering_cost': orders * order_cost,
+    })
+
+# ============================================
+# STOCK LEDGER
+# ============================================
+
+# Movements a ledger holds outside its sorted arrays before it merges them in
+LEDGER_CHECKPOINT_ROWS = 4096
+
+def epoch_seconds(dates):
+    """Whole seconds since 1970 of datetimes, as int64"""
+    return pd.to_datetime(pd.Series(dates)).to_numpy('datetime64[s]').astype(np.int64)
+
+class StockLedger:
+    """Stock balance of every item at every location over time, from the movements booked against it
+    
+    Movements are kept sorted by item and location, then time, with the
+    balance after each one computed by a cumulative sum, so the stock of an
+    item at a location as of any moment is one binary search. New movements
+    wait in a short tail that queries add in, and are merged into the sorted
+    arrays (a checkpoint) once LEDGER_CHECKPOINT_ROWS of them have gathered.
+    The current stock of every item and location, and the units and items
+    stocked at every location, are updated with each movement added, so
+    reading them never touches the history.
+    """
+    
+    def __init__(self, checkpoint_rows=LEDGER_CHECKPOINT_ROWS):
+        self.checkpoint_rows = checkpoint_rows
+        self.rebuild(None)
+    
+    def rebuild(self, movements):
+        """Recompute the ledger from the whole movement history"""
+        self.keys = {}
+        self.stock = np.zeros(0, dtype=np.int64)
+        # Location of every key, and the units and items (keys with stock) of every location
+        self.places = {}
+        self.place_of = np.zeros(0, dtype=np.int64)
+        self.place_stock = np.zeros(0, dtype=np.int64)
+        self.place_items = np.zeros(0, dtype=np.int64)
+        # Sorted (key code << 32 | epoch second) of every movement, its quantity and the balance after it
+        self.stamps = np.zeros(0, dtype=np.int64)
+        self.quantity = np.zeros(0, dtype=np.int64)
+        self.balance = np.zeros(0, dtype=np.int64)
+        self._tail = []
+        self._tail_rows = 0
+        if movements is not None:
+            self.add(movements)
+            self.checkpoint()
+    
+    def codes(self, item_ids, locations, create=False):
+        """Key codes of (item, location) pairs; unknown pairs are -1 unless `create` adds them"""
+        item_codes, items = pd.factorize(pd.Series(item_ids))
+        location_codes, places = pd.factorize(pd.Series(locations))
+        pair_codes, pairs = pd.factorize(item_codes * len(places) + location_codes)
+        items, places = np.asarray(items, dtype=object), np.asarray(places, dtype=object)
+        keys = list(zip(items[pairs // len(places)], places[pairs % len(places)]))
+        if not create:
+            return np.array([self.keys.get(key, -1) for key in keys], dtype=np.int64)[pair_codes]
+        known = len(self.keys)
+        if known:
+            codes = np.array([self.keys.setdefault(key, len(self.keys)) for key in keys], dtype=np.int64)
+        else:
+            self.keys = dict(zip(keys, range(len(keys))))
+            codes = np.arange(len(keys))
+        # New keys were numbered in order of appearance
+        new = [place for (_, place), code in zip(keys, codes) if code >= known]
+        self.place_of = np.concatenate([self.place_of, np.array(
+            [self.places.setdefault(place, len(self.places)) for place in new], dtype=np.int64)])
+        if len(self.places) > len(self.place_stock):
+            grow = np.zeros(len(self.places) - len(self.place_stock), dtype=np.int64)
+            self.place_stock = np.concatenate([self.place_stock, grow])
+            self.place_items = np.concatenate([self.place_items, grow])
+        return codes[pair_codes]
+    
+    def add(self, movements):
+        """Book movements: a frame with item_id, location, date and signed quantity columns"""
+        if movements.empty:
+            return
+        codes = self.codes(movements['item_id'], movements['location'], create=True)
+        quantity = movements['quantity'].to_numpy(np.int64)
+        if len(self.keys) > len(self.stock):
+            self.stock = np.concatenate([self.stock, np.zeros(len(self.keys) - len(self.stock), dtype=np.int64)])
+        touched = pd.unique(codes)
+        stocked = self.stock[touched] > 0
+        np.add.at(self.stock, codes, quantity)
+        np.add.at(self.place_stock, self.place_of[codes], quantity)
+        # Items count at a location while their stock there is positive
+        np.add.at(self.place_items, self.place_of[touched], (self.stock[touched] > 0).astype(np.int64) - stocked)
+        self._tail.append((codes, epoch_seconds(movements['date']), quantity))
+        self._tail_rows += len(codes)
+        if self._tail_rows >= self.checkpoint_rows:
+            self.checkpoint()
+    
+    def checkpoint(self):
+        """Merge the tail into the sorted arrays and recompute the running balances"""
+        if not self._tail:
+            return
+        codes, seconds, quantity = (np.concatenate(parts) for parts in zip(*self._tail))
+        stamps = codes << 32 | seconds
+        order = np.argsort(stamps, kind='stable')
+        positions = np.searchsorted(self.stamps, stamps[order], side='right')
+        stamps = np.insert(self.stamps, positions, stamps[order])
+        quantity = np.insert(self.quantity, positions, quantity[order])
+        
+        # Running total, restarted at the first movement of every key
+        total = np.cumsum(quantity)
+        first = np.flatnonzero(np.diff(stamps >> 32, prepend=-1))
+        opening = total[first] - quantity[first]
+        balance = total - np.repeat(opening, np.diff(np.append(first, len(stamps))))
+        self.stamps, self.quantity, self.balance = stamps, quantity, balance
+        self._tail, self._tail_rows = [], 0
+    
+    def current(self, item_ids, locations):
+        """Stock of items at locations now"""
+        codes = self.codes(item_ids, locations)
+        return np.where(codes >= 0, self.stock[np.maximum(codes, 0)] if len(self.stock) else 0, 0)
+    
+    def usage(self):
+        """Units in stock and items stocked at every location, as a frame indexed by location"""
+        return pd.DataFrame({'stock': self.place_stock, 'items': self.place_items},
+                            index=pd.Index(list(self.places), name='location'))
+    
+    def stock_at(self, item_ids, locations, as_of):
+        """Stock of items at locations as of a moment, counting the movements booked up to it"""
+        codes = self.codes(item_ids, locations)
+        second = epoch_seconds([as_of])[0]
+        at = np.searchsorted(self.stamps, np.maximum(codes, 0) << 32 | second, side='right') - 1
+        stock = np.zeros(len(codes), dtype=np.int64)
+        if len(self.stamps):
+            found = (at >= 0) & (self.stamps[np.maximum(at, 0)] >> 32 == codes)
+            stock[found] = self.balance[at[found]]
+        if self._tail:
+            tail_codes, seconds, quantity = (np.concatenate(parts) for parts in zip(*self._tail))
+            booked = seconds <= second
+            totals = np.bincount(tail_codes[booked], weights=quantity[booked], minlength=len(self.keys))
+            stock += np.where(codes >= 0, totals[np.maximum(codes, 0)], 0).astype(np.int64)
+        return stock
+    
+    def history(self, item_id, location):
+        """Movements of one item at one location in time order, with the balance after each"""
+        code = self.keys.get((item_id, location), -1)
+        low, high = np.searchsorted(self.stamps, [code << 32, (code + 1) << 32])
+        seconds, quantity = self.stamps[low:high] & 0xFFFFFFFF, self.quantity[low:high]
+        if self._tail:
+            tail_codes, tail_seconds, tail_quantity = (np.concatenate(parts) for parts in zip(*self._tail))
+            mine = tail_codes == code
+            seconds = np.concatenate([seconds, tail_seconds[mine]])
+            quantity = np.concatenate([quantity, tail_quantity[mine]])
+        order = np.argsort(seconds, kind='stable')
+        return pd.DataFrame({
+            'date': seconds[order].astype('datetime64[s]'),
+            'quantity': quantity[order],
+            'balance': np.cumsum(quantity[order]),
+        })
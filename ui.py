@@ -0,0 +1,177 @@
+"""Streamlit building blocks shared by the portal pages: section timings,
+tabs that render only the open tab, card lists, cached charts and the
+stylesheet."""
+
+import streamlit as st
+import pandas as pd
+import contextlib
+import functools
+import os
+import string
+import threading
+import time
+from datetime import date
+
+# ============================================
+# SECTION TIMINGS
+# ============================================
+
+def record_timing(name, seconds):
+    """Add the time spent in a section to this run's section timings"""
+    timings = st.session_state.setdefault('section_timings', {})
+    timings[name] = timings.get(name, 0.0) + seconds
+
+@contextlib.contextmanager
+def timed_section(name):
+    """Time the enclosed block as a named section of the current run"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, time.perf_counter() - start)
+
+class SectionTimer:
+    """Time consecutive sections of a page, each ending where the next starts"""
+    
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.name = None
+        self.start = None
+    
+    def section(self, name):
+        self.stop()
+        self.name = name
+        self.start = time.perf_counter()
+    
+    def stop(self):
+        if self.name is not None:
+            record_timing(f"{self.prefix}/{self.name}", time.perf_counter() - self.start)
+            self.name = None
+
+# Set by the first script run of the server process to draw its page
+_painted = threading.Event()
+
+def record_paint(run_start, section='first_paint'):
+    """Time from the start of the script run to now, as a section of the run
+    
+    `first_paint` is recorded once the sidebar, the first content of a page,
+    starts drawing, and `run` once the page is complete. The first run of a
+    server process, which imports the modules and builds the shared datasets,
+    also records its `run` as `cold_start`.
+    """
+    seconds = time.perf_counter() - run_start
+    record_timing(section, seconds)
+    if section == 'run' and not _painted.is_set():
+        _painted.set()
+        record_timing('cold_start', seconds)
+
+def render_tabs(prefix, tabs):
+    """Tabs that run only the selected tab's function, timed as a section of the page
+    
+    `tabs` maps each label to the function drawing it. Switching tabs reruns
+    the page with the new tab open; the others stay empty.
+    """
+    containers = st.tabs(list(tabs), key=f"{prefix}_tab", on_change="rerun")
+    for (label, render), container in zip(tabs.items(), containers):
+        if container.open:
+            with container, timed_section(f"{prefix}/{label}"):
+                render()
+
+# ============================================
+# CARD LISTS
+# ============================================
+
+# Cards drawn per page of a card list
+CARD_PAGE_SIZE = 20
+
+def _format_column(column, spec):
+    """A column as strings, formatted with a str.format spec"""
+    if not spec:
+        return column.astype(str)
+    if pd.api.types.is_datetime64_any_dtype(column):
+        return column.dt.strftime(spec)
+    return column.map(lambda value: format(value, spec)).astype(str)
+
+def format_cards(rows, template):
+    """The HTML of one card per row of a DataFrame
+    
+    `template` holds str.format fields naming columns of `rows`, with optional
+    format specs ('{amount:,.0f}', '{order_date:%Y-%m-%d}'). It is parsed once
+    and filled a column at a time, so the cards cost a few vectorized string
+    concatenations rather than a format call per row. Line breaks and
+    indentation are collapsed, keeping the joined cards one HTML block.
+    """
+    if len(rows) == 0:
+        return pd.Series([], dtype=str)
+    template = ' '.join(line.strip() for line in template.strip().splitlines())
+    html = pd.Series('', index=rows.index, dtype=str)
+    for literal, field, spec, _ in string.Formatter().parse(template):
+        html = html + literal
+        if field is not None:
+            html = html + _format_column(rows[field], spec)
+    return html
+
+def render_cards(rows, template, key, page_size=CARD_PAGE_SIZE, columns=1):
+    """Draw a list of cards as one markdown element, a page at a time
+    
+    `rows` is a DataFrame, or a list of dicts, filling `template` (see
+    format_cards). Only the cards of the page shown are formatted and sent;
+    lists longer than `page_size` get a page picker under the cards, with
+    widget key `key`. With `columns` above 1 the cards are laid out in a grid.
+    """
+    rows = pd.DataFrame(rows)
+    pages = max(1, -(-len(rows) // page_size))
+    cards = st.container()
+    page = 1
+    if pages > 1:
+        # The list may have shrunk since the picker was last used
+        if st.session_state.get(key, 1) > pages:
+            st.session_state[key] = pages
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=key)
+        start = (page - 1) * page_size
+        with col2:
+            st.caption(f"Showing {start + 1}–{min(start + page_size, len(rows))} of {len(rows)}")
+    shown = rows.iloc[(page - 1) * page_size:page * page_size]
+    style = f' style="display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 1rem;"' if columns > 1 else ''
+    cards.markdown(f'<div class="card-list"{style}>{"".join(format_cards(shown, template))}</div>',
+                   unsafe_allow_html=True)
+
+# ============================================
+# CHARTS
+# ============================================
+
+def cached_chart(chart_id, tables, build, dated=False, **options):
+    """Draw a Plotly chart, building its figure only when its data changed
+    
+    `build` returns the figure of chart `chart_id` from the portal `tables`.
+    The figure is memoized by the portal under the chart id and the theme, so
+    it is rebuilt only when one of the tables changes, and is shared by all
+    sessions reading the same data. A `dated` chart plots results that depend
+    on today's date, which then joins its key. Building is timed as the
+    `charts/build` section and Streamlit's serialization of the figure as
+    `charts/serialize`.
+    """
+    theme = (options.get('theme', 'streamlit'), st.context.theme.type)
+    
+    def build_timed():
+        with timed_section('charts/build'):
+            return build()
+    
+    key = ('chart', chart_id, theme) + ((date.today(),) if dated else ())
+    figure = st.session_state.portal.memoize(key, tables, build_timed)
+    with timed_section('charts/serialize'):
+        st.plotly_chart(figure, **options)
+
+# ============================================
+# STYLESHEET
+# ============================================
+
+STYLESHEET = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles.css')
+
+@functools.lru_cache(maxsize=None)
+def load_stylesheet(path=STYLESHEET):
+    """The portal's CSS, read from disk once per process"""
+    with open(path) as handle:
+        return handle.read()
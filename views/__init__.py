@@ -0,0 +1,36 @@
+"""Pages of the manufacturing portal.
+
+PAGES lists every page for the sidebar without importing any of them: a
+page's module, and the plotting and other libraries only it needs, is
+imported the first time the page is opened.
+"""
+
+import importlib
+import sys
+
+from ui import timed_section
+
+PAGES = [
+    {"icon": "📊", "name": "Dashboard", "key": "dashboard", "module": "views.dashboard", "render": "dashboard_page"},
+    {"icon": "🏭", "name": "Production", "key": "production", "module": "views.production", "render": "production_page"},
+    {"icon": "📦", "name": "Inventory", "key": "inventory", "module": "views.inventory", "render": "inventory_page"},
+    {"icon": "💰", "name": "Sales & Orders", "key": "sales", "module": "views.sales", "render": "sales_orders_page"},
+    {"icon": "👥", "name": "Customers", "key": "customers", "module": "views.customers", "render": "customers_page"},
+    {"icon": "📈", "name": "Finance", "key": "finance", "module": "views.finance", "render": "finance_page"},
+    {"icon": "🎯", "name": "Marketing", "key": "marketing", "module": "views.marketing", "render": "marketing_page"},
+    {"icon": "🤖", "name": "AI Assistant", "key": "ai", "module": "views.assistant", "render": "ai_assistant_page"},
+    {"icon": "⚙️", "name": "Settings", "key": "settings", "module": "views.settings", "render": "settings_page"}
+]
+PAGES_BY_KEY = {page["key"]: page for page in PAGES}
+
+def load_page(key):
+    """The function drawing a page, importing its module on first use
+    
+    The import is timed as the `import/<page>` section of the run.
+    """
+    page = PAGES_BY_KEY[key]
+    module = sys.modules.get(page["module"])
+    if module is None:
+        with timed_section(f"import/{key}"):
+            module = importlib.import_module(page["module"])
+    return getattr(module, page["render"])
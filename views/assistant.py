@@ -0,0 +1,1013 @@
+"""AI Assistant page: chat, predictive analytics, process optimization and Grok"""
+
+import streamlit as st
+import pandas as pd
+import datetime
+from datetime import date, timedelta
+import plotly.express as px
+import plotly.graph_objects as go
+import random
+
+from ui import cached_chart, render_cards, render_tabs
+from analytics import DEMAND_GROUPS, create_ai_forecast, generate_ai_recommendations, get_demand_forecasts, get_forecast_accuracy, get_production_efficiency
+
+def ai_assistant_page():
+    """AI Assistant page"""
+    st.markdown('<h1 class="main-header">🤖 AI Manufacturing Assistant</h1>', unsafe_allow_html=True)
+    
+    render_tabs('ai', {
+        "Chat Assistant": chat_assistant_tab,
+        "Predictive Analytics": predictive_analytics_tab,
+        "Process Optimization": process_optimization_tab,
+        "Grok AI": grok_ai_tab
+    })
+
+def process_optimization_tab():
+    """Process Optimization tab"""
+    st.markdown('<h2 class="section-header">Process Optimization</h2>', unsafe_allow_html=True)
+    
+    # AI recommendations
+    recommendations = generate_ai_recommendations()
+    
+    st.markdown('<h3 class="subsection-header">🎯 AI Optimization Recommendations</h3>', unsafe_allow_html=True)
+    
+    if recommendations:
+        priority_colors = {
+            'high': '#DC3545',
+            'medium': '#FF8C00',
+            'low': '#006400'
+        }
+        recommendations = [dict(rec, priority_color=priority_colors[rec['priority']], priority_label=rec['priority'].upper())
+                           for rec in recommendations]
+        
+        render_cards(recommendations, '''
+            <div class="widget-card">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <h4>{title}</h4>
+                    <span style="background-color: {priority_color}; 
+                                color: white; padding: 4px 12px; border-radius: 15px; 
+                                font-size: 0.9rem; font-weight: 600;">
+                        {priority_label}
+                    </span>
+                </div>
+                <p style="color: #666; font-size: 1rem;">{description}</p>
+                <div style="margin-top: 15px; padding: 10px; background-color: #f8f9fa; border-radius: 10px;">
+                    <strong>📌 Action:</strong> {action}<br>
+                    <strong>🎯 Impact:</strong> {impact}
+                </div>
+            </div>
+        ''', key='ai_recommendations_page', columns=min(3, len(recommendations)))
+    else:
+        st.info("No optimization recommendations at this time")
+    
+    # Process efficiency analysis
+    st.markdown('<h3 class="subsection-header">📊 Process Efficiency Analysis</h3>', unsafe_allow_html=True)
+    
+    efficiency_data = get_production_efficiency()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Overall Equipment Effectiveness", f"{efficiency_data['metrics']['avg_oee']:.1f}%",
+                 "World class: >85%")
+    
+    with col2:
+        st.metric("Defect Rate", f"{efficiency_data['metrics']['avg_defect_rate']:.2f}%",
+                 "Target: <1.5%")
+    
+    with col3:
+        st.metric("Total Downtime", f"{efficiency_data['metrics']['total_downtime']/60:.1f} hours",
+                 "Last 30 days")
+    
+    with col4:
+        st.metric("Capacity Utilization", f"{efficiency_data['metrics']['utilization']:.1f}%",
+                 "Optimal: 85-90%")
+    
+    # Efficiency trend
+    fig = px.line(
+        efficiency_data['data'],
+        x='date',
+        y='oee',
+        title='OEE Trend (Last 30 Days)',
+        markers=True
+    )
+    
+    fig.add_hline(y=85, line_dash="dash", line_color="green", annotation_text="World Class")
+    fig.add_hline(y=65, line_dash="dash", line_color="red", annotation_text="Minimum Target")
+    
+    fig.update_layout(
+        height=400,
+        xaxis_title="Date",
+        yaxis_title="OEE (%)",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Cost optimization
+    st.markdown('<h3 class="subsection-header">💰 Cost Optimization Opportunities</h3>', unsafe_allow_html=True)
+    
+    cost_opportunities = [
+        {"area": "Energy Consumption", "savings": "₹45,000/month", "action": "Install smart meters", "payback": "8 months"},
+        {"area": "Raw Material Waste", "savings": "₹28,000/month", "action": "Implement lean manufacturing", "payback": "3 months"},
+        {"area": "Maintenance Costs", "savings": "₹15,000/month", "action": "Predictive maintenance", "payback": "6 months"},
+        {"area": "Logistics", "savings": "₹32,000/month", "action": "Optimize delivery routes", "payback": "4 months"}
+    ]
+    
+    render_cards(cost_opportunities, '''
+        <div style="padding: 12px; margin: 8px 0; border-radius: 8px; background: #f8f9fa; border-left: 4px solid #28a745;">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <div>
+                    <strong>{area}</strong><br>
+                    <span style="color: #666; font-size: 0.9rem;">{action}</span>
+                </div>
+                <div style="text-align: right;">
+                    <span style="color: #28a745; font-weight: 600;">{savings}</span><br>
+                    <span style="color: #666; font-size: 0.9rem;">Payback: {payback}</span>
+                </div>
+            </div>
+        </div>
+    ''', key='ai_cost_opportunities_page')
+
+@st.fragment
+def chat_assistant_tab():
+    """Chat Assistant tab"""
+    st.markdown('<h2 class="section-header">AI Chat Assistant</h2>', unsafe_allow_html=True)
+    
+    # Chat interface, filled in last so the messages added by this run show without a rerun
+    messages = st.container()
+    
+    # Chat input
+    col1, col2 = st.columns([5, 1])
+    
+    with col1:
+        user_input = st.text_input("Type your message...", key="chat_input", 
+                                 placeholder="Ask about production, inventory, sales, or analytics...")
+    
+    with col2:
+        send_button = st.button("Send", type="primary", use_container_width=True)
+    
+    # Quick action buttons
+    st.markdown("**Quick Questions:**")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        if st.button("📊 Sales Report", use_container_width=True):
+            user_input = "Show me current sales report"
+    
+    with col2:
+        if st.button("📦 Inventory Status", use_container_width=True):
+            user_input = "What's our inventory status?"
+    
+    with col3:
+        if st.button("🏭 Production Issues", use_container_width=True):
+            user_input = "Any production issues today?"
+    
+    with col4:
+        if st.button("💰 Financial Forecast", use_container_width=True):
+            user_input = "Give me financial forecast for next quarter"
+    
+    # Process user input
+    if send_button and user_input:
+        # Add user message to history
+        st.session_state.chat_history.append({
+            'role': 'user',
+            'content': user_input,
+            'timestamp': datetime.datetime.now().isoformat()
+        })
+        
+        # Generate AI response
+        response = generate_ai_response(user_input)
+        
+        # Add AI response to history
+        st.session_state.chat_history.append({
+            'role': 'assistant',
+            'content': response,
+            'timestamp': datetime.datetime.now().isoformat()
+        })
+    
+    # Clear chat button
+    if st.button("Clear Chat", type="secondary"):
+        st.session_state.chat_history = []
+    
+    with messages:
+        st.markdown('<div class="chat-container" id="chat-container">', unsafe_allow_html=True)
+        
+        for message in st.session_state.chat_history:
+            if message['role'] == 'user':
+                st.markdown(f'''
+                <div class="chat-message user-message">
+                    <strong>You:</strong> {message['content']}
+                </div>
+                ''', unsafe_allow_html=True)
+            else:
+                st.markdown(f'''
+                <div class="chat-message bot-message">
+                    <strong>AI Assistant:</strong> {message['content']}
+                </div>
+                ''', unsafe_allow_html=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+@st.fragment
+def predictive_analytics_tab():
+    """Predictive Analytics tab"""
+    st.markdown('<h2 class="section-header">Predictive Analytics</h2>', unsafe_allow_html=True)
+    
+    # Generate AI forecast
+    forecast_data = create_ai_forecast()
+    
+    # Sales forecast visualization
+    st.markdown('<h3 class="subsection-header">📈 Sales Forecast</h3>', unsafe_allow_html=True)
+    
+    def sales_forecast_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=forecast_data['sales_forecast']['Month'],
+            y=forecast_data['sales_forecast']['Forecast'],
+            mode='lines+markers',
+            name='AI Forecast',
+            line=dict(color='#FF8C00', width=3)
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=forecast_data['sales_forecast']['Month'].tolist() + forecast_data['sales_forecast']['Month'].tolist()[::-1],
+            y=forecast_data['sales_forecast']['Upper_Bound'].tolist() + forecast_data['sales_forecast']['Lower_Bound'].tolist()[::-1],
+            fill='toself',
+            fillcolor='rgba(255, 140, 0, 0.2)',
+            line=dict(color='rgba(255, 140, 0, 0)'),
+            name='95% Confidence Interval',
+            showlegend=True
+        ))
+        
+        fig.update_layout(
+            height=400,
+            title='AI-Powered Sales Forecast (Next 6 Months)',
+            xaxis_title="Month",
+            yaxis_title="Forecasted Revenue (₹)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
+        )
+        return fig
+    
+    cached_chart('ai/sales_forecast', ['orders', 'customers', 'inventory'], sales_forecast_chart, dated=True, use_container_width=True)
+    
+    # Forecast insights
+    st.markdown('<h3 class="subsection-header">🔍 Forecast Insights</h3>', unsafe_allow_html=True)
+    
+    insights = [
+        f"**Total Forecast Revenue:** ₹{forecast_data['metrics']['total_forecast']:,.0f} over next 6 months",
+        f"**Average Monthly Revenue:** ₹{forecast_data['metrics']['avg_monthly_forecast']:,.0f}",
+        f"**Expected Growth Rate:** {forecast_data['metrics']['growth_rate']:.1f}% over forecast period",
+        f"**Confidence Level:** {forecast_data['metrics']['confidence_level']*100:.0f}% interval, calibrated on a rolling-origin backtest",
+        f"**Backtest Accuracy:** {forecast_data['metrics']['backtest_mape']:.1f}% MAPE, {forecast_data['metrics']['backtest_wape']:.1f}% WAPE",
+        "**Seasonal Pattern:** Higher demand expected in months 2 and 5",
+        "**Recommendation:** Increase inventory by 15% to meet forecasted demand"
+    ]
+    
+    for insight in insights:
+        st.markdown(f"- {insight}")
+    
+    # Demand forecasting by product, region or customer segment
+    st.markdown('<h3 class="subsection-header">📊 Demand Forecast</h3>', unsafe_allow_html=True)
+    
+    demand_group = st.radio("Forecast demand by", list(DEMAND_GROUPS), format_func=DEMAND_GROUPS.get,
+                            horizontal=True, key="demand_group")
+    demand = get_demand_forecasts()
+    demand_df = demand[demand['group'] == demand_group].rename(columns={
+        'series': DEMAND_GROUPS[demand_group],
+        'current_demand': 'Current Demand',
+        'projected_demand': 'Projected Demand',
+        'growth_percentage': 'Growth %'
+    })
+    
+    def demand_chart():
+        fig = px.bar(
+            demand_df,
+            x=DEMAND_GROUPS[demand_group],
+            y=['Current Demand', 'Projected Demand'],
+            title=f'{DEMAND_GROUPS[demand_group]} Demand Forecast (monthly average, next 6 months)',
+            barmode='group'
+        )
+        
+        fig.update_layout(
+            height=400,
+            xaxis_title=DEMAND_GROUPS[demand_group],
+            yaxis_title="Demand Value (₹)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
+        )
+        
+        fig.update_xaxes(tickangle=45)
+        return fig
+    
+    cached_chart(f'ai/demand/{demand_group}', ['orders', 'customers'], demand_chart, dated=True, use_container_width=True)
+
+    # Forecast accuracy
+    st.markdown('<h3 class="subsection-header">🎯 Forecast Accuracy (Rolling-Origin Backtest)</h3>', unsafe_allow_html=True)
+
+    st.dataframe(get_forecast_accuracy().round(1), use_container_width=True, hide_index=True)
+
+    # Predictive maintenance
+    st.markdown('<h3 class="subsection-header">🔧 Predictive Maintenance Alerts</h3>', unsafe_allow_html=True)
+    
+    maintenance_alerts = [
+        {"machine": "CNC Machine #1", "issue": "Motor bearing wear detected", "probability": "85%", "eta_failure": "14-21 days"},
+        {"machine": "Laser Cutter #2", "issue": "Cooling system efficiency dropping", "probability": "72%", "eta_failure": "30-45 days"},
+        {"machine": "Assembly Line #3", "issue": "Conveyor belt tension variation", "probability": "63%", "eta_failure": "60-90 days"}
+    ]
+    
+    # Alerts above 70% failure probability are highlighted
+    maintenance_alerts = [dict(alert, **(
+        {'background': '#fff3cd', 'border': '#ffc107', 'color': '#dc3545'} if float(alert['probability'][:-1]) > 70
+        else {'background': '#f8f9fa', 'border': '#6c757d', 'color': '#6c757d'}
+    )) for alert in maintenance_alerts]
+    
+    render_cards(maintenance_alerts, '''
+        <div style="padding: 15px; margin: 10px 0; border-radius: 10px; background: {background}; 
+                     border-left: 4px solid {border};">
+            <div style="display: flex; justify-content: space-between; align-items: center;">
+                <div>
+                    <strong>{machine}</strong><br>
+                    <span style="color: #666; font-size: 0.9rem;">{issue}</span>
+                </div>
+                <div style="text-align: right;">
+                    <span style="color: {color}; font-weight: 600;">
+                        {probability} probability
+                    </span><br>
+                    <span style="color: #666; font-size: 0.9rem;">ETA failure: {eta_failure}</span>
+                </div>
+            </div>
+        </div>
+    ''', key='ai_maintenance_alerts_page')
+
+@st.fragment
+def grok_ai_tab():
+    """Grok AI tab"""
+    st.markdown('<h2 class="section-header">Grok AI Integration</h2>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                color: white; padding: 25px; border-radius: 15px; margin-bottom: 25px;">
+        <h2 style="color: white; margin-bottom: 15px;">🚀 Grok AI Advanced Analytics</h2>
+        <p style="font-size: 1.2rem;">Advanced AI-powered insights for manufacturing optimization, 
+        predictive maintenance, and strategic decision-making.</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Grok AI chat
+    st.markdown('<h3 class="subsection-header">💬 Grok AI Chat</h3>', unsafe_allow_html=True)
+    
+    # Grok chat messages, filled in last so the messages added by this run show without a rerun
+    messages = st.container()
+    
+    # Grok chat input
+    col1, col2 = st.columns([5, 1])
+    
+    with col1:
+        grok_input = st.text_input("Ask Grok AI...", key="grok_input",
+                                 placeholder="Ask advanced manufacturing questions...")
+    
+    with col2:
+        grok_send = st.button("Ask Grok", type="primary", use_container_width=True)
+    
+    # Grok capabilities
+    st.markdown("**Grok AI Capabilities:**")
+    
+    capabilities = [
+        "🤖 **Advanced predictive analytics** for sales and demand forecasting",
+        "🔧 **Predictive maintenance** with failure probability analysis",
+        "📊 **Process optimization** using machine learning algorithms",
+        "💰 **Cost-benefit analysis** for capital investments",
+        "🌍 **Market trend analysis** and competitive intelligence",
+        "⚡ **Real-time anomaly detection** in production processes"
+    ]
+    
+    for capability in capabilities:
+        st.markdown(f"- {capability}")
+    
+    # Process Grok input
+    if grok_send and grok_input:
+        # Add user message to history
+        st.session_state.grok_chat_history.append({
+            'role': 'user',
+            'content': grok_input,
+            'timestamp': datetime.datetime.now().isoformat()
+        })
+        
+        # Generate Grok response
+        grok_response = generate_grok_response(grok_input)
+        
+        # Add Grok response to history
+        st.session_state.grok_chat_history.append({
+            'role': 'grok',
+            'content': grok_response,
+            'timestamp': datetime.datetime.now().isoformat()
+        })
+    
+    # Grok analysis tools
+    st.markdown('<h3 class="subsection-header">🔬 Grok AI Analysis Tools</h3>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("🔍 Deep Market Analysis", use_container_width=True):
+            st.session_state.grok_chat_history.append({
+                'role': 'user',
+                'content': "Perform deep market analysis for our products",
+                'timestamp': datetime.datetime.now().isoformat()
+            })
+            
+            response = """**Grok AI Market Analysis:**
+            
+            **Market Trends:**
+            - Growing demand for sustainable manufacturing solutions (15% CAGR)
+            - Increased adoption of Industry 4.0 technologies in Indian manufacturing
+            - Government initiatives boosting infrastructure projects
+            
+            **Competitive Analysis:**
+            - Top 3 competitors hold 45% market share
+            - Our unique value proposition: Customized solutions with quick turnaround
+            - Price competitiveness: We're 12% below market average
+            
+            **Opportunities:**
+            - Expand into Middle East market (projected 20% growth)
+            - Develop smart locker solutions with IoT integration
+            - Partner with construction tech companies
+            
+            **Recommendations:**
+            1. Launch premium product line with IoT features
+            2. Expand digital marketing presence
+            3. Develop strategic partnerships in infrastructure sector"""
+            
+            st.session_state.grok_chat_history.append({
+                'role': 'grok',
+                'content': response,
+                'timestamp': datetime.datetime.now().isoformat()
+            })
+    
+    with col2:
+        if st.button("⚡ Predictive Maintenance", use_container_width=True):
+            st.session_state.grok_chat_history.append({
+                'role': 'user',
+                'content': "Analyze predictive maintenance needs",
+                'timestamp': datetime.datetime.now().isoformat()
+            })
+            
+            response = """**Grok AI Predictive Maintenance Analysis:**
+            
+            **Machine Health Status:**
+            - CNC Machine #1: 92% health score, optimal performance
+            - Laser Cutter #2: 78% health score, requires attention
+            - Assembly Line #3: 85% health score, minor issues detected
+            
+            **Failure Predictions:**
+            - Laser Cutter #2: 85% probability of cooling system failure in 14-21 days
+            - CNC Machine #1: 15% probability of bearing wear in 30-45 days
+            - Painting Booth #4: 60% probability of nozzle clog in 7-10 days
+            
+            **Maintenance Recommendations:**
+            1. **Immediate Action:** Schedule maintenance for Laser Cutter #2 this week
+            2. **Priority:** Replace filters in Painting Booth #4
+            3. **Monitoring:** Increase monitoring frequency for CNC Machine #1
+            
+            **Cost Impact:**
+            - Preventive maintenance cost: ₹45,000
+            - Potential breakdown cost: ₹325,000
+            - **ROI: 622%**"""
+            
+            st.session_state.grok_chat_history.append({
+                'role': 'grok',
+                'content': response,
+                'timestamp': datetime.datetime.now().isoformat()
+            })
+    
+    with col3:
+        if st.button("📈 Investment Analysis", use_container_width=True):
+            st.session_state.grok_chat_history.append({
+                'role': 'user',
+                'content': "Analyze ROI for new CNC machine investment",
+                'timestamp': datetime.datetime.now().isoformat()
+            })
+            
+            response = """**Grok AI Investment Analysis:**
+            
+            **New CNC Machine Investment:**
+            - Cost: ₹2,500,000
+            - Installation: ₹150,000
+            - Training: ₹75,000
+            - **Total Investment: ₹2,725,000**
+            
+            **Expected Benefits:**
+            - Production capacity increase: 35%
+            - Labor cost reduction: ₹45,000/month
+            - Quality improvement: 40% reduction in defects
+            - Energy efficiency: 15% reduction in power consumption
+            
+            **Financial Analysis:**
+            - Annual savings: ₹1,080,000
+            - Additional revenue: ₹1,200,000/year
+            - **Total annual benefit: ₹2,280,000**
+            
+            **ROI Calculation:**
+            - Payback period: **14.3 months**
+            - 5-year ROI: **318%**
+            - NPV (5 years): ₹6,450,000
+            
+            **Recommendation:**
+            ✅ **STRONG INVESTMENT CASE** - Proceed with purchase"""
+            
+            st.session_state.grok_chat_history.append({
+                'role': 'grok',
+                'content': response,
+                'timestamp': datetime.datetime.now().isoformat()
+            })
+    
+    with messages:
+        st.markdown('<div class="chat-container" id="grok-chat-container">', unsafe_allow_html=True)
+        
+        for message in st.session_state.grok_chat_history:
+            if message['role'] == 'user':
+                st.markdown(f'''
+                <div class="chat-message user-message">
+                    <strong>You:</strong> {message['content']}
+                </div>
+                ''', unsafe_allow_html=True)
+            else:
+                st.markdown(f'''
+                <div class="chat-message grok-message">
+                    <strong>Grok AI:</strong> {message['content']}
+                </div>
+                ''', unsafe_allow_html=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+def generate_ai_response(user_input):
+    """Generate AI response based on user input"""
+    portal = st.session_state.portal
+    
+    # Simple keyword-based response system
+    user_input_lower = user_input.lower()
+    
+    if 'sales' in user_input_lower and 'report' in user_input_lower:
+        total_sales = portal.orders['amount'].sum()
+        recent_sales = portal.orders[portal.orders['order_date'] >= pd.Timestamp(date.today() - timedelta(days=30))]['amount'].sum()
+        
+        return f"""**Sales Report Summary:**
+        
+        📊 **Overall Sales Performance:**
+        - Total Sales Revenue: ₹{total_sales:,.0f}
+        - Last 30 Days Revenue: ₹{recent_sales:,.0f}
+        - Average Order Value: ₹{portal.orders['amount'].mean():,.0f}
+        
+        📈 **Top Performing Products:**
+        1. Generator Control Panel: ₹{random.randint(500000, 1000000):,.0f}
+        2. SS Industrial Duct: ₹{random.randint(300000, 600000):,.0f}
+        3. Mild Steel Worker Locker: ₹{random.randint(200000, 400000):,.0f}
+        
+        🎯 **Recommendations:**
+        - Focus on upselling electrical panels (highest margin)
+        - Increase inventory for top-selling products
+        - Target construction companies for ducting systems"""
+    
+    elif 'inventory' in user_input_lower or 'stock' in user_input_lower:
+        low_stock_items = len(portal.inventory[portal.inventory['current_stock'] < portal.inventory['min_stock']])
+        total_inventory_value = portal.inventory['value'].sum()
+        
+        return f"""**Inventory Status:**
+        
+        📦 **Current Inventory Overview:**
+        - Total Items in Stock: {len(portal.inventory):,}
+        - Total Inventory Value: ₹{total_inventory_value:,.0f}
+        - Items Below Minimum Stock: {low_stock_items}
+        
+        ⚠️ **Critical Items (Need Reordering):**
+        1. Steel Sheets: 45 units (min: 100)
+        2. GI Coils: 120 units (min: 150)
+        3. Electrical Components: 85 units (min: 100)
+        
+        🔄 **Inventory Turnover:**
+        - Current Turnover Rate: 4.2x/year
+        - Target: 6.0x/year
+        - **Action:** Optimize stock levels to improve turnover
+        
+        📋 **Recommendations:**
+        1. Place purchase orders for critical items immediately
+        2. Review safety stock levels for fast-moving items
+        3. Consider JIT inventory for high-cost items"""
+    
+    elif 'production' in user_input_lower and ('issue' in user_input_lower or 'problem' in user_input_lower):
+        return f"""**Production Status Report:**
+        
+        🏭 **Current Production Status:**
+        - Active Work Orders: {portal.count('orders', {'status': 'Production'}):,}
+        - On-time Delivery Rate: 92.3%
+        - Quality Yield: 97.8%
+        
+        ⚠️ **Current Issues:**
+        1. **CNC Machine #2:** Scheduled maintenance overdue by 3 days
+        2. **Raw Material Delay:** Steel sheets delivery delayed by 2 days
+        3. **QC Issue:** Batch #2045 has 3% defect rate (above 2% target)
+        
+        🔧 **Resolution Actions:**
+        - **Immediate:** Reschedule CNC maintenance for tomorrow
+        - **Today:** Contact supplier for material ETA
+        - **Ongoing:** Quality team investigating defect root cause
+        
+        📊 **Performance Metrics:**
+        - Overall Equipment Effectiveness (OEE): 86.5%
+        - Machine Utilization: 78.2%
+        - Downtime (Last 7 days): 14.5 hours
+        
+        ✅ **Recommendations:**
+        1. Implement predictive maintenance schedule
+        2. Increase buffer stock for critical materials
+        3. Review quality control procedures"""
+    
+    elif 'financial' in user_input_lower or 'forecast' in user_input_lower:
+        forecast_data = create_ai_forecast()
+        
+        return f"""**Financial Forecast & Analysis:**
+        
+        📈 **Revenue Forecast (Next 6 Months):**
+        - Total Forecast: ₹{forecast_data['metrics']['total_forecast']:,.0f}
+        - Monthly Average: ₹{forecast_data['metrics']['avg_monthly_forecast']:,.0f}
+        - Expected Growth: {forecast_data['metrics']['growth_rate']:.1f}%
+        
+        💰 **Current Financial Position:**
+        - Cash Balance: ₹{portal.financial_data['cashflow']['balance'].iloc[-1]:,.0f}
+        - Accounts Receivable: ₹{portal.financial_data['invoices'][portal.financial_data['invoices']['status'] != 'Paid']['amount'].sum():,.0f}
+        - Profit Margin: {(portal.financial_data['revenue']['net_profit'].sum() / portal.financial_data['revenue']['revenue'].sum() * 100):.1f}%
+        
+        📊 **Key Financial Ratios:**
+        - Current Ratio: 2.3 (Healthy: >2.0)
+        - Quick Ratio: 1.8 (Good: >1.5)
+        - Debt to Equity: 0.45 (Conservative: <1.0)
+        
+        🎯 **Financial Recommendations:**
+        1. **Invest:** Allocate ₹500K for new equipment (ROI: 25%)
+        2. **Optimize:** Reduce inventory holding costs by 15%
+        3. **Grow:** Expand credit terms for top 20% customers
+        
+        ⚠️ **Risk Factors:**
+        - Raw material prices increasing by 8% next quarter
+        - Competitive pressure on pricing (3-5% erosion expected)
+        - Labor cost inflation: 6% annually"""
+    
+    elif 'customer' in user_input_lower:
+        active_customers = portal.count('customers', {'status': 'Active'})
+        new_customers = len(portal.customers[portal.customers['customer_since'] >= pd.Timestamp(date.today() - timedelta(days=90))])
+        
+        return f"""**Customer Analysis:**
+        
+        👥 **Customer Overview:**
+        - Total Customers: {len(portal.customers):,}
+        - Active Customers: {active_customers:,}
+        - New Customers (Last 90 days): {new_customers:,}
+        
+        💰 **Customer Value Metrics:**
+        - Average Lifetime Value: ₹{portal.customers['total_spent'].mean():,.0f}
+        - Customer Acquisition Cost: ₹{random.randint(5000, 15000):,.0f}
+        - Customer Retention Rate: 78.5%
+        
+        📊 **Customer Segmentation:**
+        - **Champions (Top 20%):** 30 customers, 65% of revenue
+        - **Loyal Customers:** 45 customers, 25% of revenue
+        - **At Risk:** 25 customers, 10% of revenue
+        
+        ⭐ **Top 5 Customers by Revenue:**
+        1. Company A: ₹2.5M total spend
+        2. Company B: ₹1.8M total spend
+        3. Company C: ₹1.5M total spend
+        4. Company D: ₹1.2M total spend
+        5. Company E: ₹950K total spend
+        
+        🎯 **Customer Strategy Recommendations:**
+        1. **Retention:** Create loyalty program for top 20% customers
+        2. **Growth:** Upsell/cross-sell to mid-tier customers
+        3. **Acquisition:** Focus on manufacturing sector (highest LTV)
+        4. **Reactivate:** Contact 15 dormant customers with special offers
+        
+        📈 **Growth Opportunities:**
+        - **Referral Program:** 25% of new customers come from referrals
+        - **Industry Focus:** Construction sector shows 35% growth potential
+        - **Geographic Expansion:** South India market underpenetrated"""
+    
+    elif 'order' in user_input_lower and 'status' in user_input_lower:
+        status_counts = portal.totals('order_status')['count']
+        pending_statuses = ['Quote', 'Confirmed', 'Production']
+        pending_orders = sum(status_counts.get(status, 0) for status in pending_statuses)
+        urgent_orders = portal.count('orders', {'status': pending_statuses, 'priority': 'High'})
+        
+        return f"""**Order Status Overview:**
+        
+        📋 **Order Pipeline:**
+        - Total Orders: {status_counts.sum():,}
+        - Pending Orders: {pending_orders:,}
+        - Urgent Orders: {urgent_orders:,}
+        
+        📊 **Order Status Distribution:**
+        - Quotes: {status_counts.get('Quote', 0):,}
+        - Confirmed: {status_counts.get('Confirmed', 0):,}
+        - Production: {status_counts.get('Production', 0):,}
+        - Shipped: {status_counts.get('Shipped', 0):,}
+        - Delivered: {status_counts.get('Delivered', 0):,}
+        
+        ⚠️ **Orders Requiring Attention:**
+        1. **ORD21058:** High priority, 3 days overdue
+        2. **ORD21042:** Payment pending, 7 days overdue
+        3. **ORD21067:** QC hold, needs resolution today
+        
+        🚚 **Shipping Status:**
+        - On-time Delivery Rate: 92.3%
+        - Average Delivery Time: 14.5 days
+        - Shipping Cost as % of Revenue: 3.2%
+        
+        🎯 **Order Management Recommendations:**
+        1. **Prioritize:** Focus on 5 overdue orders this week
+        2. **Communicate:** Update customers on delayed orders
+        3. **Optimize:** Batch similar orders for production efficiency
+        4. **Automate:** Implement order tracking system
+        
+        📈 **Performance Metrics:**
+        - Order Fulfillment Cycle Time: 18.5 days (Target: 15 days)
+        - Perfect Order Rate: 85.7% (Target: 90%)
+        - Order Accuracy: 98.2% (Excellent)"""
+    
+    elif 'lead' in user_input_lower or 'marketing' in user_input_lower:
+        lead_statuses = portal.totals('lead_status')['count']
+        new_leads = lead_statuses.get('New', 0)
+        conversion_rate = (lead_statuses.get('Closed Won', 0) / lead_statuses.sum() * 100)
+        
+        return f"""**Lead & Marketing Analysis:**
+        
+        🎯 **Lead Pipeline:**
+        - Total Leads: {lead_statuses.sum():,}
+        - New Leads: {new_leads:,}
+        - Qualified Leads: {lead_statuses.get('Qualified', 0):,}
+        - Conversion Rate: {conversion_rate:.1f}%
+        
+        📊 **Lead Sources (Top 5):**
+        1. Website: 35% of leads
+        2. Referrals: 25% of leads
+        3. Trade Shows: 15% of leads
+        4. LinkedIn: 12% of leads
+        5. Google Ads: 8% of leads
+        
+        💰 **Lead Quality Metrics:**
+        - Average Lead Value: ₹{portal.leads['value'].mean():,.0f}
+        - Cost per Lead: ₹{portal.marketing_campaigns['cost_per_lead'].mean():,.0f}
+        - Lead to Customer Rate: 12.5%
+        
+        🏆 **Best Performing Campaigns:**
+        1. **Q4 Manufacturing Promotion:** 45% ROI, 120 leads
+        2. **LinkedIn Industry Campaign:** 38% ROI, 85 leads
+        3. **Email Newsletter:** 25% ROI, 210 leads
+        
+        🎯 **Marketing Recommendations:**
+        1. **Double Down:** Increase budget for Q4 campaign by 30%
+        2. **Optimize:** Improve website conversion rate (current: 2.1%)
+        3. **Expand:** Test WhatsApp Business for lead generation
+        4. **Retarget:** Implement email nurture sequence for abandoned quotes
+        
+        📈 **Growth Opportunities:**
+        - **Content Marketing:** Case studies increase conversions by 40%
+        - **Partnerships:** Co-marketing with complementary businesses
+        - **Automation:** Lead scoring system to prioritize high-value leads"""
+    
+    elif 'help' in user_input_lower or 'what can you do' in user_input_lower:
+        return """**I can help you with:**
+        
+        📊 **Sales & Revenue:**
+        - Current sales performance
+        - Revenue forecasts and trends
+        - Order pipeline analysis
+        
+        📦 **Inventory & Supply Chain:**
+        - Stock levels and reorder points
+        - Inventory optimization
+        - Supplier performance
+        
+        🏭 **Production & Operations:**
+        - Production status and issues
+        - Quality control metrics
+        - Equipment efficiency
+        
+        👥 **Customer Management:**
+        - Customer analytics and segmentation
+        - Customer value analysis
+        - Retention strategies
+        
+        💰 **Finance & Accounting:**
+        - Financial performance
+        - Cash flow analysis
+        - Cost optimization
+        
+        🎯 **Marketing & Leads:**
+        - Campaign performance
+        - Lead pipeline analysis
+        - Marketing ROI
+        
+        🔮 **Predictive Analytics:**
+        - Sales forecasting
+        - Demand planning
+        - Risk analysis
+        
+        💡 **Just ask me anything about your manufacturing business!**"""
+    
+    else:
+        # Default response
+        return f"""I understand you're asking about: "{user_input}"
+        
+        As your AI Manufacturing Assistant, I can help you analyze:
+        
+        🔍 **Based on your query, here's what I found:**
+        - Your manufacturing portal has {len(portal.products)} product categories
+        - You have {len(portal.customers)} active customers
+        - Current order pipeline value: ₹{portal.totals('order_status')['total'].reindex(['Quote', 'Confirmed', 'Production'], fill_value=0).sum():,.0f}
+        
+        💡 **For more specific information, you can ask me about:**
+        - "Show me sales report"
+        - "What's our inventory status?"
+        - "Any production issues today?"
+        - "Give me financial forecast"
+        - "Analyze customer data"
+        
+        How else can I assist you with your manufacturing operations today?"""
+
+def generate_grok_response(user_input):
+    """Generate Grok AI response"""
+    # Simulated Grok AI responses based on query
+    user_input_lower = user_input.lower()
+    
+    responses = {
+        'market': """**Grok AI Deep Market Analysis:**
+        
+        **Industry Insights:**
+        - Global manufacturing growth: 3.8% CAGR (2023-2028)
+        - Indian manufacturing sector: 7.5% expected growth
+        - Key growth drivers: Infrastructure spending, Make in India, export demand
+        
+        **Competitive Landscape:**
+        - **Direct Competitors:** 12 major players in your segment
+        - **Market Share:** You hold approximately 8% of regional market
+        - **Competitive Advantages:** Faster delivery (15% quicker), customization capability
+        
+        **Emerging Trends:**
+        1. **Sustainability:** 42% of buyers prefer eco-friendly manufacturers
+        2. **Digitalization:** IoT adoption growing at 28% annually
+        3. **Automation:** Robotics adoption increasing by 35% year-over-year
+        
+        **Strategic Recommendations:**
+        1. **Product Development:** Launch smart, connected products with IoT features
+        2. **Market Expansion:** Target Middle East (20% growth) and Southeast Asia (15% growth)
+        3. **Partnerships:** Collaborate with construction tech companies
+        4. **Digital Transformation:** Implement AI-powered production planning
+        
+        **Risk Assessment:**
+        - Raw material price volatility: High risk
+        - Regulatory changes: Medium risk
+        - Technology disruption: High risk
+        
+        **Action Plan:**
+        - Short-term (0-6 months): Digital marketing optimization
+        - Medium-term (6-18 months): Product line expansion
+        - Long-term (18-36 months): International expansion""",
+        
+        'investment': """**Grok AI Investment Analysis Framework:**
+        
+        **Analysis Methodology:**
+        - Machine learning models trained on 5,000+ manufacturing investments
+        - Real-time market data integration
+        - Competitor benchmarking analysis
+        - Risk-adjusted return calculations
+        
+        **Current Investment Opportunities:**
+        1. **Advanced CNC Machines:** 
+           - ROI: 28-35% | Payback: 18-24 months
+           - Risk: Low | Strategic Fit: High
+        
+        2. **Solar Power Installation:**
+           - ROI: 22% | Payback: 42 months
+           - Risk: Medium | Strategic Fit: Medium
+        
+        3. **AI Quality Control System:**
+           - ROI: 45% | Payback: 14 months
+           - Risk: Medium | Strategic Fit: High
+        
+        **Capital Allocation Strategy:**
+        - **Growth Investments:** 60% of capital (new equipment, technology)
+        - **Efficiency Investments:** 30% of capital (process optimization)
+        - **Risk Management:** 10% of capital (insurance, hedging)
+        
+        **Financial Modeling:**
+        - **Best Case:** 32% average ROI across portfolio
+        - **Base Case:** 24% average ROI
+        - **Worst Case:** 8% average ROI (recession scenario)
+        
+        **Implementation Roadmap:**
+        1. **Phase 1 (Months 1-3):** CNC machine acquisition
+        2. **Phase 2 (Months 4-9):** AI system implementation
+        3. **Phase 3 (Months 10-18):** Solar power installation
+        
+        **Monitoring Framework:**
+        - Monthly ROI tracking
+        - Quarterly performance reviews
+        - Annual strategic reassessment""",
+        
+        'optimization': """**Grok AI Process Optimization Analysis:**
+        
+        **Current State Analysis:**
+        - Overall equipment effectiveness (OEE): 78.5% (Industry benchmark: 85%)
+        - Production yield: 94.2% (Target: 97%)
+        - Energy efficiency: 68% (Best practice: 85%)
+        
+        **Bottleneck Identification:**
+        1. **Primary Bottleneck:** Material handling (23% of production time)
+        2. **Secondary Bottleneck:** Quality inspection (15% of production time)
+        3. **Tertiary Bottleneck:** Machine setup (12% of production time)
+        
+        **AI-Optimized Solutions:**
+        
+        **1. Material Handling Optimization:**
+        - **Solution:** Automated guided vehicles (AGVs)
+        - **Investment:** ₹1.2M
+        - **Benefits:** 40% reduction in handling time
+        - **ROI:** 35% | Payback: 20 months
+        
+        **2. Quality Inspection Automation:**
+        - **Solution:** Computer vision inspection system
+        - **Investment:** ₹850K
+        - **Benefits:** 60% faster inspection, 50% fewer defects
+        - **ROI:** 42% | Payback: 16 months
+        
+        **3. Smart Machine Setup:**
+        - **Solution:** Digital twins and simulation
+        - **Investment:** ₹600K
+        - **Benefits:** 30% reduction in setup time
+        - **ROI:** 28% | Payback: 22 months
+        
+        **Implementation Priority:**
+        1. Quality inspection automation (highest ROI)
+        2. Material handling optimization
+        3. Smart machine setup
+        
+        **Expected Overall Impact:**
+        - Production capacity increase: 22%
+        - Cost reduction: 18%
+        - Quality improvement: 45%
+        - Energy savings: 12%"""
+    }
+    
+    # Check for keywords
+    for keyword, response in responses.items():
+        if keyword in user_input_lower:
+            return response
+    
+    # Default Grok response
+    return """**Grok AI Analysis:**
+    
+    I've analyzed your query using advanced machine learning models trained on manufacturing data. Here are my insights:
+    
+    **Contextual Understanding:**
+    - Your query relates to manufacturing optimization and strategic decision-making
+    - Based on your company's current performance metrics and industry benchmarks
+    
+    **Advanced Analytics Applied:**
+    1. **Predictive Modeling:** Time-series analysis of your production data
+    2. **Pattern Recognition:** Identifying optimization opportunities
+    3. **Risk Assessment:** Evaluating potential challenges and mitigations
+    
+    **Key Findings:**
+    - Your operations show 78% efficiency score (industry average: 72%)
+    - There's a 22% improvement opportunity through process optimization
+    - Market conditions favor expansion in the next 6-12 months
+    
+    **Strategic Recommendations:**
+    1. **Immediate Action:** Implement the top 3 quick-win optimizations
+    2. **Medium-term:** Invest in digital transformation initiatives
+    3. **Long-term:** Develop strategic partnerships for market expansion
+    
+    **Next Steps:**
+    - Schedule a detailed analysis session with my advanced analytics module
+    - Access real-time dashboards for continuous monitoring
+    - Set up automated alerts for performance deviations
+    
+    **Would you like me to dive deeper into any specific area?**"""
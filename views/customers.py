@@ -0,0 +1,494 @@
+"""Customers page: database, analytics, support tickets and feedback"""
+
+import streamlit as st
+import pandas as pd
+from datetime import date, timedelta
+import plotly.express as px
+import random
+
+from ui import cached_chart, render_cards, render_tabs
+from analytics import get_customer_health, get_customer_segments
+
+def customers_page():
+    """Customer management page"""
+    st.markdown('<h1 class="main-header">👥 Customer Management</h1>', unsafe_allow_html=True)
+    
+    render_tabs('customers', {
+        "Customer Database": customer_database_tab,
+        "Customer Analytics": customer_analytics_tab,
+        "Support Tickets": support_tickets_tab,
+        "Customer Feedback": customer_feedback_tab
+    })
+
+def customer_analytics_tab():
+    """Customer Analytics tab"""
+    st.markdown('<h2 class="section-header">Customer Analytics</h2>', unsafe_allow_html=True)
+    
+    # Customer segmentation
+    st.markdown('<h3 class="subsection-header">Customer Segmentation</h3>', unsafe_allow_html=True)
+    
+    customer_rfm = get_customer_segments()
+    
+    # Display segmentation
+    segment_counts = customer_rfm['segment'].value_counts().reset_index()
+    segment_counts.columns = ['Segment', 'Count']
+    
+    def segment_chart():
+        fig = px.bar(
+            segment_counts,
+            x='Segment',
+            y='Count',
+            title='Customer Segmentation',
+            color='Segment'
+        )
+        
+        fig.update_layout(
+            height=400,
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            showlegend=False
+        )
+        return fig
+    
+    cached_chart('customers/segments', ['customers'], segment_chart, dated=True, use_container_width=True)
+    
+    # Customer lifetime value analysis
+    st.markdown('<h3 class="subsection-header">Customer Lifetime Value Analysis</h3>', unsafe_allow_html=True)
+    
+    # Display top customers by CLV
+    customer_health = get_customer_health()
+    top_customers = customer_health.nlargest(10, 'clv')
+    
+    def top_clv_chart():
+        fig = px.bar(
+            top_customers,
+            x='name',
+            y='clv',
+            title='Top 10 Customers by Lifetime Value',
+            color='clv',
+            color_continuous_scale='Greens'
+        )
+        
+        fig.update_layout(
+            height=400,
+            xaxis_title="Customer",
+            yaxis_title="Lifetime Value (₹)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            showlegend=False
+        )
+        return fig
+    
+    cached_chart('customers/top_clv', ['customers'], top_clv_chart, dated=True, use_container_width=True)
+    
+    # Churn risk analysis
+    st.markdown('<h3 class="subsection-header">Churn Risk Analysis</h3>', unsafe_allow_html=True)
+    
+    # Display churn risk distribution
+    churn_counts = customer_health['churn_risk'].value_counts().reset_index()
+    churn_counts.columns = ['Risk Level', 'Count']
+    
+    def churn_risk_chart():
+        fig = px.pie(
+            churn_counts,
+            values='Count',
+            names='Risk Level',
+            title='Customer Churn Risk Distribution',
+            color='Risk Level',
+            color_discrete_map={
+                'Active': '#28a745',
+                'Low Risk': '#ffc107',
+                'Medium Risk': '#fd7e14',
+                'High Risk': '#dc3545'
+            }
+        )
+        
+        fig.update_layout(
+            height=400,
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)'
+        )
+        return fig
+    
+    cached_chart('customers/churn_risk', ['customers'], churn_risk_chart, dated=True, use_container_width=True)
+    
+    # High-risk customers
+    high_risk_customers = customer_health[customer_health['churn_risk'] == 'High Risk']
+    
+    if len(high_risk_customers) > 0:
+        st.warning(f"⚠️ {len(high_risk_customers)} customers are at high risk of churn")
+        
+        render_cards(high_risk_customers, '''
+            <div style="padding: 12px; margin: 8px 0; border-radius: 8px; background: #f8d7da; border-left: 4px solid #dc3545;">
+                <strong>{name}</strong> ({company})<br>
+                <span style="color: #721c24; font-size: 0.9rem;">
+                    Last order: {last_order:%Y-%m-%d} 
+                    ({days_since_last_order} days ago) | 
+                    Total orders: {total_orders}
+                </span>
+            </div>
+        ''', key='customers_high_risk_page', page_size=3)
+
+def customer_feedback_tab():
+    """Customer Feedback tab"""
+    st.markdown('<h2 class="section-header">Customer Feedback & Reviews</h2>', unsafe_allow_html=True)
+    
+    # Feedback metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Average Rating", "4.5/5.0", "0.2 ↑")
+    
+    with col2:
+        st.metric("Total Reviews", "342", "12 this month")
+    
+    with col3:
+        st.metric("Response Rate", "89%", "5% ↑")
+    
+    # Recent reviews
+    st.markdown('<h3 class="subsection-header">Recent Customer Reviews</h3>', unsafe_allow_html=True)
+    
+    reviews = []
+    sentiments = ['Positive', 'Neutral', 'Negative']
+    
+    for i in range(10):
+        review_date = date.today() - timedelta(days=random.randint(0, 90))
+        rating = random.randint(1, 5)
+        
+        reviews.append({
+            'Date': review_date.strftime('%Y-%m-%d'),
+            'Customer': f"Customer {random.randint(1, 150)}",
+            'Rating': '⭐' * rating,
+            'Numeric Rating': rating,
+            'Product': random.choice(['Mild Steel Worker Locker', 'SS Industrial Duct', 'Generator Control Panel']),
+            'Comment': random.choice([
+                'Excellent product quality and timely delivery.',
+                'Good service but delivery was delayed by 2 days.',
+                'Product met our expectations perfectly.',
+                'Facing some issues with installation, need support.',
+                'Very satisfied with the purchase, will buy again.'
+            ]),
+            'Sentiment': random.choice(sentiments),
+            'Response': random.choice(['Replied', 'Pending', 'Not Required'])
+        })
+    
+    reviews_df = pd.DataFrame(reviews)
+    
+    # Display reviews
+    sentiment_colors = {
+        'Positive': '#28a745',
+        'Neutral': '#6c757d',
+        'Negative': '#dc3545'
+    }
+    reviews_df = reviews_df.assign(sentiment_color=reviews_df['Sentiment'].map(sentiment_colors).fillna('#6c757d'))
+    
+    render_cards(reviews_df, '''
+        <div style="padding: 15px; margin: 10px 0; border-radius: 10px; background: #f8f9fa; border-left: 4px solid {sentiment_color};">
+            <div style="display: flex; justify-content: space-between; align-items: start;">
+                <div>
+                    <strong>{Customer}</strong> - {Product}<br>
+                    <span style="color: #ffc107; font-size: 1.2rem;">{Rating}</span><br>
+                    <span style="color: #666; font-size: 0.9rem;">{Comment}</span>
+                </div>
+                <div style="text-align: right;">
+                    <span style="color: {sentiment_color}; font-weight: 600;">{Sentiment}</span><br>
+                    <span style="color: #666; font-size: 0.9rem;">{Date}</span><br>
+                    <span style="color: #666; font-size: 0.9rem;">Response: {Response}</span>
+                </div>
+            </div>
+        </div>
+    ''', key='customers_reviews_page')
+    
+    # Sentiment analysis
+    st.markdown('<h3 class="subsection-header">Customer Sentiment Analysis</h3>', unsafe_allow_html=True)
+    
+    sentiment_counts = reviews_df['Sentiment'].value_counts().reset_index()
+    sentiment_counts.columns = ['Sentiment', 'Count']
+    
+    fig = px.pie(
+        sentiment_counts,
+        values='Count',
+        names='Sentiment',
+        title='Customer Sentiment Distribution',
+        color='Sentiment',
+        color_discrete_map={
+            'Positive': '#28a745',
+            'Neutral': '#6c757d',
+            'Negative': '#dc3545'
+        }
+    )
+    
+    fig.update_layout(
+        height=400,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def customer_database_tab():
+    """Customer Database tab"""
+    st.markdown('<h2 class="section-header">Customer Database</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # Customer metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_customers = len(portal.customers)
+        st.metric("Total Customers", total_customers)
+    
+    with col2:
+        active_customers = portal.count('customers', {'status': 'Active'})
+        st.metric("Active Customers", active_customers)
+    
+    with col3:
+        avg_orders = portal.customers['total_orders'].mean()
+        st.metric("Avg Orders per Customer", f"{avg_orders:.1f}")
+    
+    with col4:
+        avg_spent = portal.customers['total_spent'].mean()
+        st.metric("Avg Lifetime Value", f"₹{avg_spent:,.0f}")
+    
+    # Search and filter
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        search_term = st.text_input("🔍 Search Customers")
+    
+    with col2:
+        industry_filter = st.multiselect(
+            "Filter by Industry",
+            options=portal.customers['industry'].unique(),
+            default=[]
+        )
+    
+    with col3:
+        status_filter = st.multiselect(
+            "Filter by Status",
+            options=portal.customers['status'].unique(),
+            default=['Active']
+        )
+    
+    # Filter customers
+    filtered_customers = portal.customers.copy()
+    
+    if search_term:
+        filtered_customers = filtered_customers[
+            filtered_customers['name'].str.contains(search_term, case=False) |
+            filtered_customers['company'].str.contains(search_term, case=False) |
+            filtered_customers['email'].str.contains(search_term, case=False)
+        ]
+    
+    if industry_filter:
+        filtered_customers = filtered_customers[filtered_customers['industry'].isin(industry_filter)]
+    
+    if status_filter:
+        filtered_customers = filtered_customers[filtered_customers['status'].isin(status_filter)]
+    
+    # Display customers
+    st.dataframe(
+        filtered_customers[
+            ['customer_id', 'name', 'company', 'industry', 'status', 
+             'total_orders', 'total_spent', 'last_order', 'sales_rep']
+        ],
+        use_container_width=True
+    )
+    
+    # Customer details view
+    st.markdown('<h3 class="subsection-header">Customer Details</h3>', unsafe_allow_html=True)
+    
+    selected_customer = st.selectbox(
+        "Select a customer to view details",
+        options=filtered_customers['name'].tolist()
+    )
+    
+    if selected_customer:
+        customer_data = filtered_customers[filtered_customers['name'] == selected_customer].iloc[0]
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f'''
+            <div class="widget-card">
+                <h4>Customer Information</h4>
+                <p><strong>Customer ID:</strong> {customer_data['customer_id']}</p>
+                <p><strong>Company:</strong> {customer_data['company']}</p>
+                <p><strong>Industry:</strong> {customer_data['industry']}</p>
+                <p><strong>Region:</strong> {customer_data['region']}</p>
+                <p><strong>Status:</strong> <span style="color: {'#28a745' if customer_data['status'] == 'Active' else '#6c757d'}">
+                    {customer_data['status']}
+                </span></p>
+                <p><strong>Sales Rep:</strong> {customer_data['sales_rep']}</p>
+            </div>
+            ''', unsafe_allow_html=True)
+        
+        with col2:
+            avg_order_value = customer_data['total_spent'] / customer_data['total_orders'] if customer_data['total_orders'] > 0 else 0
+            st.markdown(f'''
+            <div class="widget-card">
+                <h4>Purchase History</h4>
+                <p><strong>Total Orders:</strong> {customer_data['total_orders']}</p>
+                <p><strong>Total Spent:</strong> ₹{customer_data['total_spent']:,.0f}</p>
+                <p><strong>Avg Order Value:</strong> ₹{avg_order_value:,.0f}</p>
+                <p><strong>Customer Since:</strong> {customer_data['customer_since']:%Y-%m-%d}</p>
+                <p><strong>Last Order:</strong> {customer_data['last_order']:%Y-%m-%d}</p>
+                <p><strong>Credit Limit:</strong> ₹{customer_data['credit_limit']:,.0f}</p>
+            </div>
+            ''', unsafe_allow_html=True)
+        
+        # Customer's recent orders
+        customer_orders = portal.query(
+            'orders',
+            {'customer_id': customer_data['customer_id']},
+            columns=['order_id', 'order_date', 'status', 'amount', 'products', 'quantity'],
+            order_by='order_date',
+            descending=True,
+            limit=5
+        )
+        
+        if len(customer_orders) > 0:
+            st.markdown("**Recent Orders:**")
+            st.dataframe(customer_orders, use_container_width=True)
+        else:
+            st.info("No orders found for this customer")
+
+@st.fragment
+def support_tickets_tab():
+    """Support Tickets tab"""
+    portal = st.session_state.portal
+    st.markdown('<h2 class="section-header">Customer Support Tickets</h2>', unsafe_allow_html=True)
+    
+    # Sample support tickets
+    tickets = []
+    statuses = ['Open', 'In Progress', 'Resolved', 'Closed']
+    priorities = ['High', 'Medium', 'Low']
+    categories = ['Technical Support', 'Billing Inquiry', 'Product Issue', 'Delivery Problem', 'General Inquiry']
+    
+    for i in range(25):
+        created_date = date.today() - timedelta(days=random.randint(0, 30))
+        updated_date = created_date + timedelta(days=random.randint(0, 7))
+        
+        tickets.append({
+            'Ticket ID': f"TKT{1000 + i}",
+            'Customer': f"Customer {random.randint(1, 150)}",
+            'Category': random.choice(categories),
+            'Subject': random.choice([
+                'Product not working properly',
+                'Invoice discrepancy',
+                'Delivery delay',
+                'Technical assistance needed',
+                'Warranty claim'
+            ]),
+            'Status': random.choice(statuses),
+            'Priority': random.choice(priorities),
+            'Created Date': created_date.strftime('%Y-%m-%d'),
+            'Last Updated': updated_date.strftime('%Y-%m-%d'),
+            'Assigned To': random.choice(['Support Team A', 'Support Team B', 'Rajesh', 'Priya']),
+            'SLA': random.choice(['Within 24h', 'Within 48h', 'Within 7 days'])
+        })
+    
+    # Tickets created in the portal come first, newest first
+    recorded = portal.query('tickets', order_by='created_at', descending=True)
+    tickets = [{
+        'Ticket ID': row['ticket_id'],
+        'Customer': row['customer'],
+        'Category': row['category'],
+        'Subject': row['subject'],
+        'Status': row['status'],
+        'Priority': row['priority'],
+        'Created Date': row['created_at'].strftime('%Y-%m-%d'),
+        'Last Updated': row['created_at'].strftime('%Y-%m-%d'),
+        'Assigned To': row['assigned_to'],
+        'SLA': row['sla']
+    } for row in recorded.to_dict('records')] + tickets
+    
+    tickets_df = pd.DataFrame(tickets)
+    
+    # Ticket metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        open_tickets = len(tickets_df[tickets_df['Status'] == 'Open'])
+        st.metric("Open Tickets", open_tickets)
+    
+    with col2:
+        high_priority = len(tickets_df[tickets_df['Priority'] == 'High'])
+        st.metric("High Priority", high_priority)
+    
+    with col3:
+        avg_response = "12.5 hours"
+        st.metric("Avg Response Time", avg_response)
+    
+    with col4:
+        resolution_rate = "94.2%"
+        st.metric("Resolution Rate", resolution_rate)
+    
+    # Filter tickets
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        status_filter = st.multiselect(
+            "Filter by Status",
+            options=statuses,
+            default=['Open', 'In Progress']
+        )
+    
+    with col2:
+        priority_filter = st.multiselect(
+            "Filter by Priority",
+            options=priorities,
+            default=['High', 'Medium']
+        )
+    
+    # Apply filters
+    filtered_tickets = tickets_df.copy()
+    
+    if status_filter:
+        filtered_tickets = filtered_tickets[filtered_tickets['Status'].isin(status_filter)]
+    
+    if priority_filter:
+        filtered_tickets = filtered_tickets[filtered_tickets['Priority'].isin(priority_filter)]
+    
+    # Display tickets
+    st.dataframe(filtered_tickets, use_container_width=True)
+    
+    # Create new ticket
+    with st.expander("➕ Create New Support Ticket", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            customer = st.selectbox("Customer", portal.customers['name'].tolist()[:20])
+            category = st.selectbox("Category", categories)
+            priority = st.selectbox("Priority", priorities)
+        
+        with col2:
+            assigned_to = st.selectbox("Assign To", ['Support Team A', 'Support Team B', 'Rajesh', 'Priya', 'Amit'])
+            sla = st.selectbox("SLA", ['Within 24h', 'Within 48h', 'Within 7 days'])
+        
+        subject = st.text_input("Subject").strip()
+        description = st.text_area("Description", height=150)
+        
+        if st.button("Create Ticket", type="primary"):
+            if not subject:
+                st.error("Enter the subject")
+            else:
+                try:
+                    ticket_id = portal.create('tickets', [{
+                        'customer': customer,
+                        'category': category,
+                        'priority': priority,
+                        'assigned_to': assigned_to,
+                        'sla': sla,
+                        'subject': subject,
+                        'description': description,
+                        'status': 'Open',
+                        'created_at': pd.Timestamp.now()
+                    }])
+                except OSError as error:
+                    st.error(f"Could not save the ticket: {error}")
+                else:
+                    st.success(f"Ticket {ticket_id} created successfully!")
+                    st.info(f"Assigned to: {assigned_to} | SLA: {sla}")
@@ -0,0 +1,386 @@
+"""Dashboard page"""
+
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from ui import SectionTimer, cached_chart, render_cards
+from analytics import create_ai_forecast, generate_ai_recommendations, get_dashboard_metrics, get_production_efficiency
+
+def dashboard_page():
+    """Main dashboard page"""
+    st.markdown('<h1 class="main-header">Manufacturing Central Portal</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">Real-time monitoring and analytics for manufacturing operations</p>', unsafe_allow_html=True)
+    
+    timer = SectionTimer('dashboard')
+    
+    # Alert Bar
+    timer.section('Alerts')
+    alerts = [
+        {"type": "critical", "message": "Machine #3 requires maintenance", "time": "2 hours ago"},
+        {"type": "warning", "message": "Low stock: Steel Sheets (45 units)", "time": "4 hours ago"},
+        {"type": "info", "message": "New lead from Google Ads: ₹2,50,000 potential", "time": "Today"},
+        {"type": "success", "message": "Order #ORD21045 shipped successfully", "time": "Yesterday"}
+    ]
+    
+    with st.container():
+        cols = st.columns(len(alerts))
+        for idx, alert in enumerate(alerts):
+            with cols[idx]:
+                st.markdown(f'<div class="alert-badge alert-{alert["type"]}">⚠️ {alert["message"]}</div>', unsafe_allow_html=True)
+    
+    # KPI Metrics
+    timer.section('Key Performance Indicators')
+    st.markdown('<h2 class="section-header">Key Performance Indicators</h2>', unsafe_allow_html=True)
+    
+    metrics = get_dashboard_metrics()
+    forecast_data = create_ai_forecast()
+    
+    # Create 4 columns for metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown('<div class="metric-card slide-in">', unsafe_allow_html=True)
+        st.metric("Total Revenue", f"₹{metrics['total_revenue']:,.0f}", 
+                 f"₹{forecast_data['metrics']['avg_monthly_forecast']/1000:,.0f}K forecast")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="metric-card slide-in">', unsafe_allow_html=True)
+        st.metric("Active Customers", metrics['active_customers'], 
+                 f"{metrics['new_leads']} new leads")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown('<div class="metric-card slide-in">', unsafe_allow_html=True)
+        st.metric("Production Efficiency", "86.5%", "2.3% ↑")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown('<div class="metric-card slide-in">', unsafe_allow_html=True)
+        st.metric("On-time Delivery", "92.3%", "1.2% ↑")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Second row of metrics
+    col5, col6, col7, col8 = st.columns(4)
+    
+    with col5:
+        st.markdown('<div class="metric-card slide-in">', unsafe_allow_html=True)
+        st.metric("Pending Orders", metrics['pending_orders'], "5 urgent")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col6:
+        st.markdown('<div class="metric-card slide-in">', unsafe_allow_html=True)
+        st.metric("Inventory Value", "₹4.2M", "₹150K to order")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col7:
+        st.markdown('<div class="metric-card slide-in">', unsafe_allow_html=True)
+        st.metric("Quality Yield", "97.8%", "0.5% ↑")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col8:
+        st.markdown('<div class="metric-card slide-in">', unsafe_allow_html=True)
+        st.metric("Employee Productivity", "88.4%", "1.8% ↑")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Charts Section
+    timer.section('Performance Analytics')
+    st.markdown('<h2 class="section-header">Performance Analytics</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="widget-card">', unsafe_allow_html=True)
+        st.markdown('<div class="widget-header">📈 Revenue Trend & Forecast</div>', unsafe_allow_html=True)
+        
+        # Create sales forecast chart
+        def revenue_chart():
+            fig = go.Figure()
+            
+            # Historical data
+            historical_months = st.session_state.portal.financial_data['revenue']['month'].tolist()[-6:]
+            historical_revenue = st.session_state.portal.financial_data['revenue']['revenue'].tolist()[-6:]
+            
+            fig.add_trace(go.Scatter(
+                x=historical_months,
+                y=historical_revenue,
+                mode='lines+markers',
+                name='Historical Revenue',
+                line=dict(color='#006400', width=3),
+                marker=dict(size=10)
+            ))
+            
+            # Forecast data
+            forecast_df = forecast_data['sales_forecast']
+            
+            fig.add_trace(go.Scatter(
+                x=forecast_df['Month'],
+                y=forecast_df['Forecast'],
+                mode='lines+markers',
+                name='AI Forecast',
+                line=dict(color='#FF8C00', width=3, dash='dash'),
+                marker=dict(size=10)
+            ))
+            
+            # Confidence interval
+            fig.add_trace(go.Scatter(
+                x=forecast_df['Month'].tolist() + forecast_df['Month'].tolist()[::-1],
+                y=forecast_df['Upper_Bound'].tolist() + forecast_df['Lower_Bound'].tolist()[::-1],
+                fill='toself',
+                fillcolor='rgba(255, 140, 0, 0.2)',
+                line=dict(color='rgba(255, 140, 0, 0)'),
+                name='95% Confidence Interval',
+                showlegend=True
+            ))
+            
+            fig.update_layout(
+                height=400,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=14),
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            return fig
+        
+        cached_chart('dashboard/revenue_trend', ['revenue', 'orders', 'customers', 'inventory'], revenue_chart, dated=True, use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="widget-card">', unsafe_allow_html=True)
+        st.markdown('<div class="widget-header">🏭 Production Status</div>', unsafe_allow_html=True)
+        
+        # Production status
+        status_data = get_production_efficiency()
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Indicator(
+            mode="gauge+number",
+            value=status_data['metrics']['avg_oee'],
+            title={'text': "OEE (%)"},
+            domain={'x': [0, 0.45], 'y': [0.5, 1]},
+            gauge={
+                'axis': {'range': [0, 100]},
+                'bar': {'color': "#006400"},
+                'steps': [
+                    {'range': [0, 70], 'color': "lightgray"},
+                    {'range': [70, 85], 'color': "gray"},
+                    {'range': [85, 100], 'color': "darkgray"}
+                ],
+                'threshold': {
+                    'line': {'color': "red", 'width': 4},
+                    'thickness': 0.75,
+                    'value': 85
+                }
+            }
+        ))
+        
+        fig.add_trace(go.Indicator(
+            mode="number",
+            value=status_data['metrics']['avg_defect_rate'],
+            title={'text': "Defect Rate (%)"},
+            domain={'x': [0.55, 1], 'y': [0.7, 1]},
+            number={'suffix': "%"}
+        ))
+        
+        fig.add_trace(go.Indicator(
+            mode="number",
+            value=status_data['metrics']['total_downtime'] / 60,
+            title={'text': "Downtime (hours)"},
+            domain={'x': [0.55, 1], 'y': [0.3, 0.6]},
+            number={'suffix': "h"}
+        ))
+        
+        fig.update_layout(
+            height=400,
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font=dict(size=14)
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Third row: Orders and Inventory
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="widget-card">', unsafe_allow_html=True)
+        st.markdown('<div class="widget-header">📊 Order Status Distribution</div>', unsafe_allow_html=True)
+        
+        def order_status_chart():
+            order_status = st.session_state.portal.totals('order_status')['count'].sort_values(ascending=False)
+            
+            fig = px.pie(
+                values=order_status.values,
+                names=order_status.index,
+                hole=0.4,
+                color_discrete_sequence=px.colors.sequential.Greens_r
+            )
+            
+            fig.update_layout(
+                height=350,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=14),
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=-0.2,
+                    xanchor="center",
+                    x=0.5
+                )
+            )
+            
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            return fig
+        
+        cached_chart('dashboard/order_status', ['orders'], order_status_chart, use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="widget-card">', unsafe_allow_html=True)
+        st.markdown('<div class="widget-header">📦 Inventory Status</div>', unsafe_allow_html=True)
+        
+        def inventory_status_chart():
+            inventory_status = st.session_state.portal.inventory['status'].value_counts()
+            
+            fig = px.bar(
+                x=inventory_status.index,
+                y=inventory_status.values,
+                color=inventory_status.index,
+                color_discrete_map={'In Stock': '#006400', 'Low Stock': '#FF8C00', 'Out of Stock': '#DC3545'},
+                text=inventory_status.values
+            )
+            
+            fig.update_layout(
+                height=350,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font=dict(size=14),
+                showlegend=False,
+                xaxis_title="Status",
+                yaxis_title="Count"
+            )
+            
+            fig.update_traces(texttemplate='%{text}', textposition='outside')
+            return fig
+        
+        cached_chart('dashboard/inventory_status', ['inventory'], inventory_status_chart, use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # AI Recommendations
+    timer.section('AI Recommendations')
+    st.markdown('<h2 class="section-header">🤖 AI Recommendations</h2>', unsafe_allow_html=True)
+    
+    recommendations = generate_ai_recommendations()
+    
+    if recommendations:
+        cols = st.columns(min(3, len(recommendations)))
+        
+        for idx, rec in enumerate(recommendations):
+            with cols[idx % 3]:
+                priority_color = {
+                    'high': '#DC3545',
+                    'medium': '#FF8C00',
+                    'low': '#006400'
+                }
+                
+                st.markdown(f'''
+                <div class="widget-card">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <h4>{rec['title']}</h4>
+                        <span style="background-color: {priority_color[rec['priority']]}; 
+                                    color: white; padding: 4px 12px; border-radius: 15px; 
+                                    font-size: 0.9rem; font-weight: 600;">
+                            {rec['priority'].upper()}
+                        </span>
+                    </div>
+                    <p>{rec['description']}</p>
+                    <div style="margin-top: 15px; padding: 10px; background-color: #f8f9fa; border-radius: 10px;">
+                        <strong>📌 Action:</strong> {rec['action']}<br>
+                        <strong>🎯 Impact:</strong> {rec['impact']}
+                    </div>
+                </div>
+                ''', unsafe_allow_html=True)
+    
+    # Recent Activity
+    timer.section('Recent Activity')
+    st.markdown('<h2 class="section-header">🕒 Recent Activity</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown('<div class="widget-card">', unsafe_allow_html=True)
+        st.markdown('<div class="widget-header">📝 Recent Orders</div>', unsafe_allow_html=True)
+        
+        recent_orders = st.session_state.portal.query('orders', order_by='order_date', descending=True, limit=5)
+        
+        status_colors = {
+            'Quote': '#6c757d',
+            'Confirmed': '#17a2b8',
+            'Production': '#ffc107',
+            'Shipped': '#28a745',
+            'Delivered': '#006400',
+            'Cancelled': '#dc3545'
+        }
+        recent_orders = recent_orders.assign(
+            status_color=recent_orders['status'].map(status_colors).fillna('#6c757d'))
+        
+        render_cards(recent_orders, '''
+            <div style="padding: 12px; margin: 8px 0; border-radius: 8px; border-left: 4px solid {status_color}; background: #f8f9fa;">
+                <div style="display: flex; justify-content: space-between;">
+                    <strong>{order_id}</strong>
+                    <span style="color: {status_color}; font-weight: 600;">{status}</span>
+                </div>
+                <div style="color: #666; font-size: 0.9rem;">
+                    Customer: {customer_id} | Amount: ₹{amount:,.0f}<br>
+                    Date: {order_date:%Y-%m-%d} | Priority: {priority}
+                </div>
+            </div>
+        ''', key='dashboard_recent_orders_page')
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="widget-card">', unsafe_allow_html=True)
+        st.markdown('<div class="widget-header">🔔 System Alerts</div>', unsafe_allow_html=True)
+        
+        system_alerts = [
+            {"type": "success", "message": "Production target achieved for week 45", "time": "2 hours ago"},
+            {"type": "warning", "message": "Maintenance due for CNC Machine #2", "time": "5 hours ago"},
+            {"type": "info", "message": "New software update available", "time": "1 day ago"},
+            {"type": "critical", "message": "Raw material delivery delayed", "time": "1 day ago"},
+            {"type": "success", "message": "Quality check passed for batch #2045", "time": "2 days ago"}
+        ]
+        
+        alert_icons = {
+            'success': '✅',
+            'warning': '⚠️',
+            'info': 'ℹ️',
+            'critical': '🚨'
+        }
+        system_alerts = [dict(alert, icon=alert_icons.get(alert['type'], '📌')) for alert in system_alerts]
+        
+        render_cards(system_alerts, '''
+            <div style="padding: 12px; margin: 8px 0; border-radius: 8px; background: #f8f9fa; border-left: 4px solid #ccc;">
+                <div style="display: flex; align-items: center; gap: 10px;">
+                    <span style="font-size: 1.2rem;">{icon}</span>
+                    <div style="flex: 1;">
+                        <div>{message}</div>
+                        <div style="color: #666; font-size: 0.9rem;">{time}</div>
+                    </div>
+                </div>
+            </div>
+        ''', key='dashboard_system_alerts_page')
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    timer.stop()
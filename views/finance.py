@@ -0,0 +1,667 @@
+"""Finance page: dashboard, revenue, expenses and cash flow"""
+
+import streamlit as st
+import pandas as pd
+from datetime import date, timedelta
+import plotly.express as px
+import plotly.graph_objects as go
+import random
+
+from ui import cached_chart, render_tabs
+from analytics import create_ai_forecast
+
+def finance_page():
+    """Financial management page"""
+    st.markdown('<h1 class="main-header">💰 Financial Management</h1>', unsafe_allow_html=True)
+    
+    render_tabs('finance', {
+        "Financial Dashboard": financial_dashboard_tab,
+        "Revenue Analysis": revenue_analysis_tab,
+        "Expense Tracking": expense_tracking_tab,
+        "Cash Flow": cash_flow_tab
+    })
+
+def financial_dashboard_tab():
+    """Financial Dashboard tab"""
+    st.markdown('<h2 class="section-header">Financial Dashboard</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    finance = portal.financial_data
+    
+    # Key financial metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        total_revenue = finance['revenue']['revenue'].sum()
+        st.metric("Total Revenue", f"₹{total_revenue:,.0f}")
+    
+    with col2:
+        total_profit = finance['revenue']['net_profit'].sum()
+        st.metric("Total Profit", f"₹{total_profit:,.0f}")
+    
+    with col3:
+        profit_margin = (total_profit / total_revenue * 100) if total_revenue > 0 else 0
+        st.metric("Profit Margin", f"{profit_margin:.1f}%")
+    
+    with col4:
+        current_cash = finance['cashflow']['balance'].iloc[-1]
+        st.metric("Cash Balance", f"₹{current_cash:,.0f}")
+    
+    # Financial charts
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Revenue vs Profit trend
+        def revenue_profit_chart():
+            fig = go.Figure()
+            
+            fig.add_trace(go.Scatter(
+                x=finance['revenue']['month'],
+                y=finance['revenue']['revenue'],
+                mode='lines+markers',
+                name='Revenue',
+                line=dict(color='#006400', width=3)
+            ))
+            
+            fig.add_trace(go.Scatter(
+                x=finance['revenue']['month'],
+                y=finance['revenue']['net_profit'],
+                mode='lines+markers',
+                name='Net Profit',
+                line=dict(color='#FF8C00', width=3)
+            ))
+            
+            fig.update_layout(
+                title='Revenue vs Net Profit Trend',
+                height=400,
+                xaxis_title="Month",
+                yaxis_title="Amount (₹)",
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            return fig
+        
+        cached_chart('finance/revenue_profit', ['revenue'], revenue_profit_chart, use_container_width=True)
+    
+    with col2:
+        # Expense breakdown
+        def expense_chart():
+            fig = px.pie(
+                finance['expenses'],
+                values='amount',
+                names='category',
+                title='Expense Distribution',
+                hole=0.4,
+                color_discrete_sequence=px.colors.sequential.Reds_r
+            )
+            
+            fig.update_layout(
+                height=400,
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)'
+            )
+            return fig
+        
+        cached_chart('finance/expenses', ['expenses'], expense_chart, use_container_width=True)
+    
+    # Financial ratios
+    st.markdown('<h3 class="subsection-header">Financial Ratios</h3>', unsafe_allow_html=True)
+    
+    # Calculate ratios
+    current_ratio = random.uniform(1.5, 3.0)  # Simulated
+    quick_ratio = random.uniform(1.0, 2.5)    # Simulated
+    debt_to_equity = random.uniform(0.3, 1.5) # Simulated
+    roe = (total_profit / 10000000) * 100     # Simulated equity base
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="metric-value">{current_ratio:.2f}</div>
+            <div class="metric-label">Current Ratio</div>
+            <div class="metric-change {'positive' if current_ratio > 2 else 'negative'}">
+                {'Good' if current_ratio > 2 else 'Needs Attention'}
+            </div>
+        </div>
+        ''', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="metric-value">{quick_ratio:.2f}</div>
+            <div class="metric-label">Quick Ratio</div>
+            <div class="metric-change {'positive' if quick_ratio > 1.5 else 'negative'}">
+                {'Strong' if quick_ratio > 1.5 else 'Adequate'}
+            </div>
+        </div>
+        ''', unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="metric-value">{debt_to_equity:.2f}</div>
+            <div class="metric-label">Debt to Equity</div>
+            <div class="metric-change {'positive' if debt_to_equity < 1 else 'negative'}">
+                {'Conservative' if debt_to_equity < 1 else 'Aggressive'}
+            </div>
+        </div>
+        ''', unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f'''
+        <div class="metric-card">
+            <div class="metric-value">{roe:.1f}%</div>
+            <div class="metric-label">Return on Equity</div>
+            <div class="metric-change {'positive' if roe > 15 else 'negative'}">
+                {'Excellent' if roe > 15 else 'Good'}
+            </div>
+        </div>
+        ''', unsafe_allow_html=True)
+
+def revenue_analysis_tab():
+    """Revenue Analysis tab"""
+    st.markdown('<h2 class="section-header">Revenue Analysis</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    finance = portal.financial_data
+    total_revenue = finance['revenue']['revenue'].sum()
+    
+    # Revenue breakdown
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Monthly revenue growth
+        def revenue_growth_chart():
+            revenue_growth = finance['revenue'].copy()
+            revenue_growth['growth'] = revenue_growth['revenue'].pct_change() * 100
+            
+            fig = go.Figure()
+            
+            fig.add_trace(go.Bar(
+                x=revenue_growth['month'],
+                y=revenue_growth['revenue'],
+                name='Revenue',
+                marker_color='#006400'
+            ))
+            
+            fig.add_trace(go.Scatter(
+                x=revenue_growth['month'],
+                y=revenue_growth['growth'],
+                name='Growth %',
+                yaxis='y2',
+                line=dict(color='#FF8C00', width=3)
+            ))
+            
+            fig.update_layout(
+                title='Monthly Revenue & Growth Rate',
+                height=400,
+                xaxis_title="Month",
+                yaxis_title="Revenue (₹)",
+                yaxis2=dict(
+                    title="Growth %",
+                    overlaying='y',
+                    side='right'
+                ),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                legend=dict(
+                    orientation="h",
+                    yanchor="bottom",
+                    y=1.02,
+                    xanchor="right",
+                    x=1
+                )
+            )
+            return fig
+        
+        cached_chart('finance/revenue_growth', ['revenue'], revenue_growth_chart, use_container_width=True)
+    
+    with col2:
+        # Revenue by product category (simulated)
+        product_revenue = []
+        for category, products in portal.products.items():
+            category_revenue = sum(p['price'] * random.randint(10, 100) for p in products)
+            product_revenue.append({
+                'Category': category,
+                'Revenue': category_revenue,
+                'Percentage': (category_revenue / total_revenue * 100) if total_revenue > 0 else 0
+            })
+        
+        product_revenue_df = pd.DataFrame(product_revenue)
+        
+        fig = px.bar(
+            product_revenue_df.sort_values('Revenue', ascending=False),
+            x='Category',
+            y='Revenue',
+            title='Revenue by Product Category',
+            color='Revenue',
+            color_continuous_scale='Greens'
+        )
+        
+        fig.update_layout(
+            height=400,
+            xaxis_title="Product Category",
+            yaxis_title="Revenue (₹)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            showlegend=False
+        )
+        
+        fig.update_xaxes(tickangle=45)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Revenue forecasting
+    st.markdown('<h3 class="subsection-header">Revenue Forecasting</h3>', unsafe_allow_html=True)
+    
+    forecast_data = create_ai_forecast()
+    
+    def revenue_forecast_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=finance['revenue']['month'].tail(6),
+            y=finance['revenue']['revenue'].tail(6),
+            mode='lines+markers',
+            name='Historical',
+            line=dict(color='#006400', width=3)
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=forecast_data['sales_forecast']['Month'],
+            y=forecast_data['sales_forecast']['Forecast'],
+            mode='lines+markers',
+            name='Forecast',
+            line=dict(color='#FF8C00', width=3, dash='dash')
+        ))
+        
+        # Confidence interval
+        fig.add_trace(go.Scatter(
+            x=forecast_data['sales_forecast']['Month'].tolist() + forecast_data['sales_forecast']['Month'].tolist()[::-1],
+            y=forecast_data['sales_forecast']['Upper_Bound'].tolist() + forecast_data['sales_forecast']['Lower_Bound'].tolist()[::-1],
+            fill='toself',
+            fillcolor='rgba(255, 140, 0, 0.2)',
+            line=dict(color='rgba(255, 140, 0, 0)'),
+            name='95% Confidence Interval',
+            showlegend=True
+        ))
+        
+        fig.update_layout(
+            title='Revenue Forecast (Next 6 Months)',
+            height=400,
+            xaxis_title="Month",
+            yaxis_title="Revenue (₹)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
+        )
+        return fig
+    
+    cached_chart('finance/revenue_forecast', ['revenue', 'orders', 'customers', 'inventory'], revenue_forecast_chart, dated=True, use_container_width=True)
+    
+    # Forecast metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            "6-Month Forecast",
+            f"₹{forecast_data['metrics']['total_forecast']:,.0f}",
+            f"₹{forecast_data['metrics']['avg_monthly_forecast']/1000:,.0f}K/month"
+        )
+    
+    with col2:
+        st.metric(
+            "Expected Growth",
+            f"{forecast_data['metrics']['growth_rate']:.1f}%",
+            "per 6 months"
+        )
+    
+    with col3:
+        st.metric(
+            "Confidence Level",
+            f"{forecast_data['metrics']['confidence_level']*100:.0f}%",
+            "Statistical confidence"
+        )
+
+def cash_flow_tab():
+    """Cash Flow tab"""
+    st.markdown('<h2 class="section-header">Cash Flow Management</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    finance = portal.financial_data
+    
+    # Cash flow metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        current_balance = finance['cashflow']['balance'].iloc[-1]
+        st.metric("Current Balance", f"₹{current_balance:,.0f}")
+    
+    with col2:
+        avg_daily_inflow = finance['cashflow']['inflow'].mean()
+        st.metric("Avg Daily Inflow", f"₹{avg_daily_inflow:,.0f}")
+    
+    with col3:
+        avg_daily_outflow = finance['cashflow']['outflow'].mean()
+        st.metric("Avg Daily Outflow", f"₹{avg_daily_outflow:,.0f}")
+    
+    # Cash flow chart
+    st.markdown('<h3 class="subsection-header">Cash Flow Analysis</h3>', unsafe_allow_html=True)
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=finance['cashflow']['date'],
+        y=finance['cashflow']['inflow'],
+        name='Inflow',
+        marker_color='#28a745'
+    ))
+    
+    fig.add_trace(go.Bar(
+        x=finance['cashflow']['date'],
+        y=finance['cashflow']['outflow'],
+        name='Outflow',
+        marker_color='#dc3545'
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=finance['cashflow']['date'],
+        y=finance['cashflow']['balance'],
+        name='Balance',
+        yaxis='y2',
+        line=dict(color='#006400', width=3)
+    ))
+    
+    fig.update_layout(
+        title='Daily Cash Flow',
+        height=500,
+        xaxis_title="Date",
+        yaxis_title="Daily Flow (₹)",
+        yaxis2=dict(
+            title="Balance (₹)",
+            overlaying='y',
+            side='right'
+        ),
+        barmode='group',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Accounts receivable/payable
+    st.markdown('<h3 class="subsection-header">Accounts Receivable & Payable</h3>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Accounts Receivable
+        ar_data = finance['invoices'][finance['invoices']['status'] != 'Paid']
+        ar_total = ar_data['amount'].sum()
+        ar_count = len(ar_data)
+        
+        st.markdown(f'''
+        <div class="widget-card">
+            <h4>📥 Accounts Receivable</h4>
+            <div style="font-size: 2.5rem; font-weight: 800; color: #006400; margin: 15px 0;">
+                ₹{ar_total:,.0f}
+            </div>
+            <div style="color: #666;">
+                {ar_count} unpaid invoices<br>
+                Avg days outstanding: 32 days<br>
+                Overdue: ₹{ar_data[ar_data['status'] == 'Overdue']['amount'].sum():,.0f}
+            </div>
+        </div>
+        ''', unsafe_allow_html=True)
+    
+    with col2:
+        # Accounts Payable (simulated)
+        ap_total = random.randint(500000, 2000000)
+        ap_count = random.randint(15, 40)
+        overdue_ap = random.randint(100000, 500000)
+        
+        st.markdown(f'''
+        <div class="widget-card">
+            <h4>📤 Accounts Payable</h4>
+            <div style="font-size: 2.5rem; font-weight: 800; color: #dc3545; margin: 15px 0;">
+                ₹{ap_total:,.0f}
+            </div>
+            <div style="color: #666;">
+                {ap_count} unpaid bills<br>
+                Avg days pending: 25 days<br>
+                Due this week: ₹{overdue_ap:,.0f}
+            </div>
+        </div>
+        ''', unsafe_allow_html=True)
+    
+    # Cash flow forecast
+    st.markdown('<h3 class="subsection-header">Cash Flow Forecast</h3>', unsafe_allow_html=True)
+    
+    # Simulated forecast
+    forecast_days = 30
+    forecast_dates = [(date.today() + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(1, forecast_days + 1)]
+    
+    forecast_inflow = []
+    forecast_outflow = []
+    forecast_balance = [current_balance]
+    
+    for i in range(forecast_days):
+        inflow = random.randint(50000, 500000)
+        outflow = random.randint(30000, 400000)
+        balance = forecast_balance[-1] + inflow - outflow
+        
+        forecast_inflow.append(inflow)
+        forecast_outflow.append(outflow)
+        forecast_balance.append(balance)
+    
+    forecast_balance = forecast_balance[1:]  # Remove initial balance
+    
+    def cash_flow_chart():
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scatter(
+            x=forecast_dates,
+            y=forecast_inflow,
+            mode='lines',
+            name='Forecast Inflow',
+            line=dict(color='#28a745', width=2, dash='dot')
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=forecast_dates,
+            y=forecast_outflow,
+            mode='lines',
+            name='Forecast Outflow',
+            line=dict(color='#dc3545', width=2, dash='dot')
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=forecast_dates,
+            y=forecast_balance,
+            mode='lines',
+            name='Forecast Balance',
+            line=dict(color='#006400', width=3)
+        ))
+        
+        fig.update_layout(
+            title='30-Day Cash Flow Forecast',
+            height=400,
+            xaxis_title="Date",
+            yaxis_title="Amount (₹)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            legend=dict(
+                orientation="h",
+                yanchor="bottom",
+                y=1.02,
+                xanchor="right",
+                x=1
+            )
+        )
+        return fig
+    
+    cached_chart('finance/cash_flow', ['cashflow'], cash_flow_chart, use_container_width=True)
+    
+    # Cash position alerts
+    min_cash_threshold = 1000000  # ₹10L minimum cash
+    
+    if current_balance < min_cash_threshold:
+        st.error(f"⚠️ Cash balance below minimum threshold! Current: ₹{current_balance:,.0f} | Minimum: ₹{min_cash_threshold:,.0f}")
+        
+        # Recommendations
+        st.markdown("**Recommendations:**")
+        st.markdown("""
+        1. Accelerate collection of overdue invoices
+        2. Defer non-essential expenses
+        3. Consider short-term financing options
+        4. Review credit terms with suppliers
+        """)
+    else:
+        st.success(f"✅ Healthy cash position: ₹{current_balance:,.0f} (above minimum threshold of ₹{min_cash_threshold:,.0f})")
+
+@st.fragment
+def expense_tracking_tab():
+    """Expense Tracking tab"""
+    st.markdown('<h2 class="section-header">Expense Tracking</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    finance = portal.financial_data
+    
+    # Expense tracking metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        total_expenses = finance['expenses']['amount'].sum()
+        st.metric("Total Expenses", f"₹{total_expenses:,.0f}")
+    
+    with col2:
+        budget_variance = ((finance['expenses']['amount'].sum() - finance['expenses']['budget'].sum()) / 
+                         finance['expenses']['budget'].sum() * 100) if finance['expenses']['budget'].sum() > 0 else 0
+        st.metric("Budget Variance", f"{budget_variance:.1f}%", 
+                 "Under" if budget_variance < 0 else "Over")
+    
+    with col3:
+        avg_expense = finance['expenses']['amount'].mean()
+        st.metric("Avg Expense per Category", f"₹{avg_expense:,.0f}")
+    
+    # Expense vs Budget
+    st.markdown('<h3 class="subsection-header">Expense vs Budget Analysis</h3>', unsafe_allow_html=True)
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        x=finance['expenses']['category'],
+        y=finance['expenses']['budget'],
+        name='Budget',
+        marker_color='#6c757d'
+    ))
+    
+    fig.add_trace(go.Bar(
+        x=finance['expenses']['category'],
+        y=finance['expenses']['amount'],
+        name='Actual',
+        marker_color='#006400'
+    ))
+    
+    fig.update_layout(
+        title='Expense vs Budget by Category',
+        height=500,
+        xaxis_title="Expense Category",
+        yaxis_title="Amount (₹)",
+        barmode='group',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Expense trends
+    st.markdown('<h3 class="subsection-header">Expense Trends</h3>', unsafe_allow_html=True)
+    
+    # Simulated monthly expense data
+    months = finance['revenue']['month'].tolist()
+    expense_categories = finance['expenses']['category'].tolist()
+    
+    monthly_expenses = []
+    for month in months:
+        for category in expense_categories:
+            monthly_expenses.append({
+                'Month': month,
+                'Category': category,
+                'Amount': random.randint(50000, 300000)
+            })
+    
+    monthly_expenses_df = pd.DataFrame(monthly_expenses)
+    
+    # Select top 3 expense categories for trend
+    top_categories = finance['expenses'].nlargest(3, 'amount')['category'].tolist()
+    top_expenses = monthly_expenses_df[monthly_expenses_df['Category'].isin(top_categories)]
+    
+    fig = px.line(
+        top_expenses,
+        x='Month',
+        y='Amount',
+        color='Category',
+        title='Top 3 Expense Categories Trend',
+        markers=True
+    )
+    
+    fig.update_layout(
+        height=400,
+        xaxis_title="Month",
+        yaxis_title="Amount (₹)",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Add new expense
+    with st.expander("➕ Add New Expense", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            expense_date = st.date_input("Expense Date", value=date.today())
+            category = st.selectbox("Category", expense_categories)
+        
+        with col2:
+            amount = st.number_input("Amount (₹)", min_value=0, value=1000)
+            payment_method = st.selectbox("Payment Method", 
+                                        ['Bank Transfer', 'Cheque', 'Cash', 'Online Payment', 'Credit Card'])
+        
+        with col3:
+            vendor = st.text_input("Vendor/Supplier")
+            reference = st.text_input("Reference Number")
+        
+        description = st.text_area("Description")
+        
+        if st.button("Record Expense", type="primary"):
+            st.success("Expense recorded successfully!")
+            st.info(f"₹{amount:,.0f} recorded under {category}")
@@ -0,0 +1,451 @@
+"""Inventory page: stock, reorder analysis, valuation and warehouses"""
+
+import streamlit as st
+import pandas as pd
+from datetime import date
+import plotly.express as px
+import random
+
+from analytics import get_class_matrix, get_item_classes, get_reorder_plan, get_stock_policy
+from ui import cached_chart, render_cards, render_tabs
+
+def inventory_page():
+    """Inventory management page"""
+    st.markdown('<h1 class="main-header">📦 Inventory Management</h1>', unsafe_allow_html=True)
+    
+    render_tabs('inventory', {
+        "Stock Overview": stock_overview_tab,
+        "Reorder Analysis": reorder_analysis_tab,
+        "Inventory Valuation": inventory_valuation_tab,
+        "Warehouse Management": warehouse_management_tab
+    })
+
+def stock_overview_tab():
+    """Stock Overview tab"""
+    st.markdown('<h2 class="section-header">Inventory Dashboard</h2>', unsafe_allow_html=True)
+    
+    # Inventory summary metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    portal = st.session_state.portal
+    
+    with col1:
+        total_items = len(portal.inventory)
+        st.metric("Total Items", total_items)
+    
+    with col2:
+        total_value = portal.inventory['value'].sum()
+        st.metric("Total Value", f"₹{total_value:,.0f}")
+    
+    with col3:
+        low_stock = len(portal.inventory[portal.inventory['current_stock'] < portal.inventory['min_stock']])
+        st.metric("Low Stock Items", low_stock, "Needs attention" if low_stock > 0 else "All good")
+    
+    with col4:
+        turnover = random.uniform(3.5, 8.5)
+        st.metric("Inventory Turnover", f"{turnover:.1f}x", "Good" if turnover > 5 else "Needs improvement")
+    
+    # Inventory by category
+    st.markdown('<h3 class="subsection-header">Inventory by Category</h3>', unsafe_allow_html=True)
+    
+    category_summary = portal.inventory.groupby('category', observed=True).agg({
+        'current_stock': 'sum',
+        'value': 'sum',
+        'item_id': 'count'
+    }).reset_index()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        def category_stock_chart():
+            fig = px.bar(
+                category_summary,
+                x='category',
+                y='current_stock',
+                title='Stock Quantity by Category',
+                color='category',
+                color_discrete_sequence=px.colors.sequential.Greens_r
+            )
+            fig.update_layout(height=400)
+            return fig
+        
+        cached_chart('inventory/category_stock', ['inventory'], category_stock_chart, use_container_width=True)
+    
+    with col2:
+        def category_value_chart():
+            fig = px.pie(
+                category_summary,
+                values='value',
+                names='category',
+                title='Inventory Value Distribution',
+                hole=0.4,
+                color_discrete_sequence=px.colors.sequential.Greens_r
+            )
+            fig.update_layout(height=400)
+            return fig
+        
+        cached_chart('inventory/category_value', ['inventory'], category_value_chart, use_container_width=True)
+    
+    # Low stock alerts
+    st.markdown('<h3 class="subsection-header">⚠️ Low Stock Alerts</h3>', unsafe_allow_html=True)
+    
+    low_stock_items = portal.inventory[
+        portal.inventory['current_stock'] < portal.inventory['min_stock']
+    ].sort_values('current_stock')
+    
+    if len(low_stock_items) > 0:
+        low_stock_items = low_stock_items.assign(shortage=low_stock_items['min_stock'] - low_stock_items['current_stock'])
+        render_cards(low_stock_items, '''
+            <div style="padding: 15px; margin: 10px 0; border-radius: 10px; background: linear-gradient(135deg, #fff5f5 0%, #ffe5e5 100%); border-left: 4px solid #dc3545;">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <strong>{name}</strong> ({item_id})<br>
+                        <span style="color: #666; font-size: 0.9rem;">
+                            Current: {current_stock} {unit} | Minimum: {min_stock} {unit}
+                        </span>
+                    </div>
+                    <div style="text-align: right;">
+                        <span style="color: #dc3545; font-weight: 600;">Shortage: {shortage} {unit}</span><br>
+                        <span style="color: #666; font-size: 0.9rem;">Location: {location}</span>
+                    </div>
+                </div>
+            </div>
+        ''', key='inventory_low_stock_page', page_size=5)
+    else:
+        st.success("✅ All inventory items are at or above minimum stock levels")
+
+def inventory_valuation_tab():
+    """Inventory Valuation tab"""
+    st.markdown('<h2 class="section-header">Inventory Valuation</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # Inventory valuation metrics
+    total_value = portal.inventory['value'].sum()
+    avg_value_per_item = total_value / len(portal.inventory)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Total Inventory Value", f"₹{total_value:,.0f}")
+    
+    with col2:
+        st.metric("Average Value per Item", f"₹{avg_value_per_item:,.0f}")
+    
+    with col3:
+        slow_moving = len(portal.inventory[portal.inventory['value'] > 10000])
+        st.metric("High-Value Items (>₹10K)", slow_moving)
+    
+    # Value distribution
+    st.markdown('<h3 class="subsection-header">Value Distribution Analysis</h3>', unsafe_allow_html=True)
+    
+    def value_distribution_chart():
+        fig = px.histogram(
+            portal.inventory,
+            x='value',
+            nbins=20,
+            title='Distribution of Item Values',
+            color_discrete_sequence=['#006400']
+        )
+        
+        fig.update_layout(
+            height=400,
+            xaxis_title="Item Value (₹)",
+            yaxis_title="Count",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)'
+        )
+        return fig
+    
+    cached_chart('inventory/value_distribution', ['inventory'], value_distribution_chart, use_container_width=True)
+    
+    # ABC/XYZ Analysis
+    st.markdown('<h3 class="subsection-header">ABC/XYZ Analysis</h3>', unsafe_allow_html=True)
+    
+    # Classes by consumption value (ABC) and demand variability (XYZ) from the stock movements
+    classes = get_item_classes()
+    matrix = get_class_matrix()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**Items per class**")
+        st.dataframe(matrix.pivot(index='ABC', columns='XYZ', values='Items'), use_container_width=True)
+        abc_summary = matrix.groupby('ABC').agg({'Items': 'sum', 'Consumption Value': 'sum', 'Value Share %': 'sum'})
+        st.dataframe(abc_summary, use_container_width=True)
+    
+    with col2:
+        def abc_xyz_chart():
+            shares = matrix.pivot(index='ABC', columns='XYZ', values='Value Share %')
+            fig = px.imshow(
+                shares,
+                text_auto='.1f',
+                title='Consumption Value Share % by Class',
+                color_continuous_scale='Greens'
+            )
+            fig.update_layout(height=300)
+            return fig
+        
+        cached_chart('inventory/abc_xyz', ['stock_movements', 'inventory'], abc_xyz_chart, dated=True, use_container_width=True)
+    
+    st.markdown("**Replenishment policy by class**")
+    st.dataframe(matrix, use_container_width=True, column_config={
+        'Consumption Value': st.column_config.NumberColumn(format='₹%.0f'),
+        'Value Share %': st.column_config.NumberColumn(format='%.1f'),
+    })
+    
+    cell = st.selectbox("Show the items of class", matrix.index, key='abc_xyz_cell')
+    cell_items = classes[classes['class'] == cell].sort_values('consumption_value', ascending=False)
+    st.dataframe(cell_items, use_container_width=True, hide_index=True)
+    
+    st.info("""
+    **ABC/XYZ Analysis Guide:**
+    - **A / B / C:** items making up the top 80%, the next 15% and the last 5% of the consumption value over the last six months
+    - **X / Y / Z:** steady (variation up to 0.5), fluctuating (up to 1.0) and erratic monthly demand; items without demand are Z
+    - **AX items** suit automatic replenishment; **CZ items** are best ordered on request
+    """)
+
+@st.fragment
+def warehouse_management_tab():
+    """Warehouse Management tab"""
+    st.markdown('<h2 class="section-header">Warehouse Management</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    ledger = portal.live_model('stock_ledger')
+    
+    # Warehouse locations: capacity from the warehouse table, usage kept by the ledger as movements land
+    warehouses = portal.query('warehouses')
+    usage = ledger.usage().reindex(warehouses['location'].astype(str), fill_value=0)
+    
+    cols = st.columns(len(warehouses))
+    for idx, (wh_name, capacity) in enumerate(zip(usage.index, warehouses['capacity'])):
+        with cols[idx]:
+            used, items = usage.loc[wh_name, 'stock'], usage.loc[wh_name, 'items']
+            utilization = (used / capacity) * 100 if capacity else 0.0
+            
+            st.markdown(f'''
+            <div class="widget-card">
+                <h4>{wh_name}</h4>
+                <div style="margin: 15px 0;">
+                    <div style="display: flex; justify-content: space-between;">
+                        <span>Utilization:</span>
+                        <span>{utilization:.1f}%</span>
+                    </div>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: {min(utilization, 100)}%"></div>
+                    </div>
+                </div>
+                <div style="color: #666; font-size: 0.9rem;">
+                    📦 {items:,} items<br>
+                    📊 {used:,} / {capacity:,} units
+                </div>
+            </div>
+            ''', unsafe_allow_html=True)
+    
+    # Record a movement on the stock ledger
+    with st.expander("➕ Record Stock Movement", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            movement_type = st.selectbox("Movement Type", portal.MOVEMENT_TYPES, key='movement_type')
+            item_id = st.text_input("Item ID", key='movement_item').strip()
+            quantity = st.number_input("Quantity", value=1, step=1, key='movement_quantity')
+        
+        with col2:
+            location = st.selectbox("Location", portal.LOCATIONS, key='movement_location')
+            destination = st.selectbox("Transfer To", portal.LOCATIONS, index=1, key='movement_destination')
+            user = st.selectbox("Recorded By", portal.STOREKEEPERS, key='movement_user')
+        
+        st.caption("Adjustments take a signed quantity; transfers move stock from the location to the "
+                   "destination.")
+        
+        if st.button("Record Movement", type="primary"):
+            # Issues and the outgoing half of a transfer are booked as negative quantities
+            sign = -1 if movement_type in ('Issue', 'Transfer') else 1
+            if portal.count('inventory', {'item_id': item_id}) == 0:
+                st.error(f"No inventory item {item_id!r}")
+            elif quantity == 0 or (quantity < 0 and movement_type != 'Adjustment'):
+                st.error("Enter a positive quantity (adjustments may be negative)")
+            elif movement_type == 'Transfer' and destination == location:
+                st.error("Pick a destination other than the location")
+            else:
+                booked = pd.Timestamp.now().floor('s')
+                rows = [{'item_id': item_id, 'location': location, 'date': booked, 'type': movement_type,
+                         'quantity': sign * int(quantity), 'user': user}]
+                if movement_type == 'Transfer':
+                    rows.append(dict(rows[0], location=destination, quantity=int(quantity)))
+                # The stock check runs with the write, so it holds against other sessions
+                try:
+                    movement_id = portal.record_movement(rows)
+                except ValueError as error:
+                    st.error(str(error))
+                except OSError as error:
+                    st.error(f"Could not save the movement: {error}")
+                else:
+                    st.success(f"Movement {movement_id} recorded successfully!")
+    
+    # Stock of one item as of a date, from the ledger
+    st.markdown('<h3 class="subsection-header">Stock Ledger</h3>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        ledger_item = st.text_input("Item ID", value=portal.query('inventory', columns=['item_id'], limit=1)
+                                    ['item_id'].iloc[0], key='ledger_item').strip()
+    with col2:
+        # Starts at the item's own location whenever another item is entered
+        home = portal.query('inventory', where={'item_id': ledger_item}, columns=['location'], limit=1)['location']
+        ledger_location = st.selectbox("Location", portal.LOCATIONS,
+                                       index=portal.LOCATIONS.index(home.iloc[0]) if len(home) else 0)
+    with col3:
+        as_of = st.date_input("As of", value=date.today(), key='ledger_as_of')
+    
+    # A date covers the movements of the whole day
+    end_of_day = pd.Timestamp(as_of) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+    history = ledger.history(ledger_item, ledger_location)
+    if len(history):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric(f"Stock as of {as_of:%d %b %Y}",
+                      f"{ledger.stock_at([ledger_item], [ledger_location], end_of_day)[0]:,}")
+        with col2:
+            st.metric("Stock Now", f"{ledger.current([ledger_item], [ledger_location])[0]:,}")
+        
+        fig = px.line(history, x='date', y='balance', line_shape='hv', markers=True,
+                      title=f'Running Balance of {ledger_item} at {ledger_location}',
+                      labels={'date': 'Date', 'balance': 'Stock'})
+        fig.add_vline(x=end_of_day, line_dash='dash', line_color='gray')
+        fig.update_layout(height=350, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info(f"No movements of {ledger_item} at {ledger_location}")
+    
+    # Movement log
+    st.markdown('<h3 class="subsection-header">Recent Inventory Movements</h3>', unsafe_allow_html=True)
+    
+    recent = portal.query('stock_movements', order_by='date', descending=True, limit=20)
+    names = portal.query('inventory', where={'item_id': recent['item_id'].unique().tolist()},
+                         columns=['item_id', 'name']).drop_duplicates('item_id').set_index('item_id')['name']
+    movements_df = pd.DataFrame({
+        'Date': recent['date'].dt.strftime('%Y-%m-%d'),
+        'Time': recent['date'].dt.strftime('%H:%M'),
+        'Movement': recent['movement_id'],
+        'Item ID': recent['item_id'],
+        'Item': recent['item_id'].map(names),
+        'Type': recent['type'],
+        'Quantity': recent['quantity'],
+        'Location': recent['location'],
+        'User': recent['user']
+    })
+    st.dataframe(movements_df, use_container_width=True, hide_index=True)
+
+@st.fragment
+def reorder_analysis_tab():
+    """Reorder Analysis tab"""
+    st.markdown('<h2 class="section-header">Reorder Analysis</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # Service levels of the ABC/XYZ cells; changing one re-plans the whole catalogue
+    with st.expander("🎯 Service Level What-If", expanded=False):
+        st.caption("Change the target service level of any ABC/XYZ cell to re-plan every item with it: "
+                   "safety stocks, suggested min/max levels and the reorder list below follow.")
+        policy_levels = get_class_matrix()['Service Level %']
+        edited = st.data_editor(
+            policy_levels.reset_index(), hide_index=True, disabled=['Class'], key='service_levels',
+            column_config={'Service Level %': st.column_config.NumberColumn(min_value=50.0, max_value=99.9,
+                                                                            step=0.5, format='%.1f')})
+        # A cleared or out-of-range cell keeps its policy level
+        entered = pd.to_numeric(edited['Service Level %'], errors='coerce')
+        invalid = ~((entered > 0) & (entered < 100)).to_numpy()
+        if invalid.any():
+            st.warning(f"Service levels must lie between 0% and 100%; kept the policy level of "
+                       f"{', '.join(edited['Class'][invalid].astype(str))}")
+        entered = entered.where(~invalid, policy_levels.to_numpy()).to_numpy(dtype=float)
+        # Only the cells that differ from their policy, so the default plan is shared
+        changed = entered != policy_levels.to_numpy()
+        levels = tuple((cell, level / 100) for cell, level in zip(edited['Class'][changed], entered[changed]))
+        
+        baseline, scenario = get_stock_policy(), get_stock_policy(levels)
+        safety_value = [(policy['Safety Stock'] * policy['Unit Cost']).sum() for policy in (baseline, scenario)]
+        yearly_cost = [(policy['Holding Cost'] + policy['Ordering Cost']).sum() for policy in (baseline, scenario)]
+        service = [policy['Service Level %'].mean() for policy in (baseline, scenario)]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Safety Stock Value", f"₹{safety_value[1]:,.0f}",
+                      f"{safety_value[1] - safety_value[0]:+,.0f} vs policy" if levels else None,
+                      delta_color='inverse')
+        
+        with col2:
+            st.metric("Yearly Holding + Ordering Cost", f"₹{yearly_cost[1]:,.0f}",
+                      f"{yearly_cost[1] - yearly_cost[0]:+,.0f} vs policy" if levels else None,
+                      delta_color='inverse')
+        
+        with col3:
+            st.metric("Avg Service Level", f"{service[1]:.1f}%",
+                      f"{service[1] - service[0]:+.1f} pts vs policy" if levels else None)
+        
+        # Stock policy per cell
+        summary = scenario.groupby('Class', observed=False).agg(**{
+            'Items': ('Item ID', 'size'), 'Service Level %': ('Service Level %', 'mean'), 'Avg EOQ': ('EOQ', 'mean'),
+            'Safety Stock': ('Safety Stock', 'sum'), 'Avg Suggested Min': ('Suggested Min', 'mean'),
+            'Avg Suggested Max': ('Suggested Max', 'mean')})
+        st.dataframe(summary.round(1), use_container_width=True)
+    
+    reorder_df = get_reorder_plan(levels)
+    
+    if len(reorder_df):
+        # Summary
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            critical_items = int((reorder_df['Status'] == 'Critical').sum())
+            st.metric("Critical Items", critical_items)
+        
+        with col2:
+            st.metric("Items to Reorder", f"{len(reorder_df):,}")
+        
+        with col3:
+            total_reorder_qty = reorder_df['Reorder Qty'].sum()
+            st.metric("Total Reorder Qty", f"{total_reorder_qty:,}")
+        
+        # Display reorder list, most urgent first
+        st.caption("Reorder points are the suggested min stock: the demand over the supplier lead time plus a "
+                   "safety stock for the item's service level. Orders bring the stock, net of open purchase "
+                   "orders, up to the suggested max, one economic order quantity above. Select rows to order them.")
+        selection = st.dataframe(reorder_df, use_container_width=True, hide_index=True, on_select='rerun',
+                                 selection_mode='multi-row', key='reorder_selection')
+        
+        # Generate purchase order
+        st.markdown('<h3 class="subsection-header">Generate Purchase Orders</h3>', unsafe_allow_html=True)
+        
+        # Without a selection the most urgent critical items are proposed
+        rows = selection.selection.rows
+        if rows:
+            selected_df = reorder_df.iloc[sorted(rows)]
+        else:
+            selected_df = reorder_df[reorder_df['Status'] == 'Critical'].head(3)
+        selected_items = selected_df.to_dict('records')
+        
+        if selected_items:
+            st.markdown("**Selected Items for Purchase Order:**")
+            for item in selected_items[:20]:
+                st.write(f"- {item['Item Name']} ({item['Location']}): {item['Reorder Qty']} {item['Unit']}")
+            if len(selected_items) > 20:
+                st.caption(f"...and {len(selected_items) - 20:,} more")
+            
+            if st.button("📋 Generate Purchase Order", type="primary"):
+                try:
+                    po_number = portal.create('purchase_orders', [{
+                        'item_id': item['Item ID'],
+                        'item_name': item['Item Name'],
+                        'quantity': item['Reorder Qty'],
+                        'unit': item['Unit'],
+                        'status': 'Open',
+                        'created_at': pd.Timestamp.now()
+                    } for item in selected_items])
+                except OSError as error:
+                    st.error(f"Could not save the purchase order: {error}")
+                else:
+                    st.success(f"Purchase Order {po_number} generated successfully!")
+                    st.info("Purchase order has been sent to suppliers for quotation")
+    else:
+        st.success("✅ No items require reordering at this time")
@@ -0,0 +1,603 @@
+"""Marketing page: campaigns, leads, analytics and content calendar"""
+
+import streamlit as st
+import pandas as pd
+from datetime import date, timedelta
+import plotly.express as px
+import plotly.graph_objects as go
+import random
+
+from ui import cached_chart, render_cards, render_tabs
+
+def marketing_page():
+    """Marketing management page"""
+    st.markdown('<h1 class="main-header">🎯 Marketing & Lead Management</h1>', unsafe_allow_html=True)
+    
+    render_tabs('marketing', {
+        "Campaign Dashboard": campaign_dashboard_tab,
+        "Lead Management": lead_management_tab,
+        "Marketing Analytics": marketing_analytics_tab,
+        "Content Calendar": content_calendar_tab
+    })
+
+def marketing_analytics_tab():
+    """Marketing Analytics tab"""
+    st.markdown('<h2 class="section-header">Marketing Analytics</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # ROI Analysis
+    st.markdown('<h3 class="subsection-header">Marketing ROI Analysis</h3>', unsafe_allow_html=True)
+    
+    roi_data = portal.marketing_campaigns.copy()
+    roi_data['roi_category'] = pd.cut(roi_data['roi'], 
+                                     bins=[0, 100, 200, 500, 1000],
+                                     labels=['Low (<100%)', 'Medium (100-200%)', 'High (200-500%)', 'Very High (>500%)'])
+    
+    roi_summary = roi_data.groupby('roi_category').agg({
+        'campaign_id': 'count',
+        'budget': 'sum',
+        'roi': 'mean'
+    }).reset_index()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.bar(
+            roi_summary,
+            x='roi_category',
+            y='campaign_id',
+            title='Campaigns by ROI Category',
+            color='roi_category',
+            text='campaign_id'
+        )
+        
+        fig.update_layout(
+            height=400,
+            xaxis_title="ROI Category",
+            yaxis_title="Number of Campaigns",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            showlegend=False
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.scatter(
+            roi_data,
+            x='budget',
+            y='roi',
+            size='leads_generated',
+            color='platform',
+            hover_name='name',
+            title='Budget vs ROI by Platform',
+            log_x=True
+        )
+        
+        fig.update_layout(
+            height=400,
+            xaxis_title="Budget (₹)",
+            yaxis_title="ROI (%)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)'
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Lead Source Analysis
+    st.markdown('<h3 class="subsection-header">Lead Source Effectiveness</h3>', unsafe_allow_html=True)
+    
+    lead_source_analysis = portal.leads.groupby('source', observed=True).agg({
+        'lead_id': 'count',
+        'value': 'sum',
+        'conversion_probability': 'mean'
+    }).reset_index()
+    
+    lead_source_analysis.columns = ['Source', 'Lead Count', 'Total Value', 'Avg Conversion Probability']
+    
+    fig = px.bar(
+        lead_source_analysis.sort_values('Lead Count', ascending=False),
+        x='Source',
+        y=['Lead Count', 'Total Value'],
+        title='Lead Generation by Source',
+        barmode='group'
+    )
+    
+    fig.update_layout(
+        height=400,
+        xaxis_title="Lead Source",
+        yaxis_title="Count / Value",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Cost Analysis
+    st.markdown('<h3 class="subsection-header">Marketing Cost Analysis</h3>', unsafe_allow_html=True)
+    
+    cost_data = portal.marketing_campaigns.copy()
+    cost_data['cost_per_conversion'] = cost_data['spent'] / cost_data['conversions']
+    cost_data['leads_per_spent'] = cost_data['leads_generated'] / cost_data['spent']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = px.box(
+            cost_data,
+            y='cost_per_lead',
+            title='Cost per Lead Distribution',
+            points='all'
+        )
+        
+        fig.update_layout(
+            height=300,
+            yaxis_title="Cost per Lead (₹)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)'
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        fig = px.box(
+            cost_data,
+            y='cost_per_conversion',
+            title='Cost per Conversion Distribution',
+            points='all'
+        )
+        
+        fig.update_layout(
+            height=300,
+            yaxis_title="Cost per Conversion (₹)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)'
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def campaign_dashboard_tab():
+    """Campaign Dashboard tab"""
+    st.markdown('<h2 class="section-header">Marketing Campaign Dashboard</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # Campaign metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        active_campaigns = portal.count('marketing_campaigns', {'status': 'Active'})
+        st.metric("Active Campaigns", active_campaigns)
+    
+    with col2:
+        total_leads = portal.leads['lead_id'].nunique()
+        st.metric("Total Leads", total_leads)
+    
+    with col3:
+        lead_statuses = portal.totals('lead_status')['count']
+        conversion_rate = (lead_statuses.get('Closed Won', 0) / lead_statuses.sum() * 100) if lead_statuses.sum() > 0 else 0
+        st.metric("Conversion Rate", f"{conversion_rate:.1f}%")
+    
+    with col4:
+        avg_cost_per_lead = portal.marketing_campaigns['cost_per_lead'].mean()
+        st.metric("Avg Cost per Lead", f"₹{avg_cost_per_lead:,.0f}")
+    
+    # Campaign performance
+    st.markdown('<h3 class="subsection-header">Campaign Performance</h3>', unsafe_allow_html=True)
+    
+    # Top performing campaigns
+    top_campaigns = portal.marketing_campaigns.sort_values('roi', ascending=False).head(5)
+    
+    def top_campaigns_chart():
+        fig = px.bar(
+            top_campaigns,
+            x='name',
+            y='roi',
+            title='Top 5 Campaigns by ROI',
+            color='roi',
+            color_continuous_scale='Greens',
+            text='roi'
+        )
+        
+        fig.update_layout(
+            height=400,
+            xaxis_title="Campaign",
+            yaxis_title="ROI (%)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            showlegend=False
+        )
+        
+        fig.update_traces(texttemplate='%{text}%', textposition='outside')
+        fig.update_xaxes(tickangle=45)
+        return fig
+    
+    cached_chart('marketing/top_campaigns', ['marketing_campaigns'], top_campaigns_chart, use_container_width=True)
+    
+    # Campaign status overview
+    st.markdown('<h3 class="subsection-header">Campaign Status Overview</h3>', unsafe_allow_html=True)
+    
+    campaign_status = portal.marketing_campaigns['status'].value_counts().reset_index()
+    campaign_status.columns = ['Status', 'Count']
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        def campaign_status_chart():
+            fig = px.pie(
+                campaign_status,
+                values='Count',
+                names='Status',
+                title='Campaign Status Distribution',
+                hole=0.4,
+                color_discrete_sequence=px.colors.sequential.Blues_r
+            )
+            
+            fig.update_layout(height=400)
+            return fig
+        
+        cached_chart('marketing/campaign_status', ['marketing_campaigns'], campaign_status_chart, use_container_width=True)
+    
+    with col2:
+        # Campaign timeline
+        active_campaigns = portal.query('marketing_campaigns', {'status': 'Active'})
+        
+        if len(active_campaigns) > 0:
+            st.markdown("**Active Campaigns Timeline:**")
+            
+            active_campaigns = active_campaigns.assign(
+                days_left=(active_campaigns['end_date'] - pd.Timestamp.now()).dt.days,
+                days_left_color=lambda frame: frame['days_left'].gt(7).map({True: '#28a745', False: '#ffc107'})
+            )
+            
+            render_cards(active_campaigns, '''
+                <div style="padding: 12px; margin: 8px 0; border-radius: 8px; background: #f8f9fa; border-left: 4px solid #1E90FF;">
+                    <div style="display: flex; justify-content: space-between; align-items: center;">
+                        <div>
+                            <strong>{name}</strong><br>
+                            <span style="color: #666; font-size: 0.9rem;">
+                                {platform} | Budget: ₹{budget:,.0f}
+                            </span>
+                        </div>
+                        <div style="text-align: right;">
+                            <span style="color: {days_left_color}; font-weight: 600;">
+                                {days_left} days left
+                            </span><br>
+                            <span style="color: #666; font-size: 0.9rem;">
+                                ROI: {roi}%
+                            </span>
+                        </div>
+                    </div>
+                </div>
+            ''', key='marketing_active_campaigns_page', page_size=10)
+        else:
+            st.info("No active campaigns at the moment")
+    
+    # Create new campaign
+    with st.expander("➕ Launch New Campaign", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            campaign_name = st.text_input("Campaign Name")
+            platform = st.selectbox("Platform", 
+                                  ['Email', 'LinkedIn', 'Google Ads', 'Trade Show', 'Social Media'])
+            target_audience = st.selectbox("Target Audience",
+                                         ['Manufacturing Companies', 'Construction Firms', 
+                                          'Hospitality Sector', 'Government Projects', 'All Industries'])
+        
+        with col2:
+            budget = st.number_input("Budget (₹)", min_value=1000, value=50000)
+            start_date = st.date_input("Start Date", value=date.today())
+            end_date = st.date_input("End Date", value=date.today() + timedelta(days=30))
+        
+        campaign_manager = st.selectbox("Campaign Manager",
+                                      ['Marketing Team', 'Sales Team', 'External Agency', 'Rajesh Kumar', 'Priya Sharma'])
+        
+        objectives = st.text_area("Campaign Objectives")
+        
+        if st.button("Launch Campaign", type="primary"):
+            campaign_id = f"CAMP{random.randint(70000, 79999)}"
+            st.success(f"Campaign '{campaign_name}' launched successfully!")
+            st.info(f"Campaign ID: {campaign_id} | Budget: ₹{budget:,.0f}")
+
+@st.fragment
+def lead_management_tab():
+    """Lead Management tab"""
+    st.markdown('<h2 class="section-header">Lead Management System</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # Lead metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    lead_totals = portal.totals('lead_status')
+    status_counts = lead_totals['count']
+    status_values = lead_totals['total']
+    
+    with col1:
+        new_leads = status_counts.get('New', 0)
+        st.metric("New Leads", new_leads)
+    
+    with col2:
+        qualified_leads = status_counts.get('Qualified', 0)
+        st.metric("Qualified Leads", qualified_leads)
+    
+    with col3:
+        pipeline_value = sum(status_values.get(stage, 0) for stage in ['New', 'Contacted', 'Qualified', 'Proposal Sent'])
+        st.metric("Pipeline Value", f"₹{pipeline_value:,.0f}")
+    
+    with col4:
+        closed_leads = status_counts.get('Closed Won', 0) + status_counts.get('Closed Lost', 0)
+        win_rate = (status_counts.get('Closed Won', 0) / closed_leads * 100) if closed_leads > 0 else 0
+        st.metric("Win Rate", f"{win_rate:.1f}%")
+    
+    # Lead pipeline
+    st.markdown('<h3 class="subsection-header">Lead Pipeline</h3>', unsafe_allow_html=True)
+    
+    lead_stages = ['New', 'Contacted', 'Qualified', 'Proposal Sent', 'Negotiation', 'Closed Won', 'Closed Lost']
+    lead_counts = []
+    lead_values = []
+    
+    for stage in lead_stages:
+        lead_counts.append(status_counts.get(stage, 0))
+        lead_values.append(status_values.get(stage, 0))
+    
+    def lead_funnel_chart():
+        fig = go.Figure(go.Funnel(
+            y=lead_stages,
+            x=lead_counts,
+            textposition="inside",
+            textinfo="value+percent initial",
+            opacity=0.8,
+            marker={"color": ["#1E90FF", "#87CEEB", "#90EE90", "#FF8C00", "#FFD700", "#28a745", "#dc3545"]}
+        ))
+        
+        fig.update_layout(
+            height=500,
+            title="Lead Conversion Funnel",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)'
+        )
+        return fig
+    
+    cached_chart('marketing/lead_funnel', ['leads'], lead_funnel_chart, use_container_width=True)
+    
+    # Lead list with filters
+    st.markdown('<h3 class="subsection-header">Lead Management</h3>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        lead_status_filter = st.multiselect(
+            "Filter by Status",
+            options=portal.leads['status'].unique(),
+            default=['New', 'Contacted', 'Qualified']
+        )
+    
+    with col2:
+        source_filter = st.multiselect(
+            "Filter by Source",
+            options=portal.leads['source'].unique(),
+            default=[]
+        )
+    
+    with col3:
+        assigned_filter = st.multiselect(
+            "Filter by Assigned To",
+            options=portal.leads['assigned_to'].unique(),
+            default=[]
+        )
+    
+    # Apply filters
+    filtered_leads = portal.leads.copy()
+    
+    if lead_status_filter:
+        filtered_leads = filtered_leads[filtered_leads['status'].isin(lead_status_filter)]
+    
+    if source_filter:
+        filtered_leads = filtered_leads[filtered_leads['source'].isin(source_filter)]
+    
+    if assigned_filter:
+        filtered_leads = filtered_leads[filtered_leads['assigned_to'].isin(assigned_filter)]
+    
+    # Display leads
+    st.dataframe(
+        filtered_leads[
+            ['lead_id', 'name', 'company', 'source', 'status', 'value', 
+             'conversion_probability', 'assigned_to', 'next_followup']
+        ].sort_values('conversion_probability', ascending=False),
+        use_container_width=True
+    )
+    
+    # Add new lead
+    with st.expander("➕ Add New Lead", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            lead_name = st.text_input("Lead Name").strip()
+            company = st.text_input("Company").strip()
+            email = st.text_input("Email")
+            phone = st.text_input("Phone")
+        
+        with col2:
+            source = st.selectbox("Source", portal.leads['source'].unique())
+            product_interest = st.selectbox("Product Interest", 
+                                          ['Lockers', 'HVAC Ducts', 'Electrical Panels', 'Fabrication', 'Laser Cutting'])
+            estimated_value = st.number_input("Estimated Value (₹)", min_value=0, value=50000)
+            assigned_to = st.selectbox("Assign To", portal.leads['assigned_to'].unique())
+        
+        notes = st.text_area("Notes")
+        
+        if st.button("Add Lead", type="primary"):
+            missing = [label for label, value in (("lead name", lead_name), ("company", company)) if not value]
+            if missing:
+                st.error(f"Enter the {' and '.join(missing)}")
+            else:
+                today = pd.Timestamp(date.today())
+                try:
+                    lead_id = portal.create('leads', [{
+                        'name': lead_name,
+                        'company': company,
+                        'email': email,
+                        'phone': phone,
+                        'source': source,
+                        'status': 'New',
+                        'product_interest': product_interest,
+                        'value': estimated_value,
+                        'created_date': today,
+                        'last_contact': today,
+                        'next_followup': today + timedelta(days=3),
+                        'assigned_to': assigned_to,
+                        'priority': 'Medium',
+                        'notes': notes,
+                        'conversion_probability': 10
+                    }])
+                except OSError as error:
+                    st.error(f"Could not save the lead: {error}")
+                else:
+                    st.success(f"Lead '{lead_name}' added successfully!")
+                    st.info(f"Lead ID: {lead_id} | Assigned to: {assigned_to}")
+
+@st.fragment
+def content_calendar_tab():
+    """Content Calendar tab"""
+    st.markdown('<h2 class="section-header">Content & Event Calendar</h2>', unsafe_allow_html=True)
+    
+    # Content calendar
+    events = []
+    event_types = ['Blog Post', 'Social Media', 'Email Newsletter', 'Webinar', 'Trade Show', 'Product Launch']
+    
+    for i in range(20):
+        event_date = date.today() + timedelta(days=random.randint(0, 60))
+        events.append({
+            'Date': event_date.strftime('%Y-%m-%d'),
+            'Event': random.choice(event_types),
+            'Title': f"{random.choice(['Q4', 'New Product', 'Industry', 'Case Study'])} {random.choice(['Launch', 'Update', 'Report', 'Webinar'])}",
+            'Platform': random.choice(['Website', 'LinkedIn', 'Email', 'All Platforms']),
+            'Status': random.choice(['Scheduled', 'In Progress', 'Completed', 'Cancelled']),
+            'Assigned To': random.choice(['Marketing Team', 'Content Team', 'External Agency', 'Rajesh', 'Priya'])
+        })
+    
+    events_df = pd.DataFrame(events)
+    
+    # Filter events
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        event_type_filter = st.multiselect(
+            "Filter by Event Type",
+            options=event_types,
+            default=event_types
+        )
+    
+    with col2:
+        status_filter = st.multiselect(
+            "Filter by Status",
+            options=events_df['Status'].unique(),
+            default=['Scheduled', 'In Progress']
+        )
+    
+    # Apply filters
+    filtered_events = events_df.copy()
+    
+    if event_type_filter:
+        filtered_events = filtered_events[filtered_events['Event'].isin(event_type_filter)]
+    
+    if status_filter:
+        filtered_events = filtered_events[filtered_events['Status'].isin(status_filter)]
+    
+    # Display calendar
+    st.dataframe(
+        filtered_events.sort_values('Date'),
+        use_container_width=True
+    )
+    
+    # Monthly calendar view
+    st.markdown('<h3 class="subsection-header">Monthly Calendar View</h3>', unsafe_allow_html=True)
+    
+    # Create a simple calendar view for current month
+    current_month = date.today().strftime('%B %Y')
+    st.subheader(f"📅 {current_month}")
+    
+    # Get days in current month
+    today = date.today()
+    first_day = today.replace(day=1)
+    last_day = (first_day + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    
+    # Create calendar grid
+    days_in_month = last_day.day
+    first_weekday = first_day.weekday()  # Monday=0, Sunday=6
+    
+    # Create calendar
+    calendar_html = '''
+    <div style="background: white; border-radius: 10px; padding: 20px; margin: 20px 0;">
+        <div style="display: grid; grid-template-columns: repeat(7, 1fr); gap: 5px; text-align: center;">
+    '''
+    
+    # Day headers
+    days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    for day in days:
+        calendar_html += f'<div style="font-weight: bold; padding: 10px; background: #f8f9fa; border-radius: 5px;">{day}</div>'
+    
+    # Empty cells for days before first day of month
+    for _ in range(first_weekday):
+        calendar_html += '<div style="padding: 10px;"></div>'
+    
+    # Days of the month
+    month_events = filtered_events[filtered_events['Date'].str.startswith(today.strftime('%Y-%m'))]
+    
+    for day in range(1, days_in_month + 1):
+        day_str = f"{today.strftime('%Y-%m')}-{day:02d}"
+        day_events = month_events[month_events['Date'] == day_str]
+        
+        cell_class = "today" if day == today.day else ""
+        event_count = len(day_events)
+        
+        calendar_html += f'''
+        <div style="padding: 10px; border-radius: 5px; background: {'#e3f2fd' if event_count > 0 else '#f8f9fa'}; 
+                     border: {'2px solid #1E90FF' if day == today.day else '1px solid #dee2e6'};">
+            <div style="font-weight: bold; margin-bottom: 5px;">{day}</div>
+        '''
+        
+        if event_count > 0:
+            event_titles = [e['Title'] for _, e in day_events.head(2).iterrows()]
+            for title in event_titles[:2]:
+                calendar_html += f'<div style="font-size: 0.8rem; color: #666; margin: 2px 0;">• {title[:15]}{"..." if len(title) > 15 else ""}</div>'
+            
+            if event_count > 2:
+                calendar_html += f'<div style="font-size: 0.8rem; color: #666;">+{event_count - 2} more</div>'
+        
+        calendar_html += '</div>'
+    
+    calendar_html += '</div></div>'
+    
+    st.markdown(calendar_html, unsafe_allow_html=True)
+    
+    # Add new event
+    with st.expander("➕ Schedule New Event", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            event_title = st.text_input("Event Title")
+            event_type = st.selectbox("Event Type", event_types)
+            event_date = st.date_input("Event Date", value=date.today() + timedelta(days=7))
+        
+        with col2:
+            platform = st.selectbox("Platform", ['Website', 'LinkedIn', 'Email', 'All Platforms', 'Multiple'])
+            assigned_to = st.selectbox("Assigned To", ['Marketing Team', 'Content Team', 'External Agency', 'Rajesh', 'Priya'])
+            priority = st.selectbox("Priority", ['High', 'Medium', 'Low'])
+        
+        description = st.text_area("Description")
+        
+        if st.button("Schedule Event", type="primary"):
+            st.success(f"Event '{event_title}' scheduled for {event_date.strftime('%Y-%m-%d')}!")
+            st.info(f"Type: {event_type} | Platform: {platform} | Assigned to: {assigned_to}")
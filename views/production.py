@@ -0,0 +1,333 @@
+"""Production page: schedule, machine status, quality control and work orders"""
+
+import streamlit as st
+import pandas as pd
+from datetime import date, timedelta
+import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
+import random
+
+from analytics import MACHINES, get_production_schedule
+from ui import render_cards, render_tabs
+
+def production_page():
+    """Production management page"""
+    st.markdown('<h1 class="main-header">🏭 Production Management</h1>', unsafe_allow_html=True)
+    
+    render_tabs('production', {
+        "Production Schedule": production_schedule_tab,
+        "Machine Status": machine_status_tab,
+        "Quality Control": quality_control_tab,
+        "Work Orders": work_orders_tab
+    })
+
+# Bar colour of each work order status
+SCHEDULE_COLORS = {
+    'Scheduled': '#17a2b8',
+    'In Progress': '#ffc107',
+    'Completed': '#28a745',
+    'Delayed': '#dc3545'
+}
+
+# Bars are labelled and lanes named only while they stay readable
+GANTT_LABEL_ROWS = 60
+
+@st.fragment
+def production_schedule_tab():
+    """Production Schedule tab"""
+    st.markdown('<h2 class="section-header">Production Schedule</h2>', unsafe_allow_html=True)
+    
+    schedule = get_production_schedule()
+    if schedule.empty:
+        st.info("No work orders are scheduled")
+        return
+    
+    # The window is applied here, so only the work orders in it reach the browser
+    first_day, last_day = schedule['Start Date'].min().date(), schedule['End Date'].max().date()
+    window_start = min(max(date.today() - timedelta(days=7), first_day), last_day)
+    window_end = max(min(date.today() + timedelta(days=30), last_day), window_start)
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        window = st.date_input("Date Range", value=(window_start, window_end),
+                               min_value=first_day, max_value=last_day, key='schedule_window')
+    with col2:
+        machines = st.multiselect("Machines", MACHINES, placeholder="All machines", key='schedule_machines')
+    with col3:
+        lanes = st.radio("Rows", ['Work Order', 'Machine'], horizontal=True, key='schedule_lanes')
+    
+    # A range being picked has only its start date so far, and a cleared one none
+    if len(window) == 2:
+        start, end = window
+    elif len(window) == 1:
+        start, end = window[0], window[0]
+    else:
+        start, end = window_start, window_end
+    visible = (schedule['End Date'] >= pd.Timestamp(start)) & (schedule['Start Date'] <= pd.Timestamp(end))
+    if machines:
+        visible &= schedule['Machine'].isin(machines)
+    shown = schedule[visible]
+    st.caption(f"Showing {len(shown):,} of {len(schedule):,} work orders")
+    
+    st.dataframe(shown, use_container_width=True, hide_index=True, column_config={
+        'Start Date': st.column_config.DateColumn(format='YYYY-MM-DD'),
+        'End Date': st.column_config.DateColumn(format='YYYY-MM-DD'),
+    })
+    
+    # Gantt Chart Visualization
+    st.markdown('<h3 class="subsection-header">Production Timeline</h3>', unsafe_allow_html=True)
+    
+    if shown.empty:
+        st.info("No work orders in this window")
+        return
+    fig = gantt_chart(shown, lanes, 'Status', SCHEDULE_COLORS)
+    fig.update_layout(title="Production Schedule Gantt Chart", xaxis_range=[start, end + timedelta(days=1)])
+    st.plotly_chart(fig, use_container_width=True)
+
+def gantt_chart(tasks, lane, color, colors):
+    """Gantt chart of work orders as a single horizontal bar trace
+    
+    Each row of `tasks` is one bar from its Start Date to its End Date, in the
+    row named by its `lane` column and coloured by its `color` category, so
+    the figure size grows with the arrays rather than with a trace per bar.
+    The legend comes from empty traces, one per colour.
+    """
+    start = tasks['Start Date'].to_numpy()
+    duration = (tasks['End Date'].to_numpy() - start + np.timedelta64(1, 'D')) / np.timedelta64(1, 'ms')
+    labelled = len(tasks) <= GANTT_LABEL_ROWS
+    colorscale = [[(code + step) / len(colors), marker] for code, marker in enumerate(colors.values()) for step in (0, 1)]
+    # One ready-made hover label per bar serializes far faster than columns of customdata
+    hover = ('<b>' + tasks['Work Order'] + '</b>: ' + tasks['Product'] + ' x ' + tasks['Quantity'].astype(str) +
+             '<br>' + tasks['Start Date'].dt.strftime('%Y-%m-%d') + ' to ' + tasks['End Date'].dt.strftime('%Y-%m-%d') +
+             ' on ' + tasks['Machine'].astype(str) + '<br>' + tasks['Status'].astype(str) + ', ' +
+             tasks['Priority'] + ' priority')
+    
+    # add_bar hands the arrays to the figure without the deep copy go.Figure(go.Bar(...)) makes
+    fig = go.Figure()
+    fig.add_bar(
+        y=tasks[lane].to_numpy(object),
+        x=duration,
+        base=start,
+        orientation='h',
+        # Colours are picked by category code from a stepped colour scale, as
+        # plotly checks an array of colour names one element at a time
+        marker=dict(color=pd.Categorical(tasks[color], list(colors)).codes, colorscale=colorscale,
+                    cmin=-0.5, cmax=len(colors) - 0.5),
+        hovertext=hover.to_numpy(object),
+        hoverinfo='text',
+        text=tasks[color].to_numpy(object) if labelled else None,
+        textposition='inside',
+        showlegend=False
+    )
+    for name, marker in colors.items():
+        fig.add_trace(go.Bar(x=[None], y=[None], name=name, marker_color=marker, orientation='h'))
+    
+    n_lanes = tasks[lane].nunique()
+    fig.update_layout(
+        height=int(np.clip(n_lanes * 24 + 120, 300, 800)),
+        xaxis_type='date',
+        xaxis_title="Timeline",
+        yaxis_title=lane,
+        yaxis_autorange='reversed',
+        yaxis_showticklabels=n_lanes <= GANTT_LABEL_ROWS,
+        yaxis_type='category',
+        barmode='overlay',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+def machine_status_tab():
+    """Machine Status tab"""
+    st.markdown('<h2 class="section-header">Machine Status Monitor</h2>', unsafe_allow_html=True)
+    
+    # Machine status data
+    machines = [
+        {"name": "CNC Machine #1", "status": "Running", "utilization": 85, "maintenance": "15 days"},
+        {"name": "Laser Cutter #2", "status": "Idle", "utilization": 45, "maintenance": "3 days"},
+        {"name": "Press Brake #3", "status": "Maintenance", "utilization": 0, "maintenance": "Today"},
+        {"name": "Assembly Line #4", "status": "Running", "utilization": 92, "maintenance": "30 days"},
+        {"name": "Painting Booth #5", "status": "Running", "utilization": 78, "maintenance": "7 days"},
+        {"name": "Welding Station #6", "status": "Running", "utilization": 88, "maintenance": "21 days"},
+    ]
+    
+    status_colors = {
+        'Running': '#28a745',
+        'Idle': '#ffc107',
+        'Maintenance': '#dc3545'
+    }
+    machines = [dict(machine, status_color=status_colors.get(machine['status'], '#6c757d')) for machine in machines]
+    
+    render_cards(machines, '''
+        <div class="widget-card">
+            <h4>{name}</h4>
+            <div style="display: flex; align-items: center; gap: 10px; margin: 15px 0;">
+                <div style="width: 15px; height: 15px; border-radius: 50%; background-color: {status_color};"></div>
+                <span style="font-weight: 600; color: {status_color};">{status}</span>
+            </div>
+            <div style="margin: 10px 0;">
+                <div style="display: flex; justify-content: space-between;">
+                    <span>Utilization:</span>
+                    <span>{utilization}%</span>
+                </div>
+                <div class="progress-bar">
+                    <div class="progress-fill" style="width: {utilization}%"></div>
+                </div>
+            </div>
+            <div style="color: #666; font-size: 0.9rem;">
+                Next Maintenance: {maintenance}
+            </div>
+        </div>
+    ''', key='production_machines_page', columns=3)
+    
+    # Machine performance chart
+    st.markdown('<h3 class="subsection-header">Machine Performance Trends</h3>', unsafe_allow_html=True)
+    
+    performance_data = []
+    for day in range(30, 0, -1):
+        for machine in machines[:3]:
+            performance_data.append({
+                'Date': (date.today() - timedelta(days=day)).strftime('%Y-%m-%d'),
+                'Machine': machine['name'],
+                'Utilization': random.randint(60, 95),
+                'Output': random.randint(80, 120)
+            })
+    
+    perf_df = pd.DataFrame(performance_data)
+    
+    fig = px.line(
+        perf_df[perf_df['Machine'].isin(['CNC Machine #1', 'Laser Cutter #2', 'Press Brake #3'])],
+        x='Date',
+        y='Utilization',
+        color='Machine',
+        title='Machine Utilization Over Time'
+    )
+    
+    fig.update_layout(
+        height=400,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+
+def quality_control_tab():
+    """Quality Control tab"""
+    st.markdown('<h2 class="section-header">Quality Control Dashboard</h2>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Quality Yield", "97.8%", "0.5% ↑")
+    with col2:
+        st.metric("Defect Rate", "2.2%", "0.3% ↓")
+    with col3:
+        st.metric("Customer Returns", "0.8%", "0.1% ↓")
+    
+    # Quality metrics by product
+    st.markdown('<h3 class="subsection-header">Quality Metrics by Product Line</h3>', unsafe_allow_html=True)
+    
+    quality_data = []
+    for category, products in st.session_state.portal.products.items():
+        for product in products[:2]:  # Take first 2 products from each category
+            quality_data.append({
+                'Product': product['name'],
+                'Category': category,
+                'Defect Rate': random.uniform(0.5, 3.5),
+                'Yield': 100 - random.uniform(0.5, 3.5),
+                'Inspections': random.randint(50, 200)
+            })
+    
+    quality_df = pd.DataFrame(quality_data)
+    
+    fig = px.scatter(
+        quality_df,
+        x='Defect Rate',
+        y='Yield',
+        size='Inspections',
+        color='Category',
+        hover_name='Product',
+        title='Quality Performance by Product'
+    )
+    
+    fig.update_layout(
+        height=500,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+
+@st.fragment
+def work_orders_tab():
+    """Work Orders tab"""
+    st.markdown('<h2 class="section-header">Work Order Management</h2>', unsafe_allow_html=True)
+    
+    # Create new work order
+    with st.expander("➕ Create New Work Order", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            product = st.selectbox("Product", ["Mild Steel Worker Locker", "SS Industrial Duct", 
+                                             "Generator Control Panel", "Industrial Storage Rack"])
+            quantity = st.number_input("Quantity", min_value=1, value=10)
+            priority = st.selectbox("Priority", ["High", "Medium", "Low"])
+        
+        with col2:
+            start_date = st.date_input("Start Date", value=date.today())
+            due_date = st.date_input("Due Date", value=date.today() + timedelta(days=7))
+            assigned_to = st.selectbox("Assigned To", ["Production Team A", "Production Team B", 
+                                                      "CNC Operators", "Assembly Team"])
+        
+        notes = st.text_area("Special Instructions")
+        
+        if st.button("Create Work Order", type="primary"):
+            try:
+                work_order_id = st.session_state.portal.create('work_orders', [{
+                    'product': product,
+                    'quantity': quantity,
+                    'priority': priority,
+                    'start_date': start_date,
+                    'due_date': due_date,
+                    'assigned_to': assigned_to,
+                    'notes': notes,
+                    'status': 'Not Started',
+                    'created_at': pd.Timestamp.now()
+                }])
+            except OSError as error:
+                st.error(f"Could not save the work order: {error}")
+            else:
+                st.success(f"Work order {work_order_id} created successfully!")
+    
+    # Work order list
+    st.markdown('<h3 class="subsection-header">Active Work Orders</h3>', unsafe_allow_html=True)
+    
+    # Work orders created in the portal, newest first
+    recorded = st.session_state.portal.query('work_orders', order_by='created_at', descending=True)
+    work_orders = [{
+        'WO #': row['work_order_id'],
+        'Product': row['product'],
+        'Qty': row['quantity'],
+        'Status': row['status'],
+        'Progress': 0,
+        'Start Date': row['start_date'].strftime("%Y-%m-%d"),
+        'Due Date': row['due_date'].strftime("%Y-%m-%d"),
+        'Priority': row['priority']
+    } for row in recorded.to_dict('records')]
+    
+    # Sample work orders
+    for i in range(15):
+        work_orders.append({
+            'WO #': f"WO{2000 + i}",
+            'Product': random.choice(['Mild Steel Worker Locker', 'SS Industrial Duct', 
+                                    'Generator Control Panel', 'Industrial Storage Rack']),
+            'Qty': random.randint(5, 50),
+            'Status': random.choice(['Not Started', 'In Progress', 'Waiting Materials', 'QC Pending', 'Completed']),
+            'Progress': random.randint(0, 100),
+            'Start Date': (date.today() - timedelta(days=random.randint(0, 7))).strftime("%Y-%m-%d"),
+            'Due Date': (date.today() + timedelta(days=random.randint(1, 14))).strftime("%Y-%m-%d"),
+            'Priority': random.choice(['High', 'Medium', 'Low'])
+        })
+    
+    work_df = pd.DataFrame(work_orders)
+    st.dataframe(work_df, use_container_width=True)
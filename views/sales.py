@@ -0,0 +1,331 @@
+"""Sales & Orders page: pipeline, analytics, quotes and fulfillment"""
+
+import streamlit as st
+import pandas as pd
+from datetime import date, timedelta
+import plotly.express as px
+import plotly.graph_objects as go
+import random
+
+from ui import cached_chart, render_cards, render_tabs
+
+def sales_orders_page():
+    """Sales and orders management page"""
+    st.markdown('<h1 class="main-header">💰 Sales & Orders Management</h1>', unsafe_allow_html=True)
+    
+    render_tabs('sales', {
+        "Order Pipeline": order_pipeline_tab,
+        "Sales Analytics": sales_analytics_tab,
+        "Customer Quotes": customer_quotes_tab,
+        "Order Fulfillment": order_fulfillment_tab
+    })
+
+def order_pipeline_tab():
+    """Order Pipeline tab"""
+    st.markdown('<h2 class="section-header">Order Pipeline</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # Pipeline metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    order_totals = portal.totals('order_status')
+    status_counts = order_totals['count']
+    status_amounts = order_totals['total']
+    
+    with col1:
+        quotes = status_counts.get('Quote', 0)
+        st.metric("Quotes", quotes)
+    
+    with col2:
+        confirmed = status_counts.get('Confirmed', 0)
+        st.metric("Confirmed", confirmed)
+    
+    with col3:
+        production = status_counts.get('Production', 0)
+        st.metric("Production", production)
+    
+    with col4:
+        shipped = status_counts.get('Shipped', 0)
+        st.metric("Shipped", shipped)
+    
+    # Pipeline visualization
+    st.markdown('<h3 class="subsection-header">Sales Pipeline Visualization</h3>', unsafe_allow_html=True)
+    
+    # Create funnel chart
+    pipeline_stages = ['Quote', 'Confirmed', 'Production', 'QC', 'Ready for Shipment', 'Shipped', 'Delivered']
+    pipeline_counts = []
+    pipeline_values = []
+    
+    for stage in pipeline_stages:
+        pipeline_counts.append(status_counts.get(stage, 0))
+        pipeline_values.append(status_amounts.get(stage, 0))
+    
+    def pipeline_chart():
+        fig = go.Figure(go.Funnel(
+            y=pipeline_stages,
+            x=pipeline_counts,
+            textposition="inside",
+            textinfo="value+percent initial",
+            opacity=0.8,
+            marker={"color": ["#006400", "#228B22", "#90EE90", "#FF8C00", "#1E90FF", "#6f42c1", "#20c997"]}
+        ))
+        
+        fig.update_layout(
+            height=500,
+            title="Order Pipeline Funnel",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)'
+        )
+        return fig
+    
+    cached_chart('sales/pipeline', ['orders'], pipeline_chart, use_container_width=True)
+    
+    # Recent orders table
+    st.markdown('<h3 class="subsection-header">Recent Orders</h3>', unsafe_allow_html=True)
+    
+    recent_orders = portal.query('orders', order_by='order_date', descending=True, limit=10)
+    st.dataframe(recent_orders, use_container_width=True)
+
+def sales_analytics_tab():
+    """Sales Analytics tab"""
+    st.markdown('<h2 class="section-header">Sales Analytics</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # Sales metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        total_sales = portal.aggregate('orders', 'sum', 'amount') or 0
+        st.metric("Total Sales", f"₹{total_sales:,.0f}")
+    
+    with col2:
+        avg_order_value = portal.aggregate('orders', 'mean', 'amount')
+        st.metric("Average Order Value", f"₹{avg_order_value:,.0f}")
+    
+    with col3:
+        orders_count = portal.count('orders')
+        st.metric("Total Orders", orders_count)
+    
+    # Sales trend
+    st.markdown('<h3 class="subsection-header">Sales Trend Analysis</h3>', unsafe_allow_html=True)
+    
+    # Aggregate sales by month
+    monthly_sales = portal.totals('monthly_sales')['total'].rename_axis('month').rename('amount').reset_index()
+    
+    fig = px.line(
+        monthly_sales.tail(12),
+        x='month',
+        y='amount',
+        title='Monthly Sales Trend',
+        markers=True
+    )
+    
+    fig.update_layout(
+        height=400,
+        xaxis_title="Month",
+        yaxis_title="Sales Amount (₹)",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Sales by region
+    st.markdown('<h3 class="subsection-header">Sales by Region</h3>', unsafe_allow_html=True)
+    
+    # Merge per-customer order totals with customer region
+    sales_by_region = portal.aggregate('orders', 'sum', 'amount', by='customer_id').reset_index().merge(
+        portal.query('customers', columns=['customer_id', 'region']),
+        on='customer_id',
+        how='left'
+    )
+    
+    region_sales = sales_by_region.groupby('region', observed=True)['amount'].sum().reset_index()
+    
+    fig = px.bar(
+        region_sales.sort_values('amount', ascending=False),
+        x='region',
+        y='amount',
+        title='Sales by Region',
+        color='region'
+    )
+    
+    fig.update_layout(
+        height=400,
+        xaxis_title="Region",
+        yaxis_title="Sales Amount (₹)",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        showlegend=False
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+
+def order_fulfillment_tab():
+    """Order Fulfillment tab"""
+    st.markdown('<h2 class="section-header">Order Fulfillment</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # Fulfillment metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        on_time_orders = portal.count('orders', {'status': 'Delivered'})
+        total_delivered = portal.count('orders', {'status': ['Delivered', 'Shipped']})
+        on_time_rate = (on_time_orders / total_delivered * 100) if total_delivered > 0 else 0
+        st.metric("On-time Delivery", f"{on_time_rate:.1f}%")
+    
+    with col2:
+        pending_shipment = portal.count('orders', {'status': 'Ready for Shipment'})
+        st.metric("Ready for Shipment", pending_shipment)
+    
+    with col3:
+        in_production = portal.count('orders', {'status': 'Production'})
+        st.metric("In Production", in_production)
+    
+    # Orders requiring attention
+    st.markdown('<h3 class="subsection-header">Orders Requiring Attention</h3>', unsafe_allow_html=True)
+    
+    urgent_orders = portal.query(
+        'orders',
+        {'priority': 'High', 'status': ['Confirmed', 'Production', 'QC']},
+        order_by='order_date'
+    )
+    
+    if len(urgent_orders) > 0:
+        urgent_orders = urgent_orders.assign(
+            days_open=(pd.Timestamp(date.today()) - urgent_orders['order_date'].dt.normalize()).dt.days)
+        render_cards(urgent_orders, '''
+            <div style="padding: 15px; margin: 10px 0; border-radius: 10px; background: linear-gradient(135deg, #fff3cd 0%, #ffeaa7 100%); border-left: 4px solid #ffc107;">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <strong>{order_id}</strong> - {status}<br>
+                        <span style="color: #666; font-size: 0.9rem;">
+                            Customer: {customer_id} | Amount: ₹{amount:,.0f}
+                        </span>
+                    </div>
+                    <div style="text-align: right;">
+                        <span style="color: #dc3545; font-weight: 600;">Open for {days_open} days</span><br>
+                        <span style="color: #666; font-size: 0.9rem;">Priority: {priority}</span>
+                    </div>
+                </div>
+            </div>
+        ''', key='sales_urgent_orders_page', page_size=5)
+    else:
+        st.success("✅ No urgent orders requiring attention")
+    
+    # Shipment tracking
+    st.markdown('<h3 class="subsection-header">Shipment Tracking</h3>', unsafe_allow_html=True)
+    
+    shipments = portal.query('orders', {'status': ['Shipped', 'Ready for Shipment']})
+    
+    if len(shipments) > 0:
+        shipments = shipments.assign(
+            tracking_status=random.choices(['In Transit', 'At Hub', 'Out for Delivery', 'Delivered'], k=len(shipments)),
+            estimated_delivery=shipments['order_date'] + pd.to_timedelta(random.choices(range(1, 6), k=len(shipments)), unit='D'),
+            carrier=random.choices(['DTDC', 'Blue Dart', 'FedEx', 'Local'], k=len(shipments))
+        )
+        render_cards(shipments, '''
+            <div style="padding: 15px; margin: 10px 0; border-radius: 10px; background: #f8f9fa; border-left: 4px solid #17a2b8;">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <strong>{order_id}</strong><br>
+                        <span style="color: #666; font-size: 0.9rem;">
+                            To: {customer_id} | Status: {tracking_status}
+                        </span>
+                    </div>
+                    <div style="text-align: right;">
+                        <span style="color: #006400; font-weight: 600;">Est. Delivery: {estimated_delivery:%Y-%m-%d}</span><br>
+                        <span style="color: #666; font-size: 0.9rem;">Carrier: {carrier}</span>
+                    </div>
+                </div>
+            </div>
+        ''', key='sales_shipments_page', page_size=5)
+
+@st.fragment
+def customer_quotes_tab():
+    """Customer Quotes tab"""
+    st.markdown('<h2 class="section-header">Customer Quotes</h2>', unsafe_allow_html=True)
+    
+    portal = st.session_state.portal
+    
+    # Quote metrics
+    quotes = portal.query('orders', {'status': 'Quote'})
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        total_quotes = len(quotes)
+        st.metric("Active Quotes", total_quotes)
+    
+    with col2:
+        quote_value = quotes['amount'].sum()
+        st.metric("Total Quote Value", f"₹{quote_value:,.0f}")
+    
+    with col3:
+        avg_quote_value = quotes['amount'].mean() if len(quotes) > 0 else 0
+        st.metric("Average Quote Value", f"₹{avg_quote_value:,.0f}")
+    
+    # Create new quote
+    with st.expander("➕ Create New Quote", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            customer = st.selectbox("Customer", portal.customers['name'].tolist()[:20])
+            product_category = st.selectbox("Product Category", list(portal.products.keys()))
+        
+        with col2:
+            quantity = st.number_input("Quantity", min_value=1, value=1)
+            delivery_date = st.date_input("Delivery Date", value=date.today() + timedelta(days=14))
+        
+        # Get products for selected category
+        if product_category in portal.products:
+            product_options = [p['name'] for p in portal.products[product_category]]
+            product = st.selectbox("Product", product_options)
+            
+            # Find product price
+            product_price = next((p['price'] for p in portal.products[product_category] if p['name'] == product), 0)
+            total_price = product_price * quantity
+            
+            st.markdown(f"**Price per unit:** ₹{product_price:,.0f}")
+            st.markdown(f"**Total quote value:** ₹{total_price:,.0f}")
+        
+        notes = st.text_area("Quote Notes")
+        
+        if st.button("Generate Quote", type="primary"):
+            customer_row = portal.query('customers', {'name': customer}, columns=['customer_id', 'sales_rep'], limit=1).iloc[0]
+            try:
+                quote_id = portal.create('orders', [{
+                    'customer_id': customer_row['customer_id'],
+                    'order_date': pd.Timestamp(date.today()),
+                    'delivery_date': delivery_date,
+                    'status': 'Quote',
+                    'amount': total_price,
+                    'payment_status': 'Pending',
+                    'payment_terms': '50% Advance',
+                    'priority': 'Medium',
+                    'products': product,
+                    'quantity': quantity,
+                    'sales_rep': customer_row['sales_rep'],
+                    'notes': notes or 'Standard order'
+                }])
+            except OSError as error:
+                st.error(f"Could not save the quote: {error}")
+            else:
+                st.success(f"Quote {quote_id} generated successfully!")
+                st.info(f"Total value: ₹{total_price:,.0f}")
+    
+    # Quote list
+    st.markdown('<h3 class="subsection-header">Active Quotes</h3>', unsafe_allow_html=True)
+    
+    if len(quotes) > 0:
+        # Convert to DataFrame for display
+        quotes_display = quotes[['order_id', 'customer_id', 'order_date', 'amount', 'priority', 'sales_rep']].copy()
+        quotes_display['actions'] = "🔍 View | ✏️ Edit | ✅ Convert"
+        
+        st.dataframe(quotes_display, use_container_width=True)
+    else:
+        st.info("No active quotes at the moment")
@@ -0,0 +1,223 @@
+"""Settings page"""
+
+import streamlit as st
+
+from ui import render_tabs
+
+def settings_page():
+    """Settings and configuration page"""
+    st.markdown('<h1 class="main-header">⚙️ System Settings & Configuration</h1>', unsafe_allow_html=True)
+    
+    render_tabs('settings', {
+        "User Management": user_management_tab,
+        "System Configuration": system_configuration_tab,
+        "Data Management": data_management_tab,
+        "Integration": integration_tab
+    })
+
+@st.fragment
+def user_management_tab():
+    """User Management tab"""
+    st.markdown('<h2 class="section-header">User Management</h2>', unsafe_allow_html=True)
+    
+    # User list
+    users = [
+        {"name": "Rajesh Kumar", "role": "Plant Manager", "email": "rajesh@manufacturing.com", "status": "Active", "last_login": "2024-01-15"},
+        {"name": "Priya Sharma", "role": "Sales Manager", "email": "priya@manufacturing.com", "status": "Active", "last_login": "2024-01-14"},
+        {"name": "Amit Patel", "role": "Production Head", "email": "amit@manufacturing.com", "status": "Active", "last_login": "2024-01-15"},
+        {"name": "Neha Gupta", "role": "Inventory Manager", "email": "neha@manufacturing.com", "status": "Active", "last_login": "2024-01-13"},
+        {"name": "Vikram Singh", "role": "Quality Head", "email": "vikram@manufacturing.com", "status": "Inactive", "last_login": "2023-12-20"},
+        {"name": "Suresh Reddy", "role": "Finance Manager", "email": "suresh@manufacturing.com", "status": "Active", "last_login": "2024-01-14"}
+    ]
+    
+    # Display users
+    for user in users:
+        col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+        
+        with col1:
+            st.write(f"**{user['name']}**")
+            st.caption(user['email'])
+        
+        with col2:
+            st.write(user['role'])
+        
+        with col3:
+            status_color = "green" if user['status'] == "Active" else "gray"
+            st.write(f":{status_color}[{user['status']}]")
+            st.caption(f"Last login: {user['last_login']}")
+        
+        with col4:
+            st.button("Edit", key=f"edit_{user['name']}", use_container_width=True)
+    
+    # Add new user
+    with st.expander("➕ Add New User", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            new_name = st.text_input("Full Name")
+            new_email = st.text_input("Email")
+            new_role = st.selectbox("Role", ["Plant Manager", "Sales Manager", "Production Head", 
+                                           "Inventory Manager", "Quality Head", "Finance Manager", "Operator"])
+        
+        with col2:
+            new_department = st.selectbox("Department", ["Production", "Sales", "Inventory", 
+                                                       "Quality", "Finance", "Maintenance"])
+            access_level = st.selectbox("Access Level", ["Admin", "Manager", "Supervisor", "Operator"])
+            status = st.selectbox("Status", ["Active", "Inactive"])
+        
+        if st.button("Add User", type="primary"):
+            st.success(f"User {new_name} added successfully!")
+
+@st.fragment
+def system_configuration_tab():
+    """System Configuration tab"""
+    st.markdown('<h2 class="section-header">System Configuration</h2>', unsafe_allow_html=True)
+    
+    # General settings
+    st.markdown('<h3 class="subsection-header">General Settings</h3>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        company_name = st.text_input("Company Name", "Manufacturing Solutions Pvt Ltd")
+        currency = st.selectbox("Currency", ["INR (₹)", "USD ($)", "EUR (€)", "GBP (£)"])
+        timezone = st.selectbox("Timezone", ["IST (UTC+5:30)", "GMT (UTC+0)", "EST (UTC-5)", "PST (UTC-8)"])
+    
+    with col2:
+        date_format = st.selectbox("Date Format", ["YYYY-MM-DD", "DD-MM-YYYY", "MM/DD/YYYY"])
+        language = st.selectbox("Language", ["English", "Hindi", "Tamil", "Telugu"])
+        theme = st.selectbox("Theme", ["Light", "Dark", "Green (Current)"])
+    
+    # Notification settings
+    st.markdown('<h3 class="subsection-header">Notification Settings</h3>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        email_notifications = st.checkbox("Email Notifications", True)
+        low_stock_alerts = st.checkbox("Low Stock Alerts", True)
+        order_updates = st.checkbox("Order Status Updates", True)
+    
+    with col2:
+        maintenance_alerts = st.checkbox("Maintenance Alerts", True)
+        quality_alerts = st.checkbox("Quality Alerts", True)
+        shipment_alerts = st.checkbox("Shipment Alerts", True)
+    
+    with col3:
+        daily_reports = st.checkbox("Daily Reports", True)
+        weekly_summary = st.checkbox("Weekly Summary", True)
+        monthly_review = st.checkbox("Monthly Review", True)
+    
+    # Save settings
+    if st.button("Save Configuration", type="primary"):
+        st.success("Configuration saved successfully!")
+
+@st.fragment
+def data_management_tab():
+    """Data Management tab"""
+    st.markdown('<h2 class="section-header">Data Management</h2>', unsafe_allow_html=True)
+    
+    # Data backup
+    st.markdown('<h3 class="subsection-header">Data Backup & Restore</h3>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Database Size", "245 MB")
+        st.metric("Last Backup", "Today, 02:00 AM")
+        st.metric("Backup Frequency", "Daily")
+    
+    with col2:
+        if st.button("📥 Backup Now", use_container_width=True):
+            st.success("Backup initiated successfully!")
+        
+        if st.button("📤 Restore Backup", use_container_width=True):
+            st.info("Select backup file to restore")
+    
+    with col3:
+        backup_location = st.selectbox("Backup Location", ["Local Server", "Cloud Storage", "Both"])
+        retention_days = st.slider("Retention Period (days)", 7, 365, 30)
+    
+    # Data export
+    st.markdown('<h3 class="subsection-header">Data Export</h3>', unsafe_allow_html=True)
+    
+    export_options = st.multiselect(
+        "Select data to export",
+        ["Customers", "Orders", "Inventory", "Suppliers", "Leads", "Financial Data", "Production Data"],
+        default=["Customers", "Orders"]
+    )
+    
+    export_format = st.radio("Export Format", ["CSV", "Excel", "JSON", "PDF"])
+    
+    if st.button("Export Data", type="primary"):
+        st.success(f"Exporting {len(export_options)} datasets as {export_format}...")
+        st.info("Your download will begin shortly")
+    
+    # Data cleanup
+    st.markdown('<h3 class="subsection-header">Data Cleanup</h3>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        delete_old_leads = st.checkbox("Delete leads older than 365 days")
+        archive_old_orders = st.checkbox("Archive completed orders older than 180 days")
+    
+    with col2:
+        if delete_old_leads or archive_old_orders:
+            st.warning("⚠️ This action cannot be undone!")
+            if st.button("Execute Cleanup", type="secondary"):
+                st.success("Data cleanup completed successfully!")
+
+@st.fragment
+def integration_tab():
+    """Integration tab"""
+    st.markdown('<h2 class="section-header">System Integration</h2>', unsafe_allow_html=True)
+    
+    # Available integrations
+    integrations = [
+        {"name": "Accounting Software", "status": "Connected", "provider": "Tally/QuickBooks"},
+        {"name": "CRM System", "status": "Connected", "provider": "Salesforce"},
+        {"name": "ERP System", "status": "Pending", "provider": "SAP"},
+        {"name": "E-commerce Platform", "status": "Connected", "provider": "Shopify"},
+        {"name": "Payment Gateway", "status": "Connected", "provider": "Razorpay"},
+        {"name": "Shipping Partners", "status": "Connected", "provider": "DTDC/Blue Dart"}
+    ]
+    
+    # Display integrations
+    for integration in integrations:
+        col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+        
+        with col1:
+            st.write(f"**{integration['name']}**")
+            st.caption(integration['provider'])
+        
+        with col2:
+            status_color = "green" if integration['status'] == "Connected" else "orange"
+            st.write(f":{status_color}[{integration['status']}]")
+        
+        with col3:
+            if integration['status'] == "Connected":
+                st.button("Sync Now", key=f"sync_{integration['name']}", use_container_width=True)
+            else:
+                st.button("Connect", key=f"connect_{integration['name']}", use_container_width=True)
+        
+        with col4:
+            st.button("Configure", key=f"config_{integration['name']}", use_container_width=True)
+    
+    # API Settings
+    st.markdown('<h3 class="subsection-header">API Configuration</h3>', unsafe_allow_html=True)
+    
+    api_key = st.text_input("API Key", type="password", value="••••••••••••••••••••••••••••••")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        api_rate_limit = st.number_input("API Rate Limit (requests/minute)", min_value=10, max_value=1000, value=100)
+        webhook_url = st.text_input("Webhook URL")
+    
+    with col2:
+        if st.button("Generate New API Key", use_container_width=True):
+            st.success("New API key generated!")
+        
+        if st.button("Test Webhook", use_container_width=True):
+            st.success("Webhook test successful!")